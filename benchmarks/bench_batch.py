@@ -0,0 +1,55 @@
+"""
+多数のIKatsuyoTextSourceに同じAppendantをaddする場合の速度比較
+
+$ poetry run python benchmarks/bench_batch.py
+"""
+import time
+from typing import List
+
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import KatsuyoText
+from katsuyo_text.katsuyo_text_batch import KatsuyoTextBatch
+from katsuyo_text.katsuyo_text_helper import Hitei, KakoKanryo, DanteiTeinei
+
+NUMBER = 1_000_000
+
+KATSUYOS: List[k.IKatsuyo] = [
+    k.GODAN_KA_GYO,
+    k.GODAN_RA_GYO,
+    k.KAMI_ICHIDAN,
+    k.SHIMO_ICHIDAN,
+    k.KEIYOUSHI,
+    k.KEIYOUDOUSHI,
+]
+SOURCES = [
+    KatsuyoText(gokan=f"語幹{i}", katsuyo=KATSUYOS[i % len(KATSUYOS)])
+    for i in range(NUMBER)
+]
+APPENDANTS = [Hitei(), KakoKanryo(), DanteiTeinei()]
+
+
+def add_each():
+    result = []
+    for src in SOURCES:
+        for post in APPENDANTS:
+            src = src + post
+        result.append(str(src))
+    return result
+
+
+def add_batch():
+    batch = KatsuyoTextBatch.from_sources(SOURCES)
+    for post in APPENDANTS:
+        batch = batch + post
+    return batch.to_list()
+
+
+def main() -> None:
+    for func in [add_each, add_batch]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<12}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
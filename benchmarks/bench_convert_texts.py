@@ -0,0 +1,41 @@
+"""
+1文ずつnlpで解析して変換する場合と、convert_textsでまとめて変換する場合の速度比較
+
+$ poetry run python benchmarks/bench_convert_texts.py
+"""
+import time
+
+import spacy
+
+from katsuyo_text.katsuyo_text_helper import Teinei
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました",
+    "公園へ行かれますか",
+    "公園で遊びまして",
+    "すみません",
+    "彼は公園で走っていました",
+] * 400
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    converter = SpacySentenceConverter({Teinei(): None})
+
+    def convert_each():
+        return [converter.convert(next(nlp(text).sents)) for text in TEXTS]
+
+    def convert_texts():
+        return [text for text, _ in converter.convert_texts(TEXTS, nlp)]
+
+    for func in [convert_each, convert_texts]:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        throughput = len(TEXTS) / elapsed
+        print(f"{func.__name__:<16}{elapsed:>8.3f}s{throughput:>10.1f} texts/s")
+
+
+if __name__ == "__main__":
+    main()
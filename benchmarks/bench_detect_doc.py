@@ -0,0 +1,54 @@
+"""
+数万トークンのDocに対する、トークンごとの検出とdetect_docの速度比較
+
+$ poetry run python benchmarks/bench_detect_doc.py
+"""
+import time
+import warnings
+
+import spacy
+from spacy.tokens import Doc
+
+from katsuyo_text.spacy_katsuyo_text_detector import (
+    SpacyKatsuyoTextSourceDetector,
+    ALL_APPENDANTS_DETECTOR,
+)
+
+TEXTS = [
+    "雨が降りそうだ。",
+    "雨が降るそうだ。",
+    "彼は静かそうだった。",
+    "猫が歩かなかったです。",
+    "田中さんばかり走らせられたかしら。",
+]
+REPEAT = 2_000
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    # Doc.from_docsで結合できないuser_dataの警告は無視する
+    warnings.filterwarnings("ignore", message=r"\[W102\]")
+    doc = Doc.from_docs(list(nlp.pipe(TEXTS)) * REPEAT)
+    print(f"tokens: {len(doc)}")
+
+    src_detector = SpacyKatsuyoTextSourceDetector()
+    apd_detector = ALL_APPENDANTS_DETECTOR
+
+    def detect_each():
+        return [src_detector.try_detect(t) for t in doc], [
+            apd_detector.try_detect(t) for t in doc
+        ]
+
+    def detect_doc():
+        return src_detector.detect_doc(doc), apd_detector.detect_doc(doc)
+
+    # キャッシュを温めてから計測する
+    assert detect_each() == detect_doc()
+    for func in [detect_each, detect_doc]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<12}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+convertions_dictを変えて変換し直す際の、
+テキストから解析し直す場合と保存済みのDocBinを用いる場合の速度比較
+
+$ poetry run python benchmarks/bench_docbin.py
+"""
+import tempfile
+import time
+from typing import Dict, Optional
+
+import spacy
+
+from katsuyo_text.katsuyo_text import IKatsuyoTextAppendant
+from katsuyo_text.katsuyo_text_helper import (
+    IJodoushiHelper,
+    Dantei,
+    DanteiTeinei,
+    Teinei,
+)
+from katsuyo_text.spacy_doc_archive import list_shards, save_docs
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました。",
+    "公園へ行かれますか。",
+    "公園で遊びまして、家に帰りました。",
+    "すみません。",
+    "彼は公園で走っていました。",
+    "この花は綺麗です。",
+]
+REPEAT = 200
+CONVERTIONS_DICT: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]] = {
+    Teinei(): None,
+    DanteiTeinei(): Dantei(),
+}
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    texts = TEXTS * REPEAT
+    converter = SpacySentenceConverter(CONVERTIONS_DICT)
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        save_docs(nlp.pipe(texts), directory)
+        print(f"{'save_docs':<16}{time.perf_counter() - start:>8.3f}s")
+
+        def convert_texts():
+            return list(converter.convert_texts(texts, nlp))
+
+        def convert_docbins():
+            return list(converter.convert_docbins(list_shards(directory), nlp.vocab))
+
+        assert convert_texts() == convert_docbins()
+        for func in [convert_texts, convert_docbins]:
+            start = time.perf_counter()
+            func()
+            print(f"{func.__name__:<16}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
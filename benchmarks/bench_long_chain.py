@@ -0,0 +1,64 @@
+"""
+長い語幹に多数のAppendantをaddする場合の速度比較
+
+$ poetry run python benchmarks/bench_long_chain.py
+"""
+import timeit
+from typing import List
+
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    SUFFIX_TABLE,
+    IKatsuyoTextAppendant,
+    IKatsuyoTextSource,
+    KatsuyoText,
+    TaigenText,
+    KAKUJOSHI_NO,
+    KEIJOSHI_MO,
+    JODOUSHI_DESU,
+)
+from katsuyo_text.katsuyo_text_helper import Shieki, Ukemi, Hitei, KakoKanryo
+
+REPEAT = 5
+
+
+def bench(stmt, number: int) -> float:
+    # 1回あたりのマイクロ秒
+    return min(timeit.repeat(stmt, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def add_sequentially(pre, posts):
+    result = pre
+    for post in posts:
+        result = result + post
+    return result
+
+
+def main() -> None:
+    print(f"{'prefix':>8}{'chain':>8}{'sequential[us]':>16}{'add_all[us]':>14}")
+    for prefix_len in [10, 1_000, 100_000]:
+        for chain_len in [4, 32, 256]:
+            pre: IKatsuyoTextSource = TaigenText("名" * prefix_len)
+            posts: List[IKatsuyoTextAppendant] = [KAKUJOSHI_NO] * (chain_len - 2) + [
+                KEIJOSHI_MO,
+                JODOUSHI_DESU,
+            ]
+            assert add_sequentially(pre, posts) == SUFFIX_TABLE.add_all(pre, posts)
+
+            number = max(1, 20_000 // chain_len)
+            sequential_us = bench(lambda: add_sequentially(pre, posts), number)
+            add_all_us = bench(lambda: SUFFIX_TABLE.add_all(pre, posts), number)
+            print(
+                f"{prefix_len:>8}{chain_len:>8}{sequential_us:>16.2f}{add_all_us:>14.2f}"
+            )
+
+    # 用言に助動詞を連ねる場合
+    pre = KatsuyoText(gokan="行" * 100_000, katsuyo=k.GODAN_IKU)
+    posts = [Shieki(), Ukemi(), Hitei(), KakoKanryo()]
+    sequential_us = bench(lambda: add_sequentially(pre, posts), 2_000)
+    add_all_us = bench(lambda: SUFFIX_TABLE.add_all(pre, posts), 2_000)
+    print(f"{'verb':>8}{len(posts):>8}{sequential_us:>16.2f}{add_all_us:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
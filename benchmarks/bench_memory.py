@@ -0,0 +1,47 @@
+"""
+IKatsuyoTextSource 1インスタンスあたりのメモリ使用量
+
+$ poetry run python benchmarks/bench_memory.py
+"""
+import tracemalloc
+
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    FixedKatsuyoText,
+    TaigenText,
+)
+
+NUMBER = 1_000_000
+
+# gokanの文字列を共有させ、インスタンス自体のサイズを計測する
+GOKAN = "行"
+FACTORIES = {
+    "KatsuyoText": lambda: KatsuyoText(gokan=GOKAN, katsuyo=k.GODAN_IKU),
+    "FixedKatsuyoText": lambda: FixedKatsuyoText(
+        gokan=GOKAN, katsuyo=k.FixedKatsuyo("か")
+    ),
+    "TaigenText": lambda: TaigenText(gokan=GOKAN),
+}
+
+
+def bytes_per_instance(factory) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(NUMBER)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # リスト自体のポインタ分は除く
+    result = (after - before) / NUMBER - 8
+    del instances
+    return result
+
+
+def main() -> None:
+    print(f"{'class':<20}{'bytes':>10}")
+    for name, factory in FACTORIES.items():
+        print(f"{name:<20}{bytes_per_instance(factory):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
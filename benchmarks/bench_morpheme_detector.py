@@ -0,0 +1,63 @@
+"""
+ja_ginzaによる解析とsudachipyの形態素から直接検出する場合の速度比較
+
+$ poetry run python benchmarks/bench_morpheme_detector.py
+"""
+import time
+
+import spacy
+from sudachipy import dictionary, tokenizer  # type: ignore[import]
+
+from katsuyo_text.spacy_katsuyo_text_detector import (
+    SpacyKatsuyoTextSourceDetector,
+    ALL_APPENDANTS_DETECTOR,
+)
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    MorphemeKatsuyoTextSourceDetector,
+    MorphemeKatsuyoTextAppendantDetector,
+    records_from_sudachi,
+)
+
+TEXTS = [
+    "雨が降りそうだ。",
+    "雨が降るそうだ。",
+    "彼は静かそうだった。",
+    "猫が歩かなかったです。",
+    "田中さんばかり走らせられたかしら。",
+] * 200
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    sudachi = dictionary.Dictionary(dict="core").create()
+    mode = tokenizer.Tokenizer.SplitMode.C
+
+    spacy_src_detector = SpacyKatsuyoTextSourceDetector()
+    spacy_apd_detector = ALL_APPENDANTS_DETECTOR
+    src_detector = MorphemeKatsuyoTextSourceDetector()
+    apd_detector = MorphemeKatsuyoTextAppendantDetector(
+        helpers=set(spacy_apd_detector.helpers_dict.values()),
+        fukujoshis=set(spacy_apd_detector.fukujoshis_dict.values()),
+        setsuzokujoshis=set(spacy_apd_detector.setsuzokujoshis_dict.values()),
+        shujoshis=set(spacy_apd_detector.shujoshis_dict.values()),
+    )
+
+    def detect_ginza():
+        for doc in nlp.pipe(TEXTS):
+            spacy_src_detector.try_detect(doc[0])
+            spacy_apd_detector.detect_from_sent(doc[:], doc[0])
+
+    def detect_sudachi():
+        for text in TEXTS:
+            records = records_from_sudachi(sudachi.tokenize(text, mode))
+            src_detector.try_detect(records[0])
+            apd_detector.detect_from_sent(records, 0)
+
+    for func in [detect_ginza, detect_sudachi]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<16}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
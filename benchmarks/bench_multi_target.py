@@ -0,0 +1,64 @@
+"""
+複数のconvertions_dictへの変換について、
+convertions_dictごとに変換する場合と解析結果を共有する場合の速度比較
+(NLPの解析時間を含まない)
+
+$ poetry run python benchmarks/bench_multi_target.py
+"""
+import time
+from typing import Dict, List, Optional
+
+import spacy
+
+from katsuyo_text.katsuyo_text import IKatsuyoTextAppendant
+from katsuyo_text.katsuyo_text_helper import (
+    IJodoushiHelper,
+    Dantei,
+    DanteiTeinei,
+    Teinei,
+)
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました。",
+    "公園へ行かれますか。",
+    "公園で遊びまして、家に帰りました。",
+    "すみません。",
+    "彼は公園で走っていました。",
+    "この花は綺麗です。",
+]
+REPEAT = 2_000
+CONVERTIONS_DICTS: List[Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]]] = [
+    {Teinei(): None, DanteiTeinei(): Dantei()},
+    {Teinei(): Dantei()},
+    {DanteiTeinei(): None},
+]
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    docs = list(nlp.pipe(TEXTS)) * REPEAT
+
+    converters = [
+        SpacySentenceConverter(convertions_dict)
+        for convertions_dict in CONVERTIONS_DICTS
+    ]
+
+    def convert_each():
+        return [
+            [converter.try_convert_doc(doc) for converter in converters] for doc in docs
+        ]
+
+    def convert_many():
+        converter = converters[0]
+        return [converter.try_convert_doc_many(doc, CONVERTIONS_DICTS) for doc in docs]
+
+    assert convert_each() == convert_many()
+    for func in [convert_each, convert_many]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<16}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+同じtextを繰り返し含む入力について、
+ParseCacheと変換結果のキャッシュの有無による速度比較
+
+$ poetry run python benchmarks/bench_parse_cache.py
+"""
+import tempfile
+import time
+from pathlib import Path
+
+import spacy
+
+from katsuyo_text.katsuyo_text_helper import Dantei, DanteiTeinei, Teinei
+from katsuyo_text.spacy_parse_cache import ParseCache
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました。",
+    "公園へ行かれますか。",
+    "公園で遊びまして、家に帰りました。",
+    "すみません。",
+    "彼は公園で走っていました。",
+    "この花は綺麗です。",
+]
+REPEAT = 200
+CONVERTIONS_DICT = {Teinei(): None, DanteiTeinei(): Dantei()}
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    texts = TEXTS * REPEAT
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(Path(directory) / "cache.sqlite3", nlp)
+        # 保存済みの解析結果を参照する場合を比較するため、事前に保存する
+        list(cache.pipe(TEXTS))
+
+        def convert_texts():
+            converter = SpacySentenceConverter(CONVERTIONS_DICT)
+            return list(converter.convert_texts(texts, nlp))
+
+        def parse_cache():
+            converter = SpacySentenceConverter(CONVERTIONS_DICT)
+            return list(converter.convert_texts(texts, cache))
+
+        def result_cache():
+            converter = SpacySentenceConverter(
+                CONVERTIONS_DICT, result_cache_maxsize=1000
+            )
+            return list(converter.convert_texts(texts, cache))
+
+        expected = convert_texts()
+        for func in [convert_texts, parse_cache, result_cache]:
+            start = time.perf_counter()
+            assert func() == expected
+            print(f"{func.__name__:<16}{time.perf_counter() - start:>8.3f}s")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+変換対象を含まない文章が多い場合の、表層形による事前判定の効果
+
+$ poetry run python benchmarks/bench_prefilter.py
+"""
+import time
+
+import spacy
+
+from katsuyo_text.katsuyo_text_helper import Teinei, DanteiTeinei, Dantei
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "猫が歩く。",
+    "公園へ行きました。",
+    "彼は走っていた。",
+    "雨が降りそうだ。",
+    "明日は晴れるらしい。",
+] * 400
+CONVERTIONS_DICT = {Teinei(): None, DanteiTeinei(): Dantei()}
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+
+    def convert_all():
+        converter = SpacySentenceConverter(CONVERTIONS_DICT)
+        # 常に解析する
+        converter.trigger_pattern = None
+        return [text for text, _ in converter.convert_texts(TEXTS, nlp)]
+
+    def convert_prefiltered():
+        converter = SpacySentenceConverter(CONVERTIONS_DICT)
+        result = [text for text, _ in converter.convert_texts(TEXTS, nlp)]
+        print(f"parsed: {converter.parsed} skipped: {converter.skipped}")
+        return result
+
+    assert convert_all() == convert_prefiltered()
+    for func in [convert_all, convert_prefiltered]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<20}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+解析済みのトークンに対する変換のみの速度比較(NLPの解析時間を含まない)
+
+$ poetry run python benchmarks/bench_sentence_converter.py
+"""
+import time
+from typing import Dict, Optional
+
+import spacy
+from sudachipy import dictionary, tokenizer  # type: ignore[import]
+
+from katsuyo_text.katsuyo_text import IKatsuyoTextAppendant
+from katsuyo_text.katsuyo_text_helper import IJodoushiHelper, Teinei, Dantei
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    records_from_sudachi,
+    with_pos,
+)
+from katsuyo_text.morpheme_sentence_converter import MorphemeSentenceConverter
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました",
+    "公園へ行かれますか",
+    "公園で遊びまして",
+    "すみません",
+    "彼は公園で走っていました",
+]
+REPEAT = 2_000
+CONVERTIONS_DICT: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]] = {
+    Teinei(): Dantei()
+}
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    sudachi = dictionary.Dictionary(dict="core").create()
+    mode = tokenizer.Tokenizer.SplitMode.C
+
+    sents = [next(doc.sents) for doc in nlp.pipe(TEXTS)] * REPEAT
+    # pos_を解決済みのレコードを解析結果のキャッシュとして扱う
+    records = [
+        with_pos(records_from_sudachi(sudachi.tokenize(text, mode))) for text in TEXTS
+    ]
+    records = records * REPEAT
+
+    spacy_converter = SpacySentenceConverter(CONVERTIONS_DICT)
+    morpheme_converter = MorphemeSentenceConverter(CONVERTIONS_DICT)
+
+    def convert_spans():
+        return [spacy_converter.try_convert(sent)[0] for sent in sents]
+
+    def convert_records():
+        return [morpheme_converter.try_convert(sent)[0] for sent in records]
+
+    assert convert_spans() == convert_records()
+    for func in [convert_spans, convert_records]:
+        start = time.perf_counter()
+        func()
+        print(f"{func.__name__:<16}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
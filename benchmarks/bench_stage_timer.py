@@ -0,0 +1,59 @@
+"""
+SpacySentenceConverterの処理時間の段階ごとの内訳と、
+timedで計測しない場合・計測する場合の速度比較(NLPの解析時間を含まない)
+
+$ poetry run python benchmarks/bench_stage_timer.py
+"""
+import time
+from typing import Dict, Optional
+
+import spacy
+
+from katsuyo_text.katsuyo_text import IKatsuyoTextAppendant
+from katsuyo_text.katsuyo_text_helper import (
+    IJodoushiHelper,
+    Dantei,
+    DanteiTeinei,
+    Teinei,
+)
+from katsuyo_text.spacy_sentence_converter import SpacySentenceConverter
+
+TEXTS = [
+    "公園へ行きました。",
+    "公園へ行かれますか。",
+    "公園で遊びまして、家に帰りました。",
+    "すみません。",
+    "彼は公園で走っていました。",
+    "この花は綺麗です。",
+]
+REPEAT = 2_000
+CONVERTIONS_DICT: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]] = {
+    Teinei(): None,
+    DanteiTeinei(): Dantei(),
+}
+
+
+def main() -> None:
+    nlp = spacy.load("ja_ginza")
+    docs = list(nlp.pipe(TEXTS)) * REPEAT
+    converter = SpacySentenceConverter(CONVERTIONS_DICT)
+
+    def convert():
+        return [converter.try_convert_doc(doc) for doc in docs]
+
+    convert()
+    start = time.perf_counter()
+    convert()
+    print(f"{'disabled':<16}{time.perf_counter() - start:>8.3f}s")
+
+    with converter.timed() as timer:
+        start = time.perf_counter()
+        convert()
+        print(f"{'enabled':<16}{time.perf_counter() - start:>8.3f}s")
+
+    for stage, stats in timer.snapshot().items():
+        print(f"  {stage:<18}{stats.ns / 1e9:>8.3f}s{stats.calls:>10}")
+
+
+if __name__ == "__main__":
+    main()
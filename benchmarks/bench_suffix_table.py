@@ -0,0 +1,67 @@
+"""
+IKatsuyoTextSource + IKatsuyoTextAppendant の速度比較
+
+$ poetry run python benchmarks/bench_suffix_table.py
+"""
+import timeit
+from typing import List
+
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    SUFFIX_TABLE,
+    IKatsuyoTextAppendant,
+    IKatsuyoTextSource,
+    KatsuyoText,
+    TaigenText,
+    JODOUSHI_NAI,
+    JODOUSHI_TA,
+    JODOUSHI_MASU,
+    KAKUJOSHI_GA,
+    SETSUZOKUJOSHI_TE,
+)
+from katsuyo_text.katsuyo_text_helper import Hitei, KakoKanryo, DanteiTeinei
+
+NUMBER = 100_000
+REPEAT = 5
+
+SOURCES: List[IKatsuyoTextSource] = [
+    KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU),
+    KatsuyoText(gokan="見", katsuyo=k.KAMI_ICHIDAN),
+    KatsuyoText(gokan="美し", katsuyo=k.KEIYOUSHI),
+    KatsuyoText(gokan="綺麗", katsuyo=k.KEIYOUDOUSHI),
+    TaigenText(gokan="大丈夫"),
+]
+APPENDANTS: List[IKatsuyoTextAppendant] = [
+    JODOUSHI_NAI,
+    JODOUSHI_TA,
+    JODOUSHI_MASU,
+    KAKUJOSHI_GA,
+    SETSUZOKUJOSHI_TE,
+    Hitei(),
+    KakoKanryo(),
+    DanteiTeinei(),
+]
+
+
+def bench(stmt) -> float:
+    # 1回あたりのマイクロ秒
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    SUFFIX_TABLE.compile(SOURCES, APPENDANTS)
+    print(f"{'source':<8}{'appendant':<20}{'merge[us]':>12}{'add[us]':>12}")
+    for src in SOURCES:
+        for post in APPENDANTS:
+            try:
+                post.merge(src)
+            except ValueError:
+                continue
+            merge_us = bench(lambda: post.merge(src))
+            add_us = bench(lambda: src + post)
+            name = type(post).__name__
+            print(f"{str(src):<8}{name:<20}{merge_us:>12.3f}{add_us:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
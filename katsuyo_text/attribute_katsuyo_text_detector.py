@@ -0,0 +1,584 @@
+from typing import Dict, Optional, Tuple
+from enum import IntEnum
+from functools import lru_cache
+from katsuyo_text.katsuyo import (
+    GODAN_BA_GYO,
+    GODAN_GA_GYO,
+    GODAN_IKU,
+    GODAN_KA_GYO,
+    GODAN_MA_GYO,
+    GODAN_NA_GYO,
+    GODAN_RA_GYO,
+    GODAN_SA_GYO,
+    GODAN_TA_GYO,
+    GODAN_WAA_GYO,
+    KAMI_ICHIDAN,
+    KEIYOUSHI,
+    SA_GYO_HENKAKU_SURU,
+    SA_GYO_HENKAKU_ZURU,
+    SHIMO_ICHIDAN,
+)
+from katsuyo_text.katsuyo_text import (
+    KatsuyoTextErrorMessage,
+    IKatsuyoTextAppendant,
+    IKatsuyoTextSource,
+    InternPool,
+    KatsuyoText,
+    TaigenText,
+    FukushiText,
+    SettoText,
+    KandoushiText,
+    SetsuzokuText,
+    KigoText,
+    KakujoshiText,
+    KeijoshiText,
+    FukujoshiText,
+    SetsuzokujoshiText,
+    ShujoshiText,
+    JuntaijoshiText,
+    KURU,
+    KURU_KANJI,
+    JODOUSHI_RERU,
+    JODOUSHI_RARERU,
+    JODOUSHI_NAI,
+    JODOUSHI_TAI,
+    JODOUSHI_TA,
+    JODOUSHI_DA_DANTEI,
+    JODOUSHI_DA_KAKO_KANRYO,
+    JODOUSHI_RASHII,
+    JODOUSHI_BEKIDA,
+    JODOUSHI_DESU,
+    JODOUSHI_MASU,
+)
+import katsuyo_text.metrics as m
+from katsuyo_text.katsuyo_text_helper import (
+    Denbun,
+    HikyoReizi,
+    Hitei,
+    KakoKanryo,
+    Keizoku,
+    KibouSelf,
+    Shieki,
+    Suitei,
+    Touzen,
+    Ukemi,
+    KibouOthers,
+    Youtai,
+    Dantei,
+    DanteiTeinei,
+    Teinei,
+    TeDe,
+    TatteDatte,
+)
+from katsuyo_text.katsuyo_text_detector import (
+    IKatsuyoTextSourceDetector,
+    IKatsuyoTextAppendantDetector,
+)
+import re
+import warnings
+
+
+class TagCategory(IntEnum):
+    """
+    IKatsuyoTextSourceの検出に用いるtag_の分類
+    """
+
+    DOUSHI = 0
+    JODOUSHI = 1
+    KEIYOUSHI = 2
+    MEISHI = 3
+    FUKUSHI = 4
+    SETTOU = 5
+    KANDOUSHI = 6
+    SETSUZOKU = 7
+    KIGO = 8
+    KAKUJOSHI = 9
+    KEIJOSHI = 10
+    FUKUJOSHI = 11
+    SETSUZOKUJOSHI = 12
+    SHUJOSHI = 13
+    JUNTAIJOSHI = 14
+    # いずれにも該当しない
+    OTHER = 15
+
+
+class AttributeKatsuyoTextSourceDetector(IKatsuyoTextSourceDetector):
+    """
+    トークンの属性(tag_, lemma_, norm_, 活用タイプ, text)からIKatsuyoTextSourceを検出する
+
+    検出の規則はトークンの表現に依存しないため、
+    トークンから属性を取り出すtry_detectのみをサブクラスで実装する。
+    """
+
+    VERB_KATSUYOS_BY_CONJUGATION_TYPE = {
+        "五段-カ行": GODAN_KA_GYO,
+        "五段-ガ行": GODAN_GA_GYO,
+        "五段-サ行": GODAN_SA_GYO,
+        "五段-タ行": GODAN_TA_GYO,
+        "五段-ナ行": GODAN_NA_GYO,
+        "五段-バ行": GODAN_BA_GYO,
+        "五段-マ行": GODAN_MA_GYO,
+        "五段-ラ行": GODAN_RA_GYO,
+        "五段-ワア行": GODAN_WAA_GYO,
+        "上一段-ア行": KAMI_ICHIDAN,
+        "上一段-カ行": KAMI_ICHIDAN,
+        "上一段-ガ行": KAMI_ICHIDAN,
+        "上一段-ザ行": KAMI_ICHIDAN,
+        "上一段-タ行": KAMI_ICHIDAN,
+        "上一段-ナ行": KAMI_ICHIDAN,
+        "上一段-バ行": KAMI_ICHIDAN,
+        "上一段-マ行": KAMI_ICHIDAN,
+        "上一段-ラ行": KAMI_ICHIDAN,
+        "下一段-ア行": SHIMO_ICHIDAN,
+        "下一段-カ行": SHIMO_ICHIDAN,
+        "下一段-ガ行": SHIMO_ICHIDAN,
+        "下一段-サ行": SHIMO_ICHIDAN,
+        "下一段-ザ行": SHIMO_ICHIDAN,
+        "下一段-タ行": SHIMO_ICHIDAN,
+        "下一段-ダ行": SHIMO_ICHIDAN,
+        "下一段-ナ行": SHIMO_ICHIDAN,
+        "下一段-ハ行": SHIMO_ICHIDAN,
+        "下一段-バ行": SHIMO_ICHIDAN,
+        "下一段-マ行": SHIMO_ICHIDAN,
+        "下一段-ラ行": SHIMO_ICHIDAN,
+    }
+    JODOUSHI_BY_LEMMA = {
+        "れる": JODOUSHI_RERU.katsuyo_text,
+        "られる": JODOUSHI_RARERU.katsuyo_text,
+        # "せる" -> KatsuyoText
+        # "させる" -> KatsuyoText
+        "ない": JODOUSHI_NAI.katsuyo_text,
+        "ず": JODOUSHI_NAI.katsuyo_text,
+        "ぬ": JODOUSHI_NAI.katsuyo_text,
+        "たい": JODOUSHI_TAI.katsuyo_text,
+        # "たがる" -> KatsuyoText
+        "た": JODOUSHI_TA.katsuyo_text,
+        # "だ" -> 例外的に区別
+        # "そう" -> TaigenText|FukushiText
+        "らしい": JODOUSHI_RASHII.katsuyo_text,
+        "べし": JODOUSHI_BEKIDA.katsuyo_text,
+        # "よう" -> TaigenText
+        "です": JODOUSHI_DESU.katsuyo_text,
+        "ます": JODOUSHI_MASU.katsuyo_text,
+        # "てる" -> KatsuyoText
+    }
+    DOUSHI_PATTERN = re.compile(r"(動詞|.*動詞的)")
+    JODOUSHI_PATTERN = "助動詞"
+    KEIYOUSHI_PATTERN = re.compile(r"(形容詞|.*形容詞的)")
+    # 「形状詞」=「形容動詞の語幹」
+    # universaldependenciesのADJは形状詞を形容動詞として扱うが、KatsuyoTextとしては形状詞は名詞として扱う
+    # ref. https://universaldependencies.org/treebanks/ja_gsd/ja_gsd-pos-ADJ.html
+    # 「記号」e.g., 「ε」
+    MEISHI_PATTERN = re.compile(r"(名詞|代名詞|.*名詞的|形状詞|.*形状詞的)")
+    FUKUSHI_PATTERN = "副詞"
+    KANDOUSHI_PATTERN = "感動詞"
+    SETSUZOKU_PATTERN = "接続詞"
+    SETTOU_PATTERN = re.compile(r"(接頭辞|連体詞)")
+    KIGO_PATTERN = re.compile(r"(記号|補助記号)")
+    KAKUJOSHI_PATTERN = "助詞-格助詞"
+    KEIJOSHI_PATTERN = "助詞-係助詞"
+    FUKUJOSHI_PATTERN = "助詞-副助詞"
+    SETSUZOKUJOSHI_PATTERN = "助詞-接続助詞"
+    SHUJOSHI_PATTERN = "助詞-終助詞"
+    JUNTAIJOSHI_PATTERN = "助詞-準体助詞"
+    # 出現するtag_は有限であるため、tag_ごとに一度だけ分類して保持する
+    TAG_CATEGORIES: Dict[str, TagCategory] = {}
+    # detectがtextを参照するTagCategory
+    # それ以外のtag_のトークンは、表層形が異なっても検出結果を共有する
+    TEXT_CATEGORIES = frozenset(
+        {
+            TagCategory.MEISHI,
+            TagCategory.FUKUSHI,
+            TagCategory.SETTOU,
+            TagCategory.KANDOUSHI,
+            TagCategory.SETSUZOKU,
+            TagCategory.KIGO,
+            TagCategory.KAKUJOSHI,
+            TagCategory.KEIJOSHI,
+            TagCategory.FUKUJOSHI,
+            TagCategory.SETSUZOKUJOSHI,
+            TagCategory.SHUJOSHI,
+            TagCategory.JUNTAIJOSHI,
+        }
+    )
+
+    def __init__(
+        self,
+        intern_pool: Optional[InternPool] = None,
+        cache_maxsize: Optional[int] = 2**16,
+    ) -> None:
+        # 指定した場合、検出したIKatsuyoTextSourceをプールで共有する
+        self.intern_pool = intern_pool
+        # 検出結果はトークンの属性のみで決まり、IKatsuyoTextSourceはimmutableであるため
+        # 属性ごとに検出結果を保持して共有する
+        self._detect_cached = lru_cache(maxsize=cache_maxsize)(self.detect)
+
+    def _try_detect_attributes(
+        self,
+        tag: str,
+        lemma: str,
+        norm: str,
+        conjugation_type: Optional[str],
+        text: str,
+    ) -> Optional[IKatsuyoTextSource]:
+        """
+        detectの結果を属性ごとに保持して返却する。
+        サブクラスのtry_detectから、トークンごとに呼び出すこと。
+        """
+        result = self._detect_cached(
+            tag, lemma, norm, conjugation_type, self._text_key(tag, text)
+        )
+        if result is None:
+            # detectの結果は保持されるため、警告はここでトークンごとに出す
+            if self._warns(tag):
+                self._warn(tag, conjugation_type)
+            return result
+        if self.intern_pool is None:
+            return result
+        return self.intern_pool.intern(result)
+
+    def cache_info(self):
+        return self._detect_cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._detect_cached.cache_clear()
+
+    @classmethod
+    def _text_key(cls, tag: str, text: str) -> str:
+        """detectの結果を保持するキーに含めるtextを返却する"""
+        if cls.classify_tag(tag) in cls.TEXT_CATEGORIES:
+            return text
+        return ""
+
+    @classmethod
+    def _warns(cls, tag: str) -> bool:
+        """detectがNoneを返却したトークンについて、警告を出すかどうかを返却する"""
+        # 動詞と助動詞は、いずれの判定にも該当しない場合のみNoneを返却する
+        return cls.classify_tag(tag) in (TagCategory.DOUSHI, TagCategory.JODOUSHI)
+
+    def _warn(self, tag: str, conjugation_type: Optional[str]) -> None:
+        """_warnsに該当するトークンについて、警告を出して数える"""
+        if m.ENABLED:
+            m.METRICS.inc(m.DETECTOR_WARNING, type(self).__name__)
+        pos = "VERB" if self.classify_tag(tag) is TagCategory.DOUSHI else "AUX"
+        warnings.warn(
+            f"Unsupported conjugation_type of {pos}: {conjugation_type}", UserWarning
+        )
+
+    @classmethod
+    def classify_tag(cls, tag: str) -> TagCategory:
+        """
+        tag_をTagCategoryへ分類する。
+        分類済みのtag_はTAG_CATEGORIESから返却する。
+        """
+        category = cls.TAG_CATEGORIES.get(tag)
+        if category is None:
+            category = cls.TAG_CATEGORIES[tag] = cls._classify_tag(tag)
+        return category
+
+    @classmethod
+    def _classify_tag(cls, tag: str) -> TagCategory:
+        # 判定の順序に意味があるため、上から順に評価する
+        if cls.DOUSHI_PATTERN.match(tag):
+            return TagCategory.DOUSHI
+        elif tag.startswith(cls.JODOUSHI_PATTERN):
+            return TagCategory.JODOUSHI
+        elif cls.KEIYOUSHI_PATTERN.match(tag):
+            return TagCategory.KEIYOUSHI
+        elif cls.MEISHI_PATTERN.match(tag):
+            return TagCategory.MEISHI
+        elif tag.startswith(cls.FUKUSHI_PATTERN):
+            return TagCategory.FUKUSHI
+        elif cls.SETTOU_PATTERN.match(tag):
+            return TagCategory.SETTOU
+        elif tag.startswith(cls.KANDOUSHI_PATTERN):
+            return TagCategory.KANDOUSHI
+        elif tag.startswith(cls.SETSUZOKU_PATTERN):
+            return TagCategory.SETSUZOKU
+        elif cls.KIGO_PATTERN.match(tag):
+            return TagCategory.KIGO
+        elif tag.startswith(cls.KAKUJOSHI_PATTERN):
+            return TagCategory.KAKUJOSHI
+        elif tag.startswith(cls.KEIJOSHI_PATTERN):
+            return TagCategory.KEIJOSHI
+        elif tag.startswith(cls.FUKUJOSHI_PATTERN):
+            return TagCategory.FUKUJOSHI
+        elif tag.startswith(cls.SETSUZOKUJOSHI_PATTERN):
+            return TagCategory.SETSUZOKUJOSHI
+        elif tag.startswith(cls.SHUJOSHI_PATTERN):
+            return TagCategory.SHUJOSHI
+        elif tag.startswith(cls.JUNTAIJOSHI_PATTERN):
+            return TagCategory.JUNTAIJOSHI
+        return TagCategory.OTHER
+
+    @classmethod
+    def dump_tag_categories(cls) -> Dict[str, str]:
+        """
+        分類済みのtag_とTagCategoryの名前の対応を返却する。
+        e.g. {"動詞-一般": "DOUSHI", "助詞-格助詞": "KAKUJOSHI"}
+        """
+        return {tag: cls.TAG_CATEGORIES[tag].name for tag in sorted(cls.TAG_CATEGORIES)}
+
+    def detect(
+        self,
+        tag: str,
+        lemma: str,
+        norm: str,
+        conjugation_type: Optional[str],
+        text: str,
+    ) -> Optional[IKatsuyoTextSource]:
+        """
+        トークンの属性からIKatsuyoTextSourceを検出する。
+        不適切な値が代入された際は、Noneを返却する。
+        結果は属性ごとに保持されるため、警告は出さずに呼び出し元でトークンごとに出す。
+        textはTEXT_CATEGORIESのtag_の場合のみ参照する。
+        """
+
+        # There is no VBD tokens in Japanese
+        # ref. https://universaldependencies.org/treebanks/ja_gsd/index.html#pos-tags
+        # if pos_tag == "VBD":
+
+        category = self.classify_tag(tag)
+        if category is TagCategory.DOUSHI:
+            # ==================================================
+            # 動詞の判定
+            # ==================================================
+            # 「行く」は特殊な変形
+            if lemma in ["ゆく"]:
+                # 「ゆく」も「いく」に含める（過去・完了「た」を「ゆった」「ゆいた」とはできないため）
+                return KatsuyoText(gokan="い", katsuyo=GODAN_IKU)
+            if norm in ["行く", "逝く"]:
+                return KatsuyoText(gokan=lemma[:-1], katsuyo=GODAN_IKU)
+
+            # 活用タイプを取得して判定に利用
+            assert conjugation_type is not None, f"inflection is not empty: {text}"
+
+            # 活用形の判定
+            katsuyo = self.VERB_KATSUYOS_BY_CONJUGATION_TYPE.get(conjugation_type)
+            if katsuyo:
+                return KatsuyoText(gokan=lemma[:-1], katsuyo=katsuyo)
+
+            # 例外的な活用形の判定
+            if conjugation_type == "カ行変格":
+                # カ変「くる」「来る」を別途ハンドリング
+                if lemma == "来る":
+                    return KURU_KANJI
+                elif lemma == "くる":
+                    return KURU
+            elif conjugation_type == "サ行変格":
+                # サ変「する」「ずる」を別途ハンドリング
+                if lemma[-2:] == "する":
+                    return KatsuyoText(gokan=lemma[:-2], katsuyo=SA_GYO_HENKAKU_SURU)
+                elif lemma[-2:] == "ずる":
+                    return KatsuyoText(gokan=lemma[:-2], katsuyo=SA_GYO_HENKAKU_ZURU)
+
+            return None
+        elif category is TagCategory.JODOUSHI:
+            # 活用タイプを取得して判定に利用
+            assert conjugation_type is not None, f"inflection is not empty: {text}"
+
+            # 活用形の判定
+            katsuyo = self.VERB_KATSUYOS_BY_CONJUGATION_TYPE.get(conjugation_type)
+            if katsuyo:
+                return KatsuyoText(gokan=lemma[:-1], katsuyo=katsuyo)
+
+            # 例外的な活用形の判定
+            # 過去完了「だ」と断定「だ」の区別
+            if lemma == "だ":
+                if norm == "た":
+                    return JODOUSHI_DA_KAKO_KANRYO.katsuyo_text
+                else:
+                    assert norm == "だ"
+                    return JODOUSHI_DA_DANTEI.katsuyo_text
+
+            jodoushi = self.JODOUSHI_BY_LEMMA.get(lemma)
+            if jodoushi:
+                return jodoushi
+
+            return None
+        elif category is TagCategory.KEIYOUSHI:
+            # ==================================================
+            # 形容詞の変形
+            # ==================================================
+            # e.g. 楽しい -> gokan=楽し + katsuyo=い
+            return KatsuyoText(gokan=lemma[:-1], katsuyo=KEIYOUSHI)
+        elif category is TagCategory.MEISHI:
+            return TaigenText(gokan=text)
+        elif category is TagCategory.FUKUSHI:
+            return FukushiText(gokan=text)
+        elif category is TagCategory.SETTOU:
+            return SettoText(gokan=text)
+        elif category is TagCategory.KANDOUSHI:
+            return KandoushiText(gokan=text)
+        elif category is TagCategory.SETSUZOKU:
+            return SetsuzokuText(gokan=text)
+        elif category is TagCategory.KIGO:
+            return KigoText(gokan=text)
+        elif category is TagCategory.KAKUJOSHI:
+            return KakujoshiText(gokan=text)
+        elif category is TagCategory.KEIJOSHI:
+            return KeijoshiText(gokan=text)
+        elif category is TagCategory.FUKUJOSHI:
+            return FukujoshiText(gokan=text)
+        elif category is TagCategory.SETSUZOKUJOSHI:
+            return SetsuzokujoshiText(gokan=text)
+        elif category is TagCategory.SHUJOSHI:
+            return ShujoshiText(gokan=text)
+        elif category is TagCategory.JUNTAIJOSHI:
+            return JuntaijoshiText(gokan=text)
+
+        return None
+
+
+class AttributeKatsuyoTextAppendantDetector(IKatsuyoTextAppendantDetector):
+    """
+    トークンの属性(pos_, tag_, norm_, lemma_)からIKatsuyoTextAppendantを検出する
+
+    検出の規則はトークンの表現に依存しないため、
+    トークンから属性を取り出すtry_detect, detect_from_sentのみをサブクラスで実装する。
+    """
+
+    def __init__(
+        self,
+        *args,
+        cache_maxsize: Optional[int] = 2**16,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # 検出結果はトークンの属性(「そう」の場合は左隣のトークンの属性を含む)のみで決まるため
+        # 属性ごとに検出結果を保持して共有する
+        self._detect_cached = lru_cache(maxsize=cache_maxsize)(self.detect)
+
+    def cache_info(self):
+        return self._detect_cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._detect_cached.cache_clear()
+
+    def detect(
+        self,
+        pos_tag: str,
+        tag: str,
+        norm: str,
+        lemma: str,
+        left: Optional[Tuple[str, str, str, Optional[str]]],
+    ) -> Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]:
+        """
+        トークンの属性からIKatsuyoTextAppendantを検出する。
+        leftは「そう」の判別に用いる左隣のトークンの(pos_, tag_, text, 活用形)であり、
+        normが「そう」の場合のみ指定される。
+        """
+        if pos_tag == "AUX" or tag == "助動詞":
+            # ==================================================
+            # 助動詞の判定
+            # ==================================================
+            # NOTE: inflectionの情報のみでは、助動詞の活用形を判定できない
+            #       e.g. せる -> Inf=下一段-サ行,終止形-一般 となる
+
+            if norm in ["れる", "られる"]:
+                return self.try_get_helper(Ukemi)
+            elif norm in ["せる", "させる"]:
+                return self.try_get_helper(Shieki)
+            elif norm in ["ない", "ず"]:
+                # 「ず」も「ない」として扱う
+                return self.try_get_helper(Hitei)
+            elif norm in ["たい"]:
+                return self.try_get_helper(KibouSelf)
+            elif norm in ["たがる"]:
+                return self.try_get_helper(KibouOthers)
+            elif norm in ["た"]:
+                return self.try_get_helper(KakoKanryo)
+            elif norm in ["そう"]:
+                return self._detect_appendant_sou(norm, left)
+            elif norm in ["らしい"]:
+                return self.try_get_helper(Suitei)
+            elif norm in ["べし"]:
+                return self.try_get_helper(Touzen)
+            elif norm in ["よう"]:
+                return self.try_get_helper(HikyoReizi)
+            elif norm in ["だ"]:
+                return self.try_get_helper(Dantei)
+            elif norm in ["です"]:
+                return self.try_get_helper(DanteiTeinei)
+            elif norm in ["ます"]:
+                return self.try_get_helper(Teinei)
+            elif norm in ["てる"]:
+                return self.try_get_helper(Keizoku)
+
+            if self.log_warning:
+                return None, KatsuyoTextErrorMessage(f"Unsupported AUX: {norm}")
+
+            return None, None
+        elif pos_tag == "ADJ":
+            # 形容詞「ない」はIJodoushiHelperの対象外とする
+            # NOTE: 必ずしも正確に否定表現を解析できるとは限らない
+            #       @see: https://github.com/sadahry/spacy-dialog-reflection/blob/17507db530da24c11816374d6caa4766e4614f69/tests/lang/ja/test_katsuyo_text_detector.py#L676-L693
+            # if norm in ["無い"]:
+            #     return self.try_get_helper(Hitei)
+
+            return None, None
+        elif pos_tag == "ADV":
+            # 「そう」のみ対応
+            if norm in ["そう"]:
+                return self._detect_appendant_sou(norm, left)
+
+            return None, None
+        elif tag == "助詞-副助詞":
+            # ==================================================
+            # 副助詞の判定
+            # ==================================================
+            return self.try_get_fukujoshi(norm)
+        elif tag == "助詞-接続助詞":
+            # ==================================================
+            # 接続助詞の判定
+            # ==================================================
+            # sudachiの辞書のnorm「だって」が正しくないためlemmaで対応
+            if lemma in ["たって", "だって"]:
+                return self.try_get_helper(TatteDatte)
+            elif lemma in ["て", "で"]:
+                return self.try_get_helper(TeDe)
+            return self.try_get_setsuzokujoshi(lemma)
+        elif tag == "助詞-終助詞":
+            # ==================================================
+            # 終助詞の判定
+            # ==================================================
+            return self.try_get_shujoshi(norm)
+
+        return None, None
+
+    def _detect_appendant_sou(
+        self, norm: str, left: Optional[Tuple[str, str, str, Optional[str]]]
+    ) -> Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]:
+        # 「様態」「伝聞」の判別
+        assert left is not None
+        left_pos, left_tag, left_text, katsuyo_type = left
+        # 動詞判定
+        if left_tag.startswith("動詞"):
+            # @ref: https://github.com/sadahry/spacy-dialog-reflection/blob/6a56bd3378daee41a30bc7bb50b8de6c063a8437/spacy_dialog_reflection/lang/ja/katsuyo_text_detector.py#L136-L144
+            assert katsuyo_type is not None
+            if "連用形" in katsuyo_type:
+                return self.try_get_helper(Youtai)
+            elif "終止形" in katsuyo_type or "連体形" in katsuyo_type:
+                return self.try_get_helper(Denbun)
+        # 形容詞判定
+        if "形容詞" in left_tag:
+            # @ref: https://github.com/sadahry/spacy-dialog-reflection/blob/6a56bd3378daee41a30bc7bb50b8de6c063a8437/spacy_dialog_reflection/lang/ja/katsuyo_text_detector.py#L136-L144
+            assert katsuyo_type is not None
+            if "語幹" in katsuyo_type:
+                return self.try_get_helper(Youtai)
+            elif "終止形" in katsuyo_type or "連体形" in katsuyo_type:
+                return self.try_get_helper(Denbun)
+        # 形容動詞判定
+        if left_pos == "AUX" and left_text == "だ":
+            # 形容動詞の基本形(終止or連体)が取れていると判断する
+            return self.try_get_helper(Denbun)
+        elif "形状詞" in left_tag:
+            # e.g.,
+            # 困難    ADJ     名詞-普通名詞-形状詞可能
+            # 的      PART    接尾辞-形状詞的
+            return self.try_get_helper(Youtai)
+        elif left_pos == "ADJ" and left_tag.startswith("名詞"):
+            # 形状詞可能ではない形容動詞の語幹が取れていると判断する
+            return self.try_get_helper(Youtai)
+
+        return None, KatsuyoTextErrorMessage(f"Unexpected {norm} no matched")
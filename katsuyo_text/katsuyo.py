@@ -1,4 +1,5 @@
-from typing import NewType
+from typing import Any, NewType, Optional, Tuple
+from enum import IntEnum
 import attrs
 
 DAN = {
@@ -33,22 +34,61 @@ GYO = {
 # ==============================================================================
 
 
+FixedKatsuyo = NewType("FixedKatsuyo", str)
+NO_KATSUYO = FixedKatsuyo("")
+
+
+class KatsuyoForm(IntEnum):
+    """活用形の番号。IKatsuyo.formsの添字として用いる"""
+
+    MIZEN = 0
+    MIZEN_U = 1
+    MIZEN_RERU = 2
+    MIZEN_RARERU = 3
+    RENYO = 4
+    RENYO_TA = 5
+    RENYO_NAI = 6
+    SHUSHI = 7
+    RENTAI = 8
+    KATEI = 9
+    MEIREI = 10
+
+    @property
+    def attr_name(self) -> str:
+        """活用形を保持するMixinのフィールド名"""
+        return self.name.lower()
+
+
 class IKatsuyo:
-    pass
+    # KatsuyoFormを添字とした活用語尾のタプル
+    # 活用形が存在しない場合はNoneとなる
+    forms: Tuple[Optional[FixedKatsuyo], ...]
 
+    # 複数のMixinがそれぞれスロットを持つと多重継承時にレイアウトが衝突するため、
+    # Mixinの宣言する活用形のスロットはすべてIKatsuyoに持たせる
+    __slots__ = ("forms", *(form.attr_name for form in KatsuyoForm))
 
-FixedKatsuyo = NewType("FixedKatsuyo", str)
-NO_KATSUYO = FixedKatsuyo("")
+    def __getattr__(self, name: str) -> Any:
+        # 初回の参照時に一度だけ計算する
+        if name != "forms":
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        forms = tuple(getattr(self, form.attr_name, None) for form in KatsuyoForm)
+        object.__setattr__(self, "forms", forms)
+        return forms
 
 
 class IKatsuyoForm:
-    pass
+    __slots__ = ()
 
 
 @attrs.define(frozen=True, slots=False)
 class MizenMixin(IKatsuyoForm):
     """未然形"""
 
+    __slots__ = ()
+
     mizen: FixedKatsuyo
 
 
@@ -56,6 +96,8 @@ class MizenMixin(IKatsuyoForm):
 class RenyoMixin(IKatsuyoForm):
     """連用形"""
 
+    __slots__ = ()
+
     renyo: FixedKatsuyo
 
 
@@ -63,6 +105,8 @@ class RenyoMixin(IKatsuyoForm):
 class ShushiMixin(IKatsuyoForm):
     """終止形"""
 
+    __slots__ = ()
+
     shushi: FixedKatsuyo
 
     def __str__(self) -> str:
@@ -73,6 +117,8 @@ class ShushiMixin(IKatsuyoForm):
 class RentaiMixin(IKatsuyoForm):
     """連体形"""
 
+    __slots__ = ()
+
     rentai: FixedKatsuyo
 
 
@@ -83,6 +129,8 @@ class KateiMixin(IKatsuyoForm):
     已然形(izen)は仮定形に含める
     """
 
+    __slots__ = ()
+
     katei: FixedKatsuyo
 
 
@@ -90,6 +138,8 @@ class KateiMixin(IKatsuyoForm):
 class MeireiMixin(IKatsuyoForm):
     """命令形"""
 
+    __slots__ = ()
+
     meirei: FixedKatsuyo
 
 
@@ -103,6 +153,8 @@ class MizenUMixin(IKatsuyoForm):
     「う」に続くとき、活用語尾が変化する活用形が存在する。
     """
 
+    __slots__ = ()
+
     mizen_u: FixedKatsuyo
 
 
@@ -113,6 +165,8 @@ class MizenReruMixin(IKatsuyoForm):
     活用語尾が変化する活用形が存在する。
     """
 
+    __slots__ = ()
+
     mizen_reru: FixedKatsuyo
 
 
@@ -123,6 +177,8 @@ class MizenRareruMixin(IKatsuyoForm):
     活用語尾が変化する活用形が存在する。
     """
 
+    __slots__ = ()
+
     mizen_rareru: FixedKatsuyo
 
 
@@ -133,6 +189,8 @@ class RenyoTaMixin(IKatsuyoForm):
     活用語尾が変化する活用形が存在する。
     """
 
+    __slots__ = ()
+
     renyo_ta: FixedKatsuyo
 
 
@@ -143,6 +201,8 @@ class RenyoNaiMixin(IKatsuyoForm):
     活用語尾が変化する活用形が存在する。
     """
 
+    __slots__ = ()
+
     renyo_nai: FixedKatsuyo
 
 
@@ -151,7 +211,6 @@ class RenyoNaiMixin(IKatsuyoForm):
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=False)
 class IDoushiKatsuyo(
     IKatsuyo,
     MizenMixin,
@@ -161,7 +220,7 @@ class IDoushiKatsuyo(
     KateiMixin,
     MeireiMixin,
 ):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -170,7 +229,7 @@ class IDoushiKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class GodanKatsuyo(
     IDoushiKatsuyo,
     # 「う」の場合、オ段となる
@@ -306,7 +365,7 @@ GODAN_IKU = GodanKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class KamiIchidanKatsuyo(
     # 命令形「-○よ」は登録しない
     # 「-○ろ」のほうが口語的だと判断
@@ -330,7 +389,7 @@ KAMI_ICHIDAN = KamiIchidanKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class ShimoIchidanKatsuyo(
     # 命令形「-○よ」は登録しない
     # 「-○ろ」のほうが口語的だと判断
@@ -354,7 +413,7 @@ SHIMO_ICHIDAN = ShimoIchidanKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class KaGyoHenkakuKatsuyo(
     IDoushiKatsuyo,
 ):
@@ -388,7 +447,7 @@ KA_GYO_HENKAKU_KURU_KANJI = KaGyoHenkakuKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class SaGyoHenkakuKatsuyo(
     # 命令形「せよ」は登録しない
     # 「しろ」のほうが口語的だと判断
@@ -432,7 +491,7 @@ SA_GYO_HENKAKU_ZURU = SaGyoHenkakuKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class KeiyoushiKatsuyo(
     IKatsuyo,
     MizenMixin,
@@ -461,7 +520,7 @@ KEIYOUSHI = KeiyoushiKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class KeiyoudoushiKatsuyo(
     IKatsuyo,
     MizenMixin,
@@ -494,14 +553,13 @@ KEIYOUDOUSHI = KeiyoudoushiKatsuyo(
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=False)
 class IJodoushiKatsuyo(IKatsuyo):
     """
     このクラスは助動詞の活用形を表すクラスではなく、
     特殊な活用であることを表すクラスである。
     """
 
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -509,7 +567,7 @@ class IJodoushiKatsuyo(IKatsuyo):
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class TaKatsuyo(
     IJodoushiKatsuyo,
     MizenMixin,
@@ -537,7 +595,7 @@ JODOUSHI_DA_KAKO_KANRYO = TaKatsuyo(
 )
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class MasuKatsuyo(
     IJodoushiKatsuyo,
     MizenMixin,
@@ -564,7 +622,7 @@ JODOUSHI_MASU = MasuKatsuyo(
 )
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, cache_hash=True)
 class DesuKatsuyo(
     IJodoushiKatsuyo,
     MizenMixin,
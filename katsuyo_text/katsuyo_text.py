@@ -1,7 +1,23 @@
-from typing import Optional, Union, TypeVar, Generic, NewType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    TypeVar,
+    Generic,
+    NewType,
+    cast,
+)
+from collections import OrderedDict
 import attrs
 import abc
 import katsuyo_text.katsuyo as k
+import katsuyo_text.metrics as m
 
 A = TypeVar(
     "A",
@@ -37,7 +53,31 @@ KatsuyoTextErrorMessage = NewType("KatsuyoTextErrorMessage", str)
 KatsuyoTextHasError = NewType("KatsuyoTextHasError", bool)
 
 
-@attrs.define(frozen=True, slots=False)
+class LazyKatsuyoTextError:
+    """
+    KatsuyoTextErrorを送出せずに返却するためのクラス。
+    エラーが頻繁に発生する処理で例外の生成やメッセージの整形を避けるため、
+    メッセージはmessageを参照した時点で生成する。
+    """
+
+    __slots__ = ("_format", "_args")
+
+    def __init__(self, format: Callable[..., str], *args: Any) -> None:
+        self._format = format
+        self._args = args
+
+    @property
+    def message(self) -> KatsuyoTextErrorMessage:
+        return KatsuyoTextErrorMessage(self._format(*self._args))
+
+    def to_error(self) -> KatsuyoTextError:
+        return KatsuyoTextError(self.message)
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@attrs.define(frozen=True, slots=True)
 class IKatsuyoTextSource(abc.ABC):
     """活用系テキスト"""
 
@@ -54,6 +94,15 @@ class IKatsuyoTextSource(abc.ABC):
         #       ただadd時のエラーがわかりにくくなるので現状は都度gokanに追記するようにしている
         raise NotImplementedError()
 
+    def try_add(
+        self, post: "IKatsuyoTextAppendant[A]"
+    ) -> Tuple[Optional[A], Optional[LazyKatsuyoTextError]]:
+        """
+        addと同様の結果を返却する。
+        KatsuyoTextErrorとなる場合は例外を送出せずにLazyKatsuyoTextErrorを返却する。
+        """
+        return SUFFIX_TABLE.try_add(self, post)
+
 
 class IKatsuyoTextAppendant(abc.ABC, Generic[M]):
     """
@@ -62,6 +111,8 @@ class IKatsuyoTextAppendant(abc.ABC, Generic[M]):
     このインターフェースを実装したクラスへaddすることはできない。
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def merge(self, pre: IKatsuyoTextSource) -> M:
         raise NotImplementedError()
@@ -99,7 +150,20 @@ class KatsuyoText(IKatsuyoTextSource, IKatsuyoTextAppendant["KatsuyoText"]):
 
     def __add__(self, post: IKatsuyoTextAppendant[A]) -> A:
         # 日本語の特性上、KatsuyoTextの活用形は前に接続される品詞の影響を受ける。
-        return post.merge(self)
+        return SUFFIX_TABLE.add(self, post)
+
+    def as_form(self, form: k.KatsuyoForm) -> Optional["FixedKatsuyoText"]:
+        """
+        活用形formに変形したFixedKatsuyoTextを返却する。
+        活用形が存在しない場合はNoneを返却する。
+        """
+        katsuyo = self.katsuyo.forms[form]
+        if katsuyo is None:
+            return None
+        return FixedKatsuyoText(
+            gokan=self.gokan,
+            katsuyo=katsuyo,
+        )
 
     @property
     def as_fkt_gokan(self) -> Optional["FixedKatsuyoText"]:
@@ -112,102 +176,47 @@ class KatsuyoText(IKatsuyoTextSource, IKatsuyoTextAppendant["KatsuyoText"]):
 
     @property
     def as_fkt_mizen(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.MizenMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.mizen,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.MIZEN)
 
     @property
     def as_fkt_renyo(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.RenyoMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.renyo,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.RENYO)
 
     @property
     def as_fkt_shushi(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.ShushiMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.shushi,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.SHUSHI)
 
     @property
     def as_fkt_rentai(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.RentaiMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.rentai,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.RENTAI)
 
     @property
     def as_fkt_katei(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.KateiMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.katei,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.KATEI)
 
     @property
     def as_fkt_meirei(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.MeireiMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.meirei,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.MEIREI)
 
     @property
     def as_fkt_mizen_u(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.MizenUMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.mizen_u,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.MIZEN_U)
 
     @property
     def as_fkt_mizen_reru(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.MizenReruMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.mizen_reru,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.MIZEN_RERU)
 
     @property
     def as_fkt_mizen_rareru(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.MizenRareruMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.mizen_rareru,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.MIZEN_RARERU)
 
     @property
     def as_fkt_renyo_ta(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.RenyoTaMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.renyo_ta,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.RENYO_TA)
 
     @property
     def as_fkt_renyo_nai(self) -> Optional["FixedKatsuyoText"]:
-        if isinstance(self.katsuyo, k.RenyoNaiMixin):
-            return FixedKatsuyoText(
-                gokan=self.gokan,
-                katsuyo=self.katsuyo.renyo_nai,
-            )
-        return None
+        return self.as_form(k.KatsuyoForm.RENYO_NAI)
 
     def __str__(self):
         return f"{self.gokan}{self.katsuyo}"
@@ -229,13 +238,15 @@ class FixedKatsuyoText(IKatsuyoTextSource):
                 katsuyo=post.katsuyo,
             )
         else:
+            # FixedKatsuyoTextは各mergeの最初の分岐で処理されるため
+            # SUFFIX_TABLEを参照するよりも直接mergeしたほうが速い
             return post.merge(self)
 
     def __str__(self):
         return f"{self.gokan}{self.katsuyo}"
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class INonKatsuyoText(IKatsuyoTextSource):
     """
     活用形を含まない文字列を表すクラス。
@@ -254,12 +265,327 @@ class INonKatsuyoText(IKatsuyoTextSource):
                 katsuyo=post.katsuyo,
             )
         else:
-            return post.merge(self)
+            return SUFFIX_TABLE.add(self, post)
 
     def __str__(self):
         return self.gokan
 
 
+# ==============================================================================
+# 接尾辞テーブル
+# ==============================================================================
+
+SuffixTableEntry = Tuple[
+    Type[IKatsuyoTextSource],
+    str,
+    Union[k.IKatsuyo, k.FixedKatsuyo, None],
+]
+
+# 既存のmergeを実行して接尾辞を求める際に用いる語幹
+# 結果がgokanに依存しないことを確かめるため、異なる2つの語幹でmergeする
+PROBE_GOKANS = ("\ue000", "\ue001\ue001")
+
+# mergeがgokanによらずKatsuyoTextErrorとなる組み合わせを表すエントリ
+# 抽象クラスであるIKatsuyoTextSourceは結果のクラスとなり得ないため、他のエントリと区別できる
+UNSUPPORTED_ENTRY: SuffixTableEntry = (IKatsuyoTextSource, "", None)
+
+
+def compile_suffix_entry(
+    typ: Type[IKatsuyoTextSource],
+    katsuyo: Any,
+    merge: Callable[[IKatsuyoTextSource], Any],
+) -> Optional[SuffixTableEntry]:
+    """
+    typ(gokan=..., katsuyo=katsuyo)にmergeを適用した結果を
+    (結果のクラス, gokanに付与する接尾辞, 結果の活用)として返却する。
+    mergeがKatsuyoTextErrorとなる場合はUNSUPPORTED_ENTRYを返却する。
+    結果がgokanに依存する場合やその他のエラーとなる場合はNoneを返却する。
+    """
+    entries = []
+    for gokan in PROBE_GOKANS:
+        try:
+            # 試行のためのmergeは呼び出しとして数えない
+            with m.METRICS.suspended():
+                result = merge(typ(gokan=gokan, katsuyo=katsuyo))
+        except KatsuyoTextError:
+            entries.append(UNSUPPORTED_ENTRY)
+            continue
+        except Exception:
+            # 想定外のエラーとなる組み合わせはmergeを呼び出してエラーを送出させる
+            return None
+
+        if not isinstance(result, IKatsuyoTextSource) or isinstance(
+            # __init__を上書きしているため、gokanとkatsuyoから再生成できない
+            result,
+            IJodoushiKatsuyoText,
+        ):
+            return None
+        if not result.gokan.startswith(gokan):
+            return None
+        entries.append((type(result), result.gokan[len(gokan) :], result.katsuyo))
+
+    if entries[0] != entries[1]:
+        # gokanに依存する結果はテーブルに載せない
+        return None
+
+    return entries[0]
+
+
+class SuffixTable:
+    """
+    IKatsuyoTextSourceのクラスと活用(katsuyo)、IKatsuyoTextAppendantの組み合わせごとに、
+    mergeの結果を(結果のクラス, gokanに付与する接尾辞, 結果の活用)として保持する。
+
+    mergeの結果はpre.gokanに依存せずクラスと活用とAppendantのみで決まるため、
+    組み合わせごとに一度だけmerge(isinstanceによる分岐)を実行し、
+    以降は辞書の参照と文字列の連結のみで済ませる。
+    """
+
+    def __init__(self, maxsize: int = 2**16) -> None:
+        self.maxsize = maxsize
+        self._table: Dict[Tuple[type, Any, Any], Optional[SuffixTableEntry]] = {}
+        # テーブルを参照した場合に、mergeを呼び出した場合と同じく数えるためのカウンタの増分
+        # metricsが有効な間に参照された組み合わせのみ保持する
+        self._counts: Dict[Tuple[type, Any, Any], Dict[Tuple[str, str], int]] = {}
+
+    def add(self, pre: IKatsuyoTextSource, post: "IKatsuyoTextAppendant[A]") -> A:
+        entry = self._lookup(type(pre), pre.katsuyo, post)
+        if entry is None or entry is UNSUPPORTED_ENTRY:
+            if m.ENABLED:
+                # mergeを呼び出すため、mergeの内訳はmerge自身が数える
+                counter = m.SUFFIX_TABLE_MISS if entry is None else m.SUFFIX_TABLE_HIT
+                m.METRICS.inc(counter, type(post).__name__)
+            try:
+                return post.merge(pre)
+            except KatsuyoTextError as e:
+                if m.ENABLED:
+                    m.count_error(e)
+                raise
+        if m.ENABLED:
+            self._count_hit(type(pre), pre.katsuyo, post)
+        typ, suffix, katsuyo = entry
+        return cast(A, typ(gokan=pre.gokan + suffix, katsuyo=katsuyo))
+
+    def try_add(
+        self, pre: IKatsuyoTextSource, post: "IKatsuyoTextAppendant[A]"
+    ) -> Tuple[Optional[A], Optional[LazyKatsuyoTextError]]:
+        entry = self._lookup(type(pre), pre.katsuyo, post)
+        if entry is None:
+            if m.ENABLED:
+                m.METRICS.inc(m.SUFFIX_TABLE_MISS, type(post).__name__)
+            try:
+                return post.merge(pre), None
+            except KatsuyoTextError as e:
+                if m.ENABLED:
+                    m.count_error(e)
+                return None, LazyKatsuyoTextError(format_add_error, pre, post)
+        if m.ENABLED:
+            self._count_hit(type(pre), pre.katsuyo, post)
+        if entry is UNSUPPORTED_ENTRY:
+            return None, LazyKatsuyoTextError(format_add_error, pre, post)
+        typ, suffix, katsuyo = entry
+        return cast(A, typ(gokan=pre.gokan + suffix, katsuyo=katsuyo)), None
+
+    def add_all(
+        self,
+        pre: IKatsuyoTextSource,
+        posts: Iterable["IKatsuyoTextAppendant"],
+    ) -> IKatsuyoTextSource:
+        """
+        postsを順にaddした結果を返却する。
+        途中の結果は生成せずに接尾辞のみを保持しておき、最後に一度だけgokanへ連結する。
+        長い語幹に多数のAppendantをaddする場合に、語幹の複製を繰り返さずに済む。
+        """
+        result, error = self.try_add_all(pre, posts)
+        if error is not None:
+            raise error.to_error()
+        assert result is not None
+        return result
+
+    def try_add_all(
+        self,
+        pre: IKatsuyoTextSource,
+        posts: Iterable["IKatsuyoTextAppendant"],
+    ) -> Tuple[Optional[IKatsuyoTextSource], Optional[LazyKatsuyoTextError]]:
+        """
+        add_allと同様の結果を返却する。
+        KatsuyoTextErrorとなる場合は例外を送出せずにLazyKatsuyoTextErrorを返却する。
+        """
+        result = pre
+        gokan = pre.gokan
+        pieces: List[str] = []
+        typ: Type[IKatsuyoTextSource] = type(pre)
+        katsuyo = pre.katsuyo
+        for post in posts:
+            entry = self._lookup(typ, katsuyo, post)
+            if entry is None or entry is UNSUPPORTED_ENTRY:
+                if pieces:
+                    result = typ(gokan=gokan + "".join(pieces), katsuyo=katsuyo)
+                next_result, error = self.try_add(result, post)
+                if error is not None:
+                    return None, error
+                assert next_result is not None
+                result = next_result
+                gokan, pieces = result.gokan, []
+                typ, katsuyo = type(result), result.katsuyo
+                continue
+            if m.ENABLED:
+                self._count_hit(typ, katsuyo, post)
+            typ, suffix, katsuyo = entry
+            pieces.append(suffix)
+
+        if pieces:
+            result = typ(gokan=gokan + "".join(pieces), katsuyo=katsuyo)
+        return result, None
+
+    def lookup(
+        self, typ: Type[IKatsuyoTextSource], katsuyo: Any, post: Any
+    ) -> Optional[SuffixTableEntry]:
+        """
+        テーブルに載せられない組み合わせ(mergeがエラーとなる場合を含む)はNoneを返却する。
+        Noneの場合は通常どおりmergeを呼び出すこと。
+        """
+        entry = self._lookup(typ, katsuyo, post)
+        if entry is UNSUPPORTED_ENTRY:
+            return None
+        return entry
+
+    def _lookup(
+        self, typ: Type[IKatsuyoTextSource], katsuyo: Any, post: Any
+    ) -> Optional[SuffixTableEntry]:
+        """
+        lookupと異なり、mergeがエラーとなる組み合わせはUNSUPPORTED_ENTRYを返却する。
+        """
+        key = (typ, katsuyo, post)
+        try:
+            return self._table[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # hash不可能なpost
+            return None
+
+        # bridgeにlambdaを都度指定する場合などにテーブルが肥大化しないよう上限を設ける
+        # 上限に達した場合は試行のmergeを行わず、呼び出し元で通常どおりmergeさせる
+        if len(self._table) >= self.maxsize:
+            return None
+        entry = compile_suffix_entry(typ, katsuyo, post.merge)
+        self._table[key] = entry
+        return entry
+
+    def _count_hit(
+        self, typ: Type[IKatsuyoTextSource], katsuyo: Any, post: "IKatsuyoTextAppendant"
+    ) -> None:
+        """
+        mergeを呼び出さずにテーブルを参照したpre + postを、mergeを呼び出した場合と同じく数える。
+        mergeが数える増分は組み合わせごとに一度だけ、試行のためのmergeで求める。
+        """
+        key = (typ, katsuyo, post)
+        counts = self._counts.get(key)
+        if counts is None:
+            with m.METRICS.suspended() as counts:
+                try:
+                    post.merge(typ(gokan=PROBE_GOKANS[0], katsuyo=katsuyo))
+                except KatsuyoTextError as e:
+                    m.count_error(e)
+            if len(self._counts) < self.maxsize:
+                self._counts[key] = counts
+        m.METRICS.inc(m.SUFFIX_TABLE_HIT, type(post).__name__)
+        m.METRICS.inc_all(counts)
+
+    def compile(
+        self,
+        srcs: Iterable[IKatsuyoTextSource],
+        appendants: Iterable["IKatsuyoTextAppendant"],
+    ) -> None:
+        """
+        あらかじめ任意の組み合わせのテーブルを構築しておく
+        """
+        appendants = list(appendants)
+        for src in srcs:
+            for post in appendants:
+                self.lookup(type(src), src.katsuyo, post)
+
+    def clear(self) -> None:
+        self._table.clear()
+        self._counts.clear()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+SUFFIX_TABLE = SuffixTable()
+
+
+def format_add_error(pre: IKatsuyoTextSource, post: "IKatsuyoTextAppendant") -> str:
+    """
+    pre + postのエラーメッセージを返却する。
+    メッセージは各mergeで生成されるため、改めてmergeを実行して取得する。
+    """
+    try:
+        # メッセージを得るためのmergeは呼び出しとして数えない
+        with m.METRICS.suspended():
+            post.merge(pre)
+    except KatsuyoTextError as e:
+        return str(e)
+    return f"Unsupported katsuyo_text: {pre} type: {type(pre)} post: {type(post)}"
+
+
+# ==============================================================================
+# インターンプール
+# ==============================================================================
+
+S = TypeVar("S", bound=IKatsuyoTextSource)
+
+
+class InternPool:
+    """
+    (クラス, gokan, katsuyo)が等しいIKatsuyoTextSourceを共有するためのプール。
+    IKatsuyoTextSourceはimmutableであるため、同一の語を繰り返し検出する場合に
+    同じインスタンスを返却してメモリ使用量を抑える。
+    上限を超えた場合は最も参照されていないものから破棄する(LRU)。
+
+    共有されたインスタンス同士の比較やdict/setの参照は
+    同一性(is)の判定で済むため、__eq__の呼び出しも省略される。
+    """
+
+    def __init__(self, maxsize: int = 2**16) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._pool: "OrderedDict[Tuple[type, str, Any], IKatsuyoTextSource]" = (
+            OrderedDict()
+        )
+
+    def intern(self, src: S) -> S:
+        key = (type(src), src.gokan, src.katsuyo)
+        try:
+            interned = self._pool[key]
+        except KeyError:
+            self.misses += 1
+            self._pool[key] = src
+            if len(self._pool) > self.maxsize:
+                self._pool.popitem(last=False)
+            return src
+
+        self.hits += 1
+        self._pool.move_to_end(key)
+        return cast(S, interned)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._pool.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+
 # ==============================================================================
 # KatsuyoText
 # TODO 別ファイルに分割する
@@ -297,6 +623,8 @@ ZURU = KatsuyoText(
 
 
 class IHojoKatsuyoText(KatsuyoText):
+    __slots__ = ()
+
     @property
     def katsuyo_text(self) -> KatsuyoText:
         return KatsuyoText(
@@ -306,6 +634,8 @@ class IHojoKatsuyoText(KatsuyoText):
 
 
 class HojoKatsuyoText(IHojoKatsuyoText):
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> KatsuyoText:
         if isinstance(pre, FixedKatsuyoText):
             return pre + self.katsuyo_text
@@ -356,6 +686,8 @@ HOJO_IRU = HojoKatsuyoText(
 
 
 class IJodoushiKatsuyoText(KatsuyoText):
+    __slots__ = ()
+
     @property
     def katsuyo_text(self) -> KatsuyoText:
         return KatsuyoText(
@@ -370,6 +702,8 @@ class IJodoushiKatsuyoText(KatsuyoText):
 
 
 class Reru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="れ",
@@ -401,6 +735,8 @@ class Reru(IJodoushiKatsuyoText):
 
 
 class Rareru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="られ",
@@ -440,6 +776,8 @@ JODOUSHI_RARERU = Rareru()
 
 
 class Seru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="せ",
@@ -477,6 +815,8 @@ SASERU = KatsuyoText(
 
 
 class Saseru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan=SASERU.gokan,
@@ -514,6 +854,8 @@ JODOUSHI_SASERU = Saseru()
 
 
 class Nai(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="な",
@@ -549,6 +891,8 @@ JODOUSHI_NAI = Nai()
 
 
 class Tai(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="た",
@@ -577,6 +921,8 @@ class Tai(IJodoushiKatsuyoText):
 
 
 class Tagaru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="たが",
@@ -613,6 +959,8 @@ JODOUSHI_TAGARU = Tagaru()
 
 
 class Ta(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="",
@@ -651,6 +999,8 @@ class Ta(IJodoushiKatsuyoText):
 
 
 class DaKakoKanryo(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="",
@@ -698,6 +1048,8 @@ JODOUSHI_DA_KAKO_KANRYO = DaKakoKanryo()
 
 
 class Masu(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="ま",
@@ -733,6 +1085,8 @@ JODOUSHI_MASU = Masu()
 
 
 class SoudaYoutai(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="そう",
@@ -773,6 +1127,8 @@ JODOUSHI_SOUDA_YOUTAI = SoudaYoutai()
 
 
 class SoudaDenbun(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="そう",
@@ -810,6 +1166,8 @@ JODOUSHI_SOUDA_DENBUN = SoudaDenbun()
 
 
 class Rashii(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="らし",
@@ -846,6 +1204,8 @@ JODOUSHI_RASHII = Rashii()
 
 
 class Bekida(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="べき",
@@ -881,6 +1241,8 @@ JODOUSHI_BEKIDA = Bekida()
 
 
 class Youda(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="よう",
@@ -920,6 +1282,8 @@ JODOUSHI_YOUDA = Youda()
 
 
 class Desu(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="で",
@@ -955,6 +1319,8 @@ class Desu(IJodoushiKatsuyoText):
 
 
 class DaDantei(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="",
@@ -992,6 +1358,8 @@ JODOUSHI_DA_DANTEI = DaDantei()
 
 
 class Teiru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="てい",
@@ -1021,6 +1389,8 @@ class Teiru(IJodoushiKatsuyoText):
 
 
 class Deiru(IJodoushiKatsuyoText):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             gokan="でい",
@@ -1060,7 +1430,7 @@ JODOUSHI_DEIRU = Deiru()
 class TaigenText(INonKatsuyoText):
     """体言"""
 
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1072,7 +1442,7 @@ class TaigenText(INonKatsuyoText):
 # 現状、文法的な活用判断が困難であるため
 # INonKatsuyoTextとして扱うようにしている
 class FukushiText(INonKatsuyoText):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1096,7 +1466,7 @@ class FukushiText(INonKatsuyoText):
 # 現状、文法的な活用判断が困難であるため
 # INonKatsuyoTextとして扱うようにしている
 class SettoText(INonKatsuyoText):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1107,7 +1477,7 @@ class SettoText(INonKatsuyoText):
 # 現状、文法的な活用判断が困難であるため
 # INonKatsuyoTextとして扱うようにしている
 class KandoushiText(INonKatsuyoText):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1118,7 +1488,7 @@ class KandoushiText(INonKatsuyoText):
 # 現状、文法的な活用判断が困難であるため
 # INonKatsuyoTextとして扱うようにしている
 class SetsuzokuText(INonKatsuyoText):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1130,7 +1500,7 @@ class SetsuzokuText(INonKatsuyoText):
 # 現状、文法的な活用判断が困難であるため
 # INonKatsuyoTextとして扱うようにしている
 class KigoText(INonKatsuyoText):
-    pass
+    __slots__ = ()
 
 
 # ==============================================================================
@@ -1265,18 +1635,20 @@ ALL_KEIJOSHIS = {
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class FukujoshiText(INonKatsuyoText):
     pass
 
 
 class FukujoshiTextAppendant(FukujoshiText, IKatsuyoTextAppendant["FukujoshiText"]):
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> "FukujoshiText":
         assert isinstance(pre, (FixedKatsuyoText, INonKatsuyoText))
         return FukujoshiText(str(pre) + self.gokan)
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class FukujoshiRentaiText(FukujoshiTextAppendant):
     """
     副助詞。終止形につくものをまとめる
@@ -1297,7 +1669,7 @@ class FukujoshiRentaiText(FukujoshiTextAppendant):
             )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class FukujoshiGokanText(FukujoshiTextAppendant):
     """
     副助詞のなかで、形容動詞を語幹で扱うもの
@@ -1320,7 +1692,7 @@ class FukujoshiGokanText(FukujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class FukujoshiTaigenText(FukujoshiTextAppendant):
     """
     副助詞のなかでも活用形を体言的に扱う
@@ -1340,7 +1712,7 @@ class FukujoshiTaigenText(FukujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class FukujoshiKiriText(FukujoshiTextAppendant):
     """
     副助詞のなかでも特殊な活用形である「きり」のクラス
@@ -1422,6 +1794,8 @@ class SetsuzokujoshiText(INonKatsuyoText):
 class SetsuzokujoshiTextAppendant(
     SetsuzokujoshiText, IKatsuyoTextAppendant["SetsuzokujoshiText"]
 ):
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> "SetsuzokujoshiText":
         assert isinstance(pre, (FixedKatsuyoText, INonKatsuyoText))
         return SetsuzokujoshiText(str(pre) + self.gokan)
@@ -1432,6 +1806,8 @@ class SetuzokujoshiTeText(SetsuzokujoshiTextAppendant):
     接続助詞「て」「たって」用のクラス
     """
 
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> "SetsuzokujoshiText":
         if isinstance(pre, FixedKatsuyoText):
             return super().merge(pre)
@@ -1466,6 +1842,8 @@ class SetuzokujoshiDeText(SetsuzokujoshiTextAppendant):
     接続助詞「で」「だって」用のクラス
     """
 
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> "SetsuzokujoshiText":
         if isinstance(pre, FixedKatsuyoText):
             return super().merge(pre)
@@ -1496,7 +1874,7 @@ class SetuzokujoshiDeText(SetsuzokujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class SetsuzokujoshiTomoText(SetsuzokujoshiTextAppendant):
     """
     接続助詞「とも」用のクラス
@@ -1522,7 +1900,7 @@ class SetsuzokujoshiTomoText(SetsuzokujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class SetsuzokujoshiRenyoText(SetsuzokujoshiTextAppendant):
     """
     接続助詞。連用形につくもの
@@ -1544,7 +1922,7 @@ class SetsuzokujoshiRenyoText(SetsuzokujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class SetsuzokujoshiShushiText(SetsuzokujoshiTextAppendant):
     """
     接続助詞。終止形につくもの
@@ -1568,7 +1946,7 @@ class SetsuzokujoshiShushiText(SetsuzokujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class SetsuzokujoshiKateiText(SetsuzokujoshiTextAppendant):
     """
     接続助詞。仮定形につくもの
@@ -1650,18 +2028,20 @@ ALL_SETSUZOKUJOSHIS = {
 # ==============================================================================
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class ShujoshiText(INonKatsuyoText):
     pass
 
 
 class ShujoshiTextAppendant(ShujoshiText, IKatsuyoTextAppendant["ShujoshiText"]):
+    __slots__ = ()
+
     def merge(self, pre: IKatsuyoTextSource) -> "ShujoshiText":
         assert isinstance(pre, (FixedKatsuyoText, INonKatsuyoText))
         return ShujoshiText(str(pre) + self.gokan)
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class ShujoshiYogenText(ShujoshiTextAppendant):
     """
     終助詞。連体形につくもので用言にしか紐づかないものをまとめる
@@ -1684,7 +2064,7 @@ class ShujoshiYogenText(ShujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class ShujoshShushiText(ShujoshiTextAppendant):
     """
     終助詞。終止形につくもの
@@ -1712,7 +2092,7 @@ class ShujoshShushiText(ShujoshiTextAppendant):
         )
 
 
-@attrs.define(frozen=True, slots=False)
+@attrs.define(frozen=True, slots=True)
 class ShujoshiGokanText(ShujoshiTextAppendant):
     """
     終助詞のなかで、形容動詞を語幹で扱うもの
@@ -0,0 +1,141 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+import katsuyo_text.katsuyo_text as kt
+
+# (IKatsuyoTextSourceのクラス, 活用)の組
+Kind = Tuple[Type[kt.IKatsuyoTextSource], Any]
+
+# エラーとなった行のkatsuyo_id
+ERROR_ID = -1
+
+
+class KatsuyoTextBatch:
+    """
+    多数のIKatsuyoTextSourceを列指向で保持するクラス
+
+    語幹(gokans)の列と、(クラス, 活用)の組(kinds)を指す整数(katsuyo_ids)の列で表す。
+    Appendantのaddは活用ごとに一度だけ実行し、その結果(接尾辞と結果の活用)を
+    同じ活用を持つ行へまとめて適用する。
+    addがエラーとなった行はKatsuyoTextErrorを送出せずにerrorsへLazyKatsuyoTextErrorを格納する。
+
+    e.g. (KatsuyoTextBatch.from_sources(srcs) + Hitei()).to_list()
+         == [str(src + Hitei()) for src in srcs]
+    """
+
+    def __init__(
+        self,
+        gokans: Sequence[str],
+        katsuyo_ids: Sequence[int],
+        kinds: Sequence[Kind],
+        errors: Optional[Sequence[Optional[kt.LazyKatsuyoTextError]]] = None,
+    ) -> None:
+        assert len(gokans) == len(katsuyo_ids)
+        self.gokans: List[str] = list(gokans)
+        self.katsuyo_ids: List[int] = list(katsuyo_ids)
+        self.kinds: List[Kind] = list(kinds)
+        self.errors: List[Optional[kt.LazyKatsuyoTextError]] = (
+            [None] * len(self.gokans) if errors is None else list(errors)
+        )
+
+    @classmethod
+    def from_sources(cls, srcs: Iterable[kt.IKatsuyoTextSource]) -> "KatsuyoTextBatch":
+        gokans: List[str] = []
+        katsuyo_ids: List[int] = []
+        ids: Dict[Kind, int] = {}
+        for src in srcs:
+            gokans.append(src.gokan)
+            katsuyo_ids.append(ids.setdefault(_kind_of(src), len(ids)))
+        return cls(gokans, katsuyo_ids, list(ids))
+
+    def __add__(self, post: kt.IKatsuyoTextAppendant) -> "KatsuyoTextBatch":
+        kinds: List[Kind] = []
+        ids: Dict[Kind, int] = {}
+
+        def id_of(kind: Kind) -> int:
+            if (katsuyo_id := ids.get(kind)) is None:
+                katsuyo_id = ids[kind] = len(kinds)
+                kinds.append(kind)
+            return katsuyo_id
+
+        # 活用ごとに一度だけaddの結果を求める
+        # テーブルに載らない(語幹に依存する、エラーとなる)活用はNoneとし行ごとにaddする
+        entries: List[Optional[Tuple[int, str]]] = []
+        for typ, katsuyo in self.kinds:
+            table_entry = kt.SUFFIX_TABLE.lookup(typ, katsuyo, post)
+            if table_entry is None:
+                entries.append(None)
+            else:
+                result_typ, suffix, result_katsuyo = table_entry
+                entries.append((id_of((result_typ, result_katsuyo)), suffix))
+
+        gokans: List[str] = []
+        katsuyo_ids: List[int] = []
+        errors = list(self.errors)
+        for i, (gokan, katsuyo_id) in enumerate(zip(self.gokans, self.katsuyo_ids)):
+            if katsuyo_id == ERROR_ID:
+                gokans.append(gokan)
+                katsuyo_ids.append(ERROR_ID)
+                continue
+
+            entry = entries[katsuyo_id]
+            if entry is not None:
+                result_id, suffix = entry
+                gokans.append(gokan + suffix)
+                katsuyo_ids.append(result_id)
+                continue
+
+            typ, katsuyo = self.kinds[katsuyo_id]
+            result, error = typ(gokan=gokan, katsuyo=katsuyo).try_add(post)
+            if error is not None:
+                gokans.append(gokan)
+                katsuyo_ids.append(ERROR_ID)
+                errors[i] = error
+                continue
+            assert result is not None
+            gokans.append(result.gokan)
+            katsuyo_ids.append(id_of(_kind_of(result)))
+
+        return KatsuyoTextBatch(gokans, katsuyo_ids, kinds, errors)
+
+    @property
+    def mask(self) -> List[bool]:
+        """エラーとなった行をTrueとする"""
+        return [katsuyo_id == ERROR_ID for katsuyo_id in self.katsuyo_ids]
+
+    def to_sources(self) -> List[Optional[kt.IKatsuyoTextSource]]:
+        """エラーとなった行はNoneとする"""
+        result: List[Optional[kt.IKatsuyoTextSource]] = []
+        for gokan, katsuyo_id in zip(self.gokans, self.katsuyo_ids):
+            if katsuyo_id == ERROR_ID:
+                result.append(None)
+                continue
+            typ, katsuyo = self.kinds[katsuyo_id]
+            result.append(typ(gokan=gokan, katsuyo=katsuyo))
+        return result
+
+    def to_list(self) -> List[Optional[str]]:
+        """エラーとなった行はNoneとする"""
+        # IKatsuyoTextSourceの文字列は語幹に活用語尾を連結したものとなるため
+        # 活用語尾のみを(クラス, 活用)ごとに求めておく
+        tails = [str(typ(gokan="", katsuyo=katsuyo)) for typ, katsuyo in self.kinds]
+        return [
+            None if katsuyo_id == ERROR_ID else gokan + tails[katsuyo_id]
+            for gokan, katsuyo_id in zip(self.gokans, self.katsuyo_ids)
+        ]
+
+    def to_numpy(self):
+        """to_listの結果をdtype=objectのnumpy.ndarrayとして返却する"""
+        import numpy
+
+        result = numpy.empty(len(self), dtype=object)
+        result[:] = self.to_list()
+        return result
+
+    def __len__(self) -> int:
+        return len(self.gokans)
+
+
+def _kind_of(src: kt.IKatsuyoTextSource) -> Kind:
+    if isinstance(src, kt.IJodoushiKatsuyoText):
+        # __init__を上書きしているため、gokanとkatsuyoから再生成できるKatsuyoTextとして扱う
+        return (kt.KatsuyoText, src.katsuyo)
+    return (type(src), src.katsuyo)
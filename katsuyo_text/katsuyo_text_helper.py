@@ -1,9 +1,10 @@
 from collections.abc import Callable
-from typing import Optional, Set, Generic, cast
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple, Generic, cast
 import abc
 import sys
 import katsuyo_text.katsuyo as k
 import katsuyo_text.katsuyo_text as kt
+import katsuyo_text.metrics as m
 
 
 class IKatsuyoTextHelper(kt.IKatsuyoTextAppendant, Generic[kt.M]):
@@ -28,14 +29,32 @@ class IKatsuyoTextHelper(kt.IKatsuyoTextAppendant, Generic[kt.M]):
     def merge(self, pre: kt.IKatsuyoTextSource) -> kt.IKatsuyoTextSource:
         result = self.try_merge(pre)
         if result is not None:
+            if m.ENABLED:
+                m.METRICS.inc(m.HELPER_TRY_MERGE, type(self).__name__)
             return result
         if self.bridge is not None:
+            if m.ENABLED:
+                return self._bridge_counted(pre)
             return self.bridge(pre)
 
-        raise kt.KatsuyoTextError(
+        error = kt.KatsuyoTextError(
             f"Unsupported katsuyo_text in merge of {type(self)}: {pre} "
             f"type: {type(pre)} katsuyo: {type(pre.katsuyo)}"
         )
+        if m.ENABLED:
+            m.count_error(error, type(self).__name__)
+        raise error
+
+    def _bridge_counted(self, pre: kt.IKatsuyoTextSource) -> kt.IKatsuyoTextSource:
+        assert self.bridge is not None
+        name = type(self).__name__
+        m.METRICS.inc(m.HELPER_BRIDGE, name)
+        try:
+            return self.bridge(pre)
+        except kt.KatsuyoTextError as e:
+            m.METRICS.inc(m.HELPER_BRIDGE_FAILURE, name)
+            m.count_error(e)
+            raise
 
     @abc.abstractmethod
     def try_merge(self, pre: kt.IKatsuyoTextSource) -> Optional[kt.M]:
@@ -44,6 +63,11 @@ class IKatsuyoTextHelper(kt.IKatsuyoTextAppendant, Generic[kt.M]):
     def __eq__(self, obj):
         return hash(self) == hash(obj)
 
+    def __repr__(self) -> str:
+        # プロセスによらず同じ文字列となるよう、bridgeは名前で表す
+        bridge = None if self.bridge is None else self.bridge.__qualname__
+        return f"{type(self).__name__}(bridge={bridge})"
+
     def __hash__(self):
         return hash(self.__class__.__name__) + hash(self.bridge)
 
@@ -840,3 +864,48 @@ ALL_SETSUZOKUJOSHI_HELPERS: Set[IKatsuyoTextHelper] = {
     TeDe(),
     TatteDatte(),
 }
+
+# ==============================================================================
+# HelperChain
+# ==============================================================================
+
+
+class HelperChain:
+    """
+    同一の活用変形(IKatsuyoTextHelper, IKatsuyoTextAppendantの並び)を
+    多数のIKatsuyoTextSourceへ適用するためのクラス
+
+    e.g. HelperChain([Hitei(), KakoKanryo(), DanteiTeinei()]).apply(src)
+         == src + Hitei() + KakoKanryo() + DanteiTeinei()
+
+    活用変形の結果はsrcの語幹に依存しないため、srcのクラスと活用(katsuyo)ごとに
+    付与する接尾辞と結果の活用(bridgeによる結果を含む)を一度だけ計算して保持する。
+    """
+
+    def __init__(self, appendants: Iterable[kt.IKatsuyoTextAppendant]) -> None:
+        self.appendants: Tuple[kt.IKatsuyoTextAppendant, ...] = tuple(appendants)
+        self._entries: Dict[Tuple[type, Any], Optional[kt.SuffixTableEntry]] = {}
+
+    def apply(self, src: kt.IKatsuyoTextSource) -> kt.IKatsuyoTextSource:
+        key = (type(src), src.katsuyo)
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            entry = kt.compile_suffix_entry(type(src), src.katsuyo, self._merge)
+            self._entries[key] = entry
+
+        if entry is None or entry is kt.UNSUPPORTED_ENTRY:
+            # 語幹に依存する、あるいはエラーとなる場合は都度適用する
+            return self._merge(src)
+
+        typ, suffix, katsuyo = entry
+        return typ(gokan=src.gokan + suffix, katsuyo=katsuyo)
+
+    def apply_many(
+        self, srcs: Iterable[kt.IKatsuyoTextSource]
+    ) -> Iterator[kt.IKatsuyoTextSource]:
+        for src in srcs:
+            yield self.apply(src)
+
+    def _merge(self, src: kt.IKatsuyoTextSource) -> kt.IKatsuyoTextSource:
+        return kt.SUFFIX_TABLE.add_all(src, self.appendants)
@@ -0,0 +1,242 @@
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+import hashlib
+import mmap
+import os
+import struct
+import katsuyo_text.katsuyo_text as kt
+from katsuyo_text.katsuyo_text_paradigm import generate_paradigm
+
+IndexEntry = Tuple[kt.IKatsuyoTextSource, Tuple[kt.IKatsuyoTextAppendant, ...]]
+
+# ファイル形式
+# header: MAGIC, キー数(n), keysの長さ, valuesの長さ, sourcesの数, appendantsの数,
+#         sourcesとappendantsのfingerprint
+# key_offsets: uint32 * (n + 1)   keys内の各キーの開始位置
+# value_offsets: uint32 * (n + 1) values内の各キーに対応するレコードの開始位置
+# keys: 文字列を反転してUTF-8で符号化したキーを昇順に連結したもの
+# values: レコード(source_id: uint32, chainの長さ: uint16, appendant_id: uint16 * 長さ)の並び
+MAGIC = b"KTIDX002"
+HEADER = struct.Struct("<8sIIIII16s")
+RECORD_HEADER = struct.Struct("<IH")
+
+
+class SurfaceIndex:
+    """
+    活用変形した文字列から、元のIKatsuyoTextSourceとaddしたAppendantの並びを引くための索引
+
+    e.g. index = SurfaceIndex.build([KatsuyoText(gokan="行", katsuyo=GODAN_IKU)], helpers, 3)
+         index.longest_suffix("彼は行かなかったです")
+         -> ("行かなかったです", [(行く, (Hitei(), KakoKanryo(), DanteiTeinei()))])
+
+    キーは文字列を反転したものを昇順に並べて保持するため、
+    末尾が一致するキーを二分探索で求められる。
+    ファイルへ保存でき、mmapで読み込んでNLPモデルを用いずに参照できる。
+    sourcesとappendantsは番号で保持するため、読み込む際にも同じ並びで指定すること。
+    作成時と異なる場合は、保存したfingerprintと一致しないためValueErrorを送出する。
+    """
+
+    def __init__(
+        self,
+        buffer: Union[bytes, mmap.mmap],
+        sources: Sequence[kt.IKatsuyoTextSource],
+        appendants: Sequence[kt.IKatsuyoTextAppendant],
+    ) -> None:
+        (
+            magic,
+            n,
+            keys_size,
+            values_size,
+            sources_size,
+            appendants_size,
+            fingerprint,
+        ) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Unsupported index format: {magic!r}")
+        # 番号との対応が作成時と異なるsourcesとappendantsでは、誤った値を引いてしまう
+        sources = list(sources)
+        appendants = list(appendants)
+        if (sources_size, appendants_size, fingerprint) != (
+            len(sources),
+            len(appendants),
+            _fingerprint_of(sources, appendants),
+        ):
+            raise ValueError(
+                "sources or appendants differ from those used to build the index"
+            )
+
+        self._buffer = buffer
+        self._n = n
+        view = memoryview(buffer)
+        offset = HEADER.size
+        offsets_size = 4 * (n + 1)
+        self._key_offsets = view[offset : offset + offsets_size].cast("I")
+        offset += offsets_size
+        self._value_offsets = view[offset : offset + offsets_size].cast("I")
+        offset += offsets_size
+        # キーの比較ではbytesとして切り出すため、buffer上の位置のみを保持する
+        self._keys_offset = offset
+        offset += keys_size
+        self._values = view[offset : offset + values_size]
+
+        self.sources = sources
+        self.appendants = appendants
+
+    @classmethod
+    def build(
+        cls,
+        sources: Iterable[kt.IKatsuyoTextSource],
+        appendants: Iterable[kt.IKatsuyoTextAppendant],
+        depth: int,
+    ) -> "SurfaceIndex":
+        sources = list(sources)
+        appendants = list(appendants)
+        ids = {id(appendant): i for i, appendant in enumerate(appendants)}
+
+        records: List[Tuple[bytes, int, Tuple[int, ...]]] = []
+        for source_id, src in enumerate(sources):
+            records.append((_key_of(str(src)), source_id, ()))
+            for chain, surface in generate_paradigm(src, appendants, depth):
+                chain_ids = tuple(ids[id(appendant)] for appendant in chain)
+                records.append((_key_of(surface), source_id, chain_ids))
+        records.sort()
+
+        keys = bytearray()
+        values = bytearray()
+        key_offsets: List[int] = []
+        value_offsets: List[int] = []
+        prev_key = None
+        for key, source_id, chain_ids in records:
+            if key != prev_key:
+                key_offsets.append(len(keys))
+                value_offsets.append(len(values))
+                keys += key
+                prev_key = key
+            values += RECORD_HEADER.pack(source_id, len(chain_ids))
+            values += struct.pack(f"<{len(chain_ids)}H", *chain_ids)
+        key_offsets.append(len(keys))
+        value_offsets.append(len(values))
+
+        n = len(key_offsets) - 1
+        buffer = b"".join(
+            [
+                HEADER.pack(
+                    MAGIC,
+                    n,
+                    len(keys),
+                    len(values),
+                    len(sources),
+                    len(appendants),
+                    _fingerprint_of(sources, appendants),
+                ),
+                struct.pack(f"<{n + 1}I", *key_offsets),
+                struct.pack(f"<{n + 1}I", *value_offsets),
+                bytes(keys),
+                bytes(values),
+            ]
+        )
+        return cls(buffer, sources, appendants)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        with open(path, "wb") as f:
+            f.write(self._buffer)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, os.PathLike],
+        sources: Sequence[kt.IKatsuyoTextSource],
+        appendants: Sequence[kt.IKatsuyoTextAppendant],
+    ) -> "SurfaceIndex":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, sources, appendants)
+
+    def lookup(self, surface: str) -> List[IndexEntry]:
+        """surfaceと一致するキーの値を返却する。存在しない場合は空のリストを返却する"""
+        i = self._find(_key_of(surface))
+        if i is None:
+            return []
+        return self._entries(i)
+
+    def longest_suffix(self, text: str) -> Optional[Tuple[str, List[IndexEntry]]]:
+        """
+        textの末尾と一致するキーのうち、最も長いものとその値を返却する。
+        一致するキーが存在しない場合はNoneを返却する。
+        """
+        # 短い末尾から順に調べる
+        # ある末尾で始まるキーの範囲[lo, hi)は、それより長い末尾で始まるキーの範囲を含む
+        # 範囲が空になれば、それより長い末尾と一致するキーも存在しない
+        found = None
+        lo, hi = 0, self._n
+        for start in range(len(text) - 1, -1, -1):
+            key = _key_of(text[start:])
+            lo = self._lower_bound(key, lo, hi)
+            # UTF-8は0xffを含まないため、keyで始まるキーはすべてkey + 0xffより小さい
+            hi = self._lower_bound(key + b"\xff", lo, hi)
+            if lo == hi:
+                break
+            if self._key(lo) == key:
+                found = start, lo
+        if found is None:
+            return None
+        start, i = found
+        return text[start:], self._entries(i)
+
+    def _key(self, i: int) -> bytes:
+        offset = self._keys_offset
+        return self._buffer[
+            offset + self._key_offsets[i] : offset + self._key_offsets[i + 1]
+        ]
+
+    def _lower_bound(self, key: bytes, lo: int, hi: int) -> int:
+        # 参照回数が多いため、_keyを呼び出さずに展開している
+        buffer, offsets, base = self._buffer, self._key_offsets, self._keys_offset
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if buffer[base + offsets[mid] : base + offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key: bytes) -> Optional[int]:
+        i = self._lower_bound(key, 0, self._n)
+        if i < self._n and self._key(i) == key:
+            return i
+        return None
+
+    def _entries(self, i: int) -> List[IndexEntry]:
+        result: List[IndexEntry] = []
+        offset = self._value_offsets[i]
+        end = self._value_offsets[i + 1]
+        while offset < end:
+            source_id, size = RECORD_HEADER.unpack_from(self._values, offset)
+            offset += RECORD_HEADER.size
+            chain_ids = struct.unpack_from(f"<{size}H", self._values, offset)
+            offset += 2 * size
+            result.append(
+                (
+                    self.sources[source_id],
+                    tuple(self.appendants[j] for j in chain_ids),
+                )
+            )
+        return result
+
+    def __len__(self) -> int:
+        return self._n
+
+
+def _fingerprint_of(
+    sources: Sequence[kt.IKatsuyoTextSource],
+    appendants: Sequence[kt.IKatsuyoTextAppendant],
+) -> bytes:
+    # 並びも含めて比較するため、reprを順に連結してハッシュ化する
+    digest = hashlib.blake2b(digest_size=16)
+    for obj in [*sources, None, *appendants]:
+        digest.update(repr(obj).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _key_of(surface: str) -> bytes:
+    return surface[::-1].encode("utf-8")
@@ -0,0 +1,79 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Type
+from collections import OrderedDict
+import katsuyo_text.katsuyo_text as kt
+
+Chain = Tuple[kt.IKatsuyoTextAppendant, ...]
+
+# (結果のクラス, gokan, 活用)の組
+State = Tuple[Type[kt.IKatsuyoTextSource], str, Any]
+
+
+def generate_paradigm(
+    src: kt.IKatsuyoTextSource,
+    appendants: Iterable[kt.IKatsuyoTextAppendant],
+    depth: int,
+    max_states: Optional[int] = 2**16,
+) -> Iterator[Tuple[Chain, str]]:
+    """
+    srcへappendantsを最大depth個まで連ねてaddした結果を
+    (addしたAppendantの並び, 文字列)として順に返却する。
+
+    e.g. generate_paradigm(KatsuyoText(gokan="行", katsuyo=GODAN_IKU), [Hitei(), KakoKanryo()], 2)
+         -> ((Hitei(),), "行かない"), ((Hitei(), KakoKanryo()), "行かなかった"), ...
+
+    KatsuyoTextErrorとなる並びはそれ以上辿らない。
+    異なる並びで同じ結果(クラス, gokan, 活用)に至った場合は最初の並びのみを返却し、
+    その先は一度だけ辿る。
+    既出の結果は直近に至ったものから最大max_states件まで保持する。
+    上限を超えて忘れた結果に再び至った場合は、改めて返却して辿る。
+    max_statesにNoneを指定すると上限を設けず、0を指定すると重複を除かない。
+    """
+    if depth <= 0:
+        return
+
+    appendants = tuple(appendants)
+    # 既出の結果ごとに、その先を辿った残りの深さを保持する
+    # より浅い位置で同じ結果に至った場合は、残りの深さが大きいため改めて辿る
+    visited: "OrderedDict[State, int]" = OrderedDict()
+    if max_states != 0:
+        visited[_state_of(src)] = depth
+
+    chain: List[kt.IKatsuyoTextAppendant] = []
+    stack: List[Tuple[kt.IKatsuyoTextSource, Iterator[kt.IKatsuyoTextAppendant]]] = [
+        (src, iter(appendants))
+    ]
+    while stack:
+        pre, posts = stack[-1]
+        post = next(posts, None)
+        if post is None:
+            stack.pop()
+            if chain:
+                chain.pop()
+            continue
+
+        result, error = pre.try_add(post)
+        if error is not None:
+            continue
+        assert result is not None
+
+        state = _state_of(result)
+        remaining = depth - len(stack)
+        seen = state in visited
+        if seen:
+            visited.move_to_end(state)
+            if visited[state] >= remaining:
+                continue
+        if max_states != 0:
+            visited[state] = remaining
+            if max_states is not None and len(visited) > max_states:
+                visited.popitem(last=False)
+
+        if not seen:
+            yield tuple(chain) + (post,), str(result)
+        if remaining > 0:
+            chain.append(post)
+            stack.append((result, iter(appendants)))
+
+
+def _state_of(src: kt.IKatsuyoTextSource) -> State:
+    return (type(src), src.gokan, src.katsuyo)
@@ -0,0 +1,152 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+import contextlib
+import threading
+import types
+
+# Trueの場合のみ数える。数えない場合の処理を増やさないよう、呼び出し側で参照する
+# e.g. if metrics.ENABLED:
+#          METRICS.inc(HELPER_BRIDGE, name)
+ENABLED = False
+
+# カウンタの名前と、(ラベルの名前, 説明)
+SUFFIX_TABLE_HIT = "katsuyo_text_suffix_table_hit_total"
+SUFFIX_TABLE_MISS = "katsuyo_text_suffix_table_miss_total"
+HELPER_TRY_MERGE = "katsuyo_text_helper_try_merge_total"
+HELPER_BRIDGE = "katsuyo_text_helper_bridge_total"
+HELPER_BRIDGE_FAILURE = "katsuyo_text_helper_bridge_failure_total"
+ERROR = "katsuyo_text_error_total"
+DETECTOR_WARNING = "katsuyo_text_detector_warning_total"
+COUNTERS: Dict[str, Tuple[str, str]] = {
+    SUFFIX_TABLE_HIT: ("appendant", "Additions resolved from SuffixTable entries"),
+    SUFFIX_TABLE_MISS: ("appendant", "Additions calling merge outside SuffixTable"),
+    HELPER_TRY_MERGE: ("helper", "Successful try_merge calls in Helper.merge"),
+    HELPER_BRIDGE: ("helper", "Bridge invocations after try_merge returned None"),
+    HELPER_BRIDGE_FAILURE: ("helper", "Bridge invocations raising KatsuyoTextError"),
+    ERROR: ("origin", "KatsuyoTextError by the class or function raising it"),
+    DETECTOR_WARNING: ("detector", "Warnings on unsupported tokens from detectors"),
+}
+
+
+class MetricsRegistry:
+    """
+    COUNTERSのカウンタをラベルの値ごとに保持する
+
+    カウンタはスレッドごとに保持するため、加算する際にロックを必要としない。
+    参照する際に全スレッドのカウンタを合算する。
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # 終了したスレッドのカウンタも合算するため、全スレッドのカウンタを保持する
+        self._shards: List[Dict[Tuple[str, str], int]] = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, label: str, value: int = 1) -> None:
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._counts()
+        key = (name, label)
+        counts[key] = counts.get(key, 0) + value
+
+    def _counts(self) -> Dict[Tuple[str, str], int]:
+        try:
+            return self._local.counts
+        except AttributeError:
+            counts = self._local.counts = {}
+            with self._lock:
+                self._shards.append(counts)
+            return counts
+
+    def inc_all(self, counts: Dict[Tuple[str, str], int]) -> None:
+        """{(カウンタの名前, ラベルの値): 増分}をまとめて加算する"""
+        for (name, label), value in counts.items():
+            self.inc(name, label, value)
+
+    @contextlib.contextmanager
+    def suspended(self) -> Iterator[Dict[Tuple[str, str], int]]:
+        """
+        with内でこのスレッドが加算したカウンタを、集計せずにyieldする辞書へ加算する。
+        結果を求めるための試行など、呼び出しとして数えない処理に用いる。
+        """
+        counts = self._counts()
+        suspended: Dict[Tuple[str, str], int] = {}
+        self._local.counts = suspended
+        try:
+            yield suspended
+        finally:
+            self._local.counts = counts
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """{カウンタの名前: {ラベルの値: 値}}を返却する"""
+        result: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            shards = list(self._shards)
+        for counts in shards:
+            # 他のスレッドが加算中でも、複製は一度に行われる
+            for (name, label), value in dict(counts).items():
+                values = result.setdefault(name, {})
+                values[label] = values.get(label, 0) + value
+        return {name: dict(sorted(result[name].items())) for name in sorted(result)}
+
+    def to_prometheus(self) -> str:
+        """Prometheusのテキスト形式で返却する"""
+        lines: List[str] = []
+        values = self.as_dict()
+        for name, (label_name, help) in COUNTERS.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} counter")
+            for label, value in values.get(name, {}).items():
+                lines.append(f'{name}{{{label_name}="{_escape(label)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            for counts in self._shards:
+                counts.clear()
+
+
+METRICS = MetricsRegistry()
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+
+def origin_of(frame: types.FrameType) -> str:
+    """frameで実行中のメソッドのクラス名、または関数名を返却する"""
+    obj = frame.f_locals.get("self")
+    if obj is not None:
+        return type(obj).__name__
+    return frame.f_code.co_name
+
+
+def error_origin_of(error: BaseException) -> str:
+    """errorを送出したメソッドのクラス名、または関数名を返却する"""
+    tb = error.__traceback__
+    if tb is None:
+        return "unknown"
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return origin_of(tb.tb_frame)
+
+
+def count_error(error: BaseException, origin: Optional[str] = None) -> None:
+    """
+    errorを送出したクラス(または関数)ごとに数える。
+    複数の呼び出し元を伝播するerrorも一度だけ数える。
+    """
+    if getattr(error, "_counted", False):
+        return
+    setattr(error, "_counted", True)
+    METRICS.inc(ERROR, origin or error_origin_of(error))
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,208 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from functools import lru_cache
+from spacy.lang.ja import resolve_pos as resolve_ud_pos
+from spacy.parts_of_speech import NAMES as POS_NAMES  # type: ignore[import]
+from katsuyo_text.katsuyo_text import (
+    KatsuyoTextErrorMessage,
+    KatsuyoTextHasError,
+    IKatsuyoTextAppendant,
+    IKatsuyoTextSource,
+    ALL_FUKUJOSHIS,
+    ALL_SHUJOSHIS,
+    ALL_SETSUZOKUJOSHIS,
+)
+from katsuyo_text.katsuyo_text_helper import (
+    ALL_JODOUSHI_HELPERS,
+    ALL_SETSUZOKUJOSHI_HELPERS,
+)
+from katsuyo_text.attribute_katsuyo_text_detector import (
+    AttributeKatsuyoTextSourceDetector,
+    AttributeKatsuyoTextAppendantDetector,
+)
+import katsuyo_text.metrics as m
+import warnings
+
+
+class MorphemeRecord(NamedTuple):
+    """
+    形態素解析結果の1形態素を表すレコード
+
+    sudachipy.Morphemeの(surface, part_of_speech, dictionary_form, normalized_form)に対応する。
+    同じ並びのtupleであれば、他の形態素解析器の出力からも作成できる。
+    posには解析済みのpos_(UD品詞)を指定でき、Noneの場合はresolve_posで解決する。
+
+    e.g. MorphemeRecord("歩か", ("動詞", "一般", "*", "*", "五段-カ行", "未然形-一般"), "歩く", "歩く")
+    """
+
+    surface: str
+    # 品詞4階層, 活用タイプ, 活用形の6要素
+    part_of_speech: Tuple[str, ...]
+    lemma: str
+    norm: str
+    pos: Optional[str] = None
+
+
+def records_from_sudachi(morphemes) -> List[MorphemeRecord]:
+    """sudachipy.MorphemeListをMorphemeRecordのリストに変換する"""
+    return [
+        MorphemeRecord(
+            m.surface(),
+            tuple(m.part_of_speech()),
+            m.dictionary_form(),
+            m.normalized_form(),
+        )
+        for m in morphemes
+    ]
+
+
+@lru_cache(maxsize=2**12)
+def parse_part_of_speech(
+    part_of_speech: Tuple[str, ...]
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    part_of_speechを(tag_, 活用タイプ, 活用形)に変換する。
+    spacy.lang.ja.JapaneseTokenizerと同じ規則でtag_とInflectionを組み立てる。
+    ref. https://github.com/explosion/spaCy/blob/v3.4.1/spacy/lang/ja/__init__.py#L102
+    """
+    tag = "-".join([xx for xx in part_of_speech[:4] if xx != "*"])
+    inflection = [xx for xx in part_of_speech[4:] if xx != "*"]
+    if not inflection:
+        return tag, None, None
+    return tag, inflection[0], inflection[1]
+
+
+# spacy.lang.ja.resolve_posの結果のうち、ja_ginzaのpos_と異なり
+# AttributeKatsuyoTextAppendantDetectorの判定が変わるものを上書きする
+# e.g. 補助動詞「いる」「しまう」はja_ginzaではVERBとなる
+POS_BY_TAG = {
+    "動詞-非自立可能": "VERB",
+    "接尾辞-形容詞的": "PART",
+}
+# 後続の形態素のtag_との組で上書きする
+# e.g. 「元気そう」の「元気」はja_ginzaではADJとなる
+POS_BY_TAG_BIGRAM: Dict[Tuple[str, Optional[str]], str] = {
+    ("名詞-普通名詞-形状詞可能", "形状詞-助動詞語幹"): "ADJ",
+}
+
+
+def resolve_pos(records: Sequence[MorphemeRecord]) -> List[str]:
+    """
+    recordsの各形態素に対するpos_(UD品詞)を返却する。
+    spacy.lang.ja.JapaneseTokenizerと同じく、後続の形態素のtag_を参照して解決し、
+    POS_BY_TAG, POS_BY_TAG_BIGRAMで上書きする。
+    """
+    tags = [parse_part_of_speech(tuple(record[1]))[0] for record in records]
+    poses: List[str] = []
+    next_pos = None
+    for i, record in enumerate(records):
+        tag = tags[i]
+        next_tag = tags[i + 1] if i + 1 < len(tags) else None
+        if next_pos:
+            pos, next_pos = next_pos, None
+        else:
+            pos, next_pos = resolve_ud_pos(record[0], tag, next_tag)
+        poses.append(
+            _pos_of(record)
+            or POS_BY_TAG_BIGRAM.get((tag, next_tag))
+            or POS_BY_TAG.get(tag)
+            or POS_NAMES[pos]
+        )
+    return poses
+
+
+def with_pos(records: Sequence[MorphemeRecord]) -> List[MorphemeRecord]:
+    """posが指定されていないrecordsに、resolve_posで解決したposを指定して返却する"""
+    if all(_pos_of(record) for record in records):
+        return list(records)
+    return [
+        MorphemeRecord(*record[:4], pos=pos)
+        for record, pos in zip(records, resolve_pos(records))
+    ]
+
+
+def _pos_of(record: MorphemeRecord) -> Optional[str]:
+    # posを含まない4要素のtupleも受け付ける
+    return record[4] if len(record) > 4 else None
+
+
+class MorphemeKatsuyoTextSourceDetector(AttributeKatsuyoTextSourceDetector):
+    """
+    MorphemeRecordからIKatsuyoTextSourceを検出する
+
+    検出の規則はSpacyKatsuyoTextSourceDetectorと共有し、
+    係り受け解析などのspaCyのモデルを必要としない。
+    """
+
+    def try_detect(self, src: MorphemeRecord) -> Optional[IKatsuyoTextSource]:
+        surface, part_of_speech, lemma, norm = src[:4]
+        tag, conjugation_type, _ = parse_part_of_speech(tuple(part_of_speech))
+        return self._try_detect_attributes(tag, lemma, norm, conjugation_type, surface)
+
+
+class MorphemeKatsuyoTextAppendantDetector(AttributeKatsuyoTextAppendantDetector):
+    """
+    MorphemeRecordの並びからIKatsuyoTextAppendantを検出する
+
+    検出の規則はSpacyKatsuyoTextAppendantDetectorと共有し、
+    係り受け解析などのspaCyのモデルを必要としない。
+    「そう」の判別に左隣の形態素を参照するため、候補は(records, index)の組で指定する。
+    pos_の解決には文全体を参照するため、try_detectにはwith_posでposを指定したrecordsを用いること。
+    """
+
+    def detect_from_sent(
+        self, sent: Sequence[MorphemeRecord], src: int
+    ) -> Tuple[List[IKatsuyoTextAppendant], KatsuyoTextHasError]:
+        assert 0 <= src < len(sent)
+
+        appendants: List[IKatsuyoTextAppendant] = []
+        has_error = False
+
+        # NOTE: SpacyKatsuyoTextAppendantDetectorと同じく、srcのindex以降の形態素すべてを見る
+        records = with_pos(sent)
+        for i in range(src + 1, len(records)):
+            appendant, warning_msg = self.try_detect((records, i))
+            if warning_msg:
+                has_error = True
+                if m.ENABLED:
+                    m.METRICS.inc(m.DETECTOR_WARNING, type(self).__name__)
+                warnings.warn(
+                    f"{warning_msg} src: {sent[src][0]} "
+                    f"sent: {''.join(record[0] for record in sent)}",
+                    UserWarning,
+                )
+            if appendant is None:
+                continue
+            appendants.append(appendant)
+
+        return appendants, KatsuyoTextHasError(has_error)
+
+    def try_detect(
+        self, candidate: Tuple[Sequence[MorphemeRecord], int]
+    ) -> Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]:
+        records, i = candidate
+        # 形態素ごとに文全体のposを解決しないよう、解決済みのrecordsのみ受け付ける
+        pos = _pos_of(records[i])
+        if pos is None:
+            raise ValueError(f"pos is not resolved: {records[i]}. Use with_pos")
+        _, part_of_speech, lemma, norm = records[i][:4]
+        tag, _, _ = parse_part_of_speech(tuple(part_of_speech))
+        left = None
+        if norm == "そう":
+            # SpacyKatsuyoTextAppendantDetectorと同じく、先頭の左隣は末尾とする
+            left_surface, left_part_of_speech = records[i - 1][:2]
+            left_pos = _pos_of(records[i - 1])
+            if left_pos is None:
+                raise ValueError(f"pos is not resolved: {records[i - 1]}. Use with_pos")
+            left_tag, _, left_conjugation_form = parse_part_of_speech(
+                tuple(left_part_of_speech)
+            )
+            left = (left_pos, left_tag, left_surface, left_conjugation_form)
+        return self._detect_cached(pos, tag, norm, lemma, left)
+
+
+ALL_APPENDANTS_DETECTOR = MorphemeKatsuyoTextAppendantDetector(
+    helpers=ALL_JODOUSHI_HELPERS | ALL_SETSUZOKUJOSHI_HELPERS,
+    fukujoshis=ALL_FUKUJOSHIS,
+    setsuzokujoshis=ALL_SETSUZOKUJOSHIS,
+    shujoshis=ALL_SHUJOSHIS,
+)
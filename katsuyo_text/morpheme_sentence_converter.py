@@ -0,0 +1,79 @@
+from typing import Optional, Dict, Iterable, List, Sequence, Tuple
+from itertools import accumulate
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    MorphemeRecord,
+    MorphemeKatsuyoTextSourceDetector,
+    parse_part_of_speech,
+    with_pos,
+    ALL_APPENDANTS_DETECTOR,
+)
+from katsuyo_text.katsuyo_text_helper import (
+    IJodoushiHelper,
+)
+from katsuyo_text.katsuyo_text import (
+    IKatsuyoTextAppendant,
+)
+from katsuyo_text.sentence_converter import (
+    TokenSentenceConverter,
+)
+
+
+class MorphemeTokens(List[MorphemeRecord]):
+    """
+    posを指定したMorphemeRecordの並びと、表層形を連結した文字列を保持する
+    """
+
+    def __init__(self, records: Iterable[MorphemeRecord]) -> None:
+        super().__init__(records)
+        self.text = "".join(record[0] for record in self)
+        # text内のi番目の形態素の開始位置。末尾にはtextの長さを含む
+        self.offsets = [0, *accumulate(len(record[0]) for record in self)]
+
+
+class MorphemeSentenceConverter(TokenSentenceConverter[MorphemeTokens]):
+    """
+    MorphemeRecordの並びを変換する
+
+    e.g. MorphemeSentenceConverter(convertions_dict).convert(
+             records_from_sudachi(tokenizer.tokenize("歩いた"))
+         )
+    """
+
+    def __init__(
+        self,
+        convertions_dict: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]],
+    ):
+        super().__init__(
+            convertions_dict,
+            src_detector=MorphemeKatsuyoTextSourceDetector(),
+            all_apd_detector=ALL_APPENDANTS_DETECTOR,
+        )
+
+    def tokens(self, sent: Sequence[MorphemeRecord]) -> MorphemeTokens:
+        # pos_の解決と開始位置の計算を文ごとに一度で済ませる
+        return MorphemeTokens(with_pos(sent))
+
+    def text_of(self, tokens: MorphemeTokens) -> str:
+        return tokens.text
+
+    def span_of(self, tokens: MorphemeTokens, i: int) -> Tuple[int, int]:
+        return tokens.offsets[i], tokens.offsets[i + 1]
+
+    def source_candidate(self, tokens: MorphemeTokens, i: int) -> MorphemeRecord:
+        return tokens[i]
+
+    def appendant_candidate(
+        self, tokens: MorphemeTokens, i: int
+    ) -> Tuple[List[MorphemeRecord], int]:
+        return tokens, i
+
+    def conjugation_of(
+        self, tokens: MorphemeTokens, i: int
+    ) -> Tuple[Optional[str], str]:
+        _, _, conjugation_form = parse_part_of_speech(tuple(tokens[i][1]))
+        return conjugation_form, tokens[i][2]
+
+    def describe(self, tokens: MorphemeTokens, i: int) -> str:
+        tag, _, _ = parse_part_of_speech(tuple(tokens[i][1]))
+        sent = self.text_of(tokens)
+        return f"{tokens[i][0]} tag: {tag} sent: {sent}"
@@ -1,12 +1,57 @@
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+from katsuyo_text.katsuyo import KatsuyoForm
 from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    KatsuyoTextError,
     IKatsuyoTextAppendant,
+    IKatsuyoTextSource,
+    FixedKatsuyoText,
+    LazyKatsuyoTextError,
+    SUFFIX_TABLE,
 )
 from katsuyo_text.katsuyo_text_helper import (
     IJodoushiHelper,
+    Ukemi,
+    Shieki,
+    Hitei,
+    KibouSelf,
+    KibouOthers,
+    KakoKanryo,
+    Youtai,
+    Denbun,
+    Suitei,
+    Touzen,
+    HikyoReizi,
+    Dantei,
+    DanteiTeinei,
+    Teinei,
+    Keizoku,
+)
+from katsuyo_text.katsuyo_text_detector import (
+    IKatsuyoTextSourceDetector,
+    IKatsuyoTextAppendantDetector,
 )
+from katsuyo_text.stage_timer import StageTimer
 import abc
+import contextlib
+import re
 
 
 class ISentenceConverter(abc.ABC):
@@ -24,3 +69,500 @@ class ISentenceConverter(abc.ABC):
     @abc.abstractmethod
     def convert(self, sent: Any) -> str:
         raise NotImplementedError()
+
+    def try_convert(
+        self, sent: Any
+    ) -> Tuple[Optional[str], Optional[LazyKatsuyoTextError]]:
+        """
+        convertと同様の結果を返却する。
+        変換できない場合はKatsuyoTextErrorを送出せずにLazyKatsuyoTextErrorを返却する。
+        """
+        try:
+            return self.convert(sent), None
+        except KatsuyoTextError as e:
+            return None, LazyKatsuyoTextError(str, e)
+
+
+class TextEdit(NamedTuple):
+    """文字列のstartからendまでをreplacementに置換する"""
+
+    start: int
+    end: int
+    replacement: str
+
+
+def apply_edits(text: str, edits: Iterable[TextEdit]) -> str:
+    """
+    textへeditsを適用した文字列を返却する。
+    editsは位置の昇順に並び、互いに重ならないこと。
+    """
+    result: List[str] = []
+    pos = 0
+    for start, end, replacement in edits:
+        assert pos <= start <= end, f"Unsorted or overlapped edit: {start}-{end}"
+        result.append(text[pos:start])
+        result.append(replacement)
+        pos = end
+    if not result:
+        return text
+    result.append(text[pos:])
+    return "".join(result)
+
+
+class Tokens(Protocol):
+    """TokenSentenceConverterが扱うトークンの並び"""
+
+    def __len__(self) -> int:
+        ...
+
+    def __getitem__(self, __i: int) -> Any:
+        ...
+
+
+T = TypeVar("T", bound=Tokens)
+
+
+class SentenceAnalysis(NamedTuple):
+    """TokenSentenceConverter.analyzeの結果"""
+
+    # TokenSentenceConverter.tokensの返却値
+    tokens: Any
+    text: str
+    # 各トークンをAppendantとして検出した結果。先頭のトークンは常にNone
+    appendants: List[Optional[IKatsuyoTextAppendant]]
+    # Sourceとして検出した結果をトークンの位置ごとに保持する
+    sources: Dict[int, Optional[IKatsuyoTextSource]]
+
+
+class TokenSentenceConverter(ISentenceConverter, Generic[T]):
+    """
+    トークンの並びからHelperを探し、任意のAppendantに変換する。
+
+    変換の手順はトークンの表現に依存しないため、トークンの取り出し方のみをサブクラスで実装する。
+    各メソッドのtokensはtokens(sent)の返却値(T)であり、iはその中の位置を表す。
+    """
+
+    # 以下からleft-id.def(right-id.def)を取得し、活用形を参照して作成
+    # ref. https://ja.osdn.net/projects/unidic/downloads/58338/unidic-mecab-2.1.2_src.zip/
+    # 必要に応じて以下の辞書も参照
+    # ref. http://sudachi.s3-website-ap-northeast-1.amazonaws.com/sudachidict-raw/20221021/small_lex.zip
+    MIZEN_FORMS: Set[str] = {
+        "未然形-一般",
+        # 活用変形の一であるため一般変形として扱える
+        "未然形-撥音便",
+        # 文語のみであり置き換えられることは稀。現状対応していない
+        # "未然形-補助",
+        # サ行変格のみであり置き換えられることは稀。現状対応していない
+        # "未然形-サ",
+        # サ行変格のみであり置き換えられることは稀。現状対応していない
+        # "未然形-セ",
+    }
+    RENYO_FORMS: Set[str] = {
+        "連用形-一般",
+        "連用形-撥音便",
+        "連用形-促音便",
+        # 活用変形の一種であるため一般変形として扱える
+        "連用形-イ音便",
+        # 助動詞-ダと文語助動詞-ズと文語助動詞-ナリ-断定に表れる
+        # 形容動詞のrenyoMixinは「に」としており対応可能
+        "連用形-ニ",
+        # 文語のみであり置き換えられることは稀。現状対応していない
+        # "連用形-補助",
+        # 特殊な活用形であるため現状対応していない
+        # "連用形-ウ音便",
+        # 特殊な活用形であるため現状対応していない
+        # "連用形-融合",
+        # 文語助動詞-タリ-断定のみ。現状対応していない
+        # "連用形-ト",
+    }
+    SHUSHI_FORMS: Set[str] = {
+        "終止形-一般",
+        # 助動詞「ぬ」の変形である可能性が否めず、識別困難であるため現状対応していない
+        # "終止形-撥音便",
+        # 口語による変形であるため一般変形として扱える
+        "連用形-促音便",
+        # 口語による変形であるため一般変形として扱える
+        "終止形-融合",
+        # 文語の特殊な活用形であるため現状対応していない
+        # "終止形-ウ音便",
+        # 文語の特殊な活用形であるため現状対応していない
+        # "終止形-補助",
+    }
+    RENTAI_FORMS: Set[str] = {
+        "連体形-一般",
+        # 助動詞「ぬ」の変形である可能性が否めず、識別困難であるため現状対応していない
+        # "連体形-撥音便",
+        # 口語による変形であるため一般変形として扱える
+        "連体形-省略",
+        # 文語の特殊な活用形であるため現状対応していない
+        # "連体形-ウ音便",
+        # 文語の特殊な活用形であるため現状対応していない
+        # "連体形-イ音便",
+        # 文語の特殊な活用形であるため現状対応していない
+        # "連体形-補助",
+    }
+    KATEI_FORMS: Set[str] = {
+        "仮定形-一般",
+        # 特殊な活用形であるため現状対応していない
+        # "仮定形-融合",
+    }
+    MEIREI_FORMS: Set[str] = {
+        "命令形",
+    }
+    # 活用形の文字列からKatsuyoFormを一度の参照で求める
+    # 複数に含まれる活用形(e.g. 連用形-促音便)は先に判定するものを優先する
+    # 例外パターンは概ねHelperで対応
+    # KatsuyoForm.MIZEN_U, MIZEN_RERU, MIZEN_RARERU, RENYO_TA, RENYO_NAI
+    KATSUYO_FORM_BY_CONJUGATION_FORM: Dict[str, KatsuyoForm] = {
+        **dict.fromkeys(MEIREI_FORMS, KatsuyoForm.MEIREI),
+        **dict.fromkeys(KATEI_FORMS, KatsuyoForm.KATEI),
+        **dict.fromkeys(RENTAI_FORMS, KatsuyoForm.RENTAI),
+        **dict.fromkeys(SHUSHI_FORMS, KatsuyoForm.SHUSHI),
+        **dict.fromkeys(RENYO_FORMS, KatsuyoForm.RENYO),
+        **dict.fromkeys(MIZEN_FORMS, KatsuyoForm.MIZEN),
+    }
+    # Helperとして検出されるトークンの表層形に必ず含まれる文字列
+    # 口語の変形(e.g. 「っす」「っしょ」->「です」、「ん」「にゃ」->「ず」)も含める
+    # 含まれない文章は解析せずにそのまま返却できる
+    SURFACE_TRIGGERS: Dict[Type[IJodoushiHelper], Tuple[str, ...]] = {
+        Ukemi: ("れ",),
+        Shieki: ("せ", "さ"),
+        Hitei: ("な", "ね", "ず", "ぬ", "ん", "ざ", "にゃ"),
+        KibouSelf: ("た",),
+        KibouOthers: ("た",),
+        KakoKanryo: ("た", "だ"),
+        Youtai: ("そ",),
+        Denbun: ("そ",),
+        Suitei: ("らし",),
+        Touzen: ("べ",),
+        HikyoReizi: ("よ", "様"),
+        Dantei: ("だ", "で", "な", "に", "じゃ"),
+        DanteiTeinei: ("で", "す", "しょ"),
+        Teinei: ("ま",),
+        Keizoku: ("て", "で"),
+    }
+    # timedで計測する段階と、その処理を行う属性
+    STAGES: Dict[str, str] = {
+        "detect_appendant": "_detect_appendant",
+        "detect_source": "_detect_source",
+        "merge": "_merge",
+        "bridge": "_try_bridge_by_form",
+        "emit": "try_emit_edits",
+        "assemble": "_assemble",
+    }
+
+    def __init__(
+        self,
+        convertions_dict: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]],
+        src_detector: IKatsuyoTextSourceDetector,
+        all_apd_detector: IKatsuyoTextAppendantDetector,
+    ) -> None:
+        # validate helpers
+        for helper in convertions_dict:
+            if not isinstance(helper, all_apd_detector.SUPPORTED_HELPERS):
+                raise ValueError(f"Unsupported appendant helper: {helper}")
+        self.src_detector = src_detector
+        # 変換対象のHelperと、それに続くAppendantをすべて検出する
+        self.all_apd_detector = all_apd_detector
+        super().__init__(convertions_dict)
+        self.trigger_pattern = self._compile_trigger_pattern()
+        # needs_parseにより解析した、解析を省略した文章の数
+        self.parsed = 0
+        self.skipped = 0
+        # timedで計測する処理。計測しない場合は元の関数を直接呼び出す
+        self._detect_appendant = all_apd_detector.try_detect
+        self._detect_source = src_detector.try_detect
+        self._merge = SUFFIX_TABLE.try_add_all
+        self._assemble = apply_edits
+
+    @contextlib.contextmanager
+    def timed(self, timer: Optional[StageTimer] = None) -> Iterator[StageTimer]:
+        """
+        withの間、STAGESの各処理の時間をtimerで計測する。
+        emitは、detect_source, merge, bridgeの時間を含む。
+        """
+        if timer is None:
+            timer = StageTimer()
+        # インスタンスの属性で置き換え、終了時に元に戻す
+        saved = {name: self.__dict__.get(name) for name in self.STAGES.values()}
+        for stage, name in self.STAGES.items():
+            setattr(self, name, timer.wrap(stage, getattr(self, name)))
+        try:
+            yield timer
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    delattr(self, name)
+                else:
+                    setattr(self, name, value)
+
+    def _compile_trigger_pattern(self) -> Optional[Pattern[str]]:
+        triggers: Set[str] = set()
+        for helper in self.convertions_dict:
+            found = [
+                surfaces
+                for typ, surfaces in self.SURFACE_TRIGGERS.items()
+                if isinstance(helper, typ)
+            ]
+            if not found:
+                # 表層形が不明なHelperを含む場合は、常に解析する
+                return None
+            for surfaces in found:
+                triggers.update(surfaces)
+        if not triggers:
+            return None
+        return re.compile("|".join(map(re.escape, sorted(triggers))))
+
+    def needs_parse(self, text: str) -> bool:
+        """
+        textが変換対象のHelperを含み得る場合にTrueを返却する。
+        Falseの場合、textは変換されないため解析を省略できる。
+        """
+        if self.trigger_pattern is None or self.trigger_pattern.search(text):
+            self.parsed += 1
+            return True
+        self.skipped += 1
+        return False
+
+    @abc.abstractmethod
+    def tokens(self, sent: Any) -> T:
+        """sentをトークンの並びとして返却する"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def text_of(self, tokens: T) -> str:
+        """tokens全体の文字列(トークン間と末尾の空白を含む)を返却する"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def span_of(self, tokens: T, i: int) -> Tuple[int, int]:
+        """text_ofの文字列における、トークンの(開始位置, 終了位置)を返却する"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def source_candidate(self, tokens: T, i: int) -> Any:
+        """src_detector.try_detectに渡す値を返却する"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def appendant_candidate(self, tokens: T, i: int) -> Any:
+        """all_apd_detector.try_detectに渡す値を返却する"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def conjugation_of(self, tokens: T, i: int) -> Tuple[Optional[str], str]:
+        """(活用形, lemma)を返却する。活用形がない場合はNoneとする"""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def describe(self, tokens: T, i: int) -> str:
+        """エラーメッセージに含めるトークンの説明を返却する"""
+        raise NotImplementedError()
+
+    def _try_bridge_by_form(
+        self,
+        pre: KatsuyoText,
+        tokens: T,
+        i: int,
+    ) -> Tuple[Optional[FixedKatsuyoText], Optional[LazyKatsuyoTextError]]:
+        """
+        前トークンの活用形からKatsuyoTextを生成する
+        """
+
+        conjugation_form, lemma = self.conjugation_of(tokens, i)
+        if conjugation_form is None:
+            # 活用形がなく、preがKatsuyoTextである場合には、活用形を推測できないためエラーに
+            return None, LazyKatsuyoTextError(
+                lambda: (
+                    f"Unsupported katsuyo_text in merge of: {pre} "
+                    f"type: {type(pre)} katsuyo: {type(pre.katsuyo)} "
+                    f"prev: {self.describe(tokens, i)} "
+                )
+            )
+
+        # 特殊対応 否定「ぬ」
+        if conjugation_form == "終止形-撥音便" and lemma == "ぬ":
+            form: Optional[KatsuyoForm] = KatsuyoForm.SHUSHI
+        else:
+            form = self.KATSUYO_FORM_BY_CONJUGATION_FORM.get(conjugation_form)
+        fkt = None if form is None else pre.as_form(form)
+
+        if fkt is None:
+            return None, LazyKatsuyoTextError(
+                lambda: (
+                    f"Unsupported katsuyo_form: {conjugation_form} "
+                    f"pre: {pre} type: {type(pre)} katsuyo: {type(pre.katsuyo)}"
+                )
+            )
+
+        return fkt, None
+
+    def _try_flush(
+        self,
+        pre: IKatsuyoTextSource,
+        appendants: List[IKatsuyoTextAppendant],
+        tokens: T,
+        text: str,
+        start: int,
+        end: int,
+    ) -> Tuple[Optional[TextEdit], Optional[LazyKatsuyoTextError]]:
+        """
+        preへappendantsをまとめてaddし、前トークン(end)の活用形に変形した文字列で
+        トークンstartからendまでを置換するTextEditを返却する。
+        変換前と同じ文字列となる場合はNoneを返却する。
+        """
+        result, error = self._merge(pre, appendants)
+        if error is not None:
+            return None, error
+        if isinstance(result, KatsuyoText):
+            result, error = self._try_bridge_by_form(result, tokens, end)
+            if error is not None:
+                return None, error
+        char_start, _ = self.span_of(tokens, start)
+        _, char_end = self.span_of(tokens, end)
+        replacement = str(result)
+        if text[char_start:char_end] == replacement:
+            return None, None
+        return TextEdit(char_start, char_end, replacement), None
+
+    def convert(self, sent: Any) -> str:
+        result, error = self.try_convert(sent)
+        if error is not None:
+            raise error.to_error()
+        assert result is not None
+        return result
+
+    def try_convert(
+        self, sent: Any
+    ) -> Tuple[Optional[str], Optional[LazyKatsuyoTextError]]:
+        analysis = self.analyze(sent)
+        edits, error = self.try_emit_edits(analysis)
+        if error is not None:
+            return None, error
+        assert edits is not None
+        return self._assemble(analysis.text, edits), None
+
+    def try_convert_edits(
+        self, sent: Any
+    ) -> Tuple[Optional[List[TextEdit]], Optional[LazyKatsuyoTextError]]:
+        """
+        変換結果を、sentの文字列に対するTextEditの並びとして返却する。
+        TextEditは位置の昇順に並び、互いに重ならない。
+        """
+        return self.try_emit_edits(self.analyze(sent))
+
+    def try_convert_many(
+        self,
+        sent: Any,
+        convertions_dicts: Sequence[
+            Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]]
+        ],
+    ) -> List[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]]:
+        """
+        sentを一度だけ解析し、convertions_dictsのそれぞれで変換した結果を返却する
+        """
+        analysis = self.analyze(sent)
+        results: List[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]] = []
+        for convertions_dict in convertions_dicts:
+            edits, error = self.try_emit_edits(analysis, convertions_dict)
+            if error is not None:
+                results.append((None, error))
+                continue
+            assert edits is not None
+            results.append((self._assemble(analysis.text, edits), None))
+        return results
+
+    def analyze(self, sent: Any) -> SentenceAnalysis:
+        """
+        sentの各トークンをAppendantとして検出する。
+        結果はconvertions_dictによらず、try_emit_editsで共有できる。
+        """
+        tokens = self.tokens(sent)
+        appendants: List[Optional[IKatsuyoTextAppendant]] = [None]
+        # 変換対象のHelperはall_apd_detectorの検出結果から型で引くため、
+        # convertions_dictごとの検出は行わない
+        for i in range(1, len(tokens)):
+            kt, _ = self._detect_appendant(self.appendant_candidate(tokens, i))
+            appendants.append(kt)
+        return SentenceAnalysis(tokens, self.text_of(tokens), appendants, {})
+
+    def _source_of(
+        self, analysis: SentenceAnalysis, i: int
+    ) -> Optional[IKatsuyoTextSource]:
+        # 変換対象により起点となるトークンが異なるため、必要になった位置のみ検出する
+        if i not in analysis.sources:
+            analysis.sources[i] = self._detect_source(
+                self.source_candidate(analysis.tokens, i)
+            )
+        return analysis.sources[i]
+
+    def try_emit_edits(
+        self,
+        analysis: SentenceAnalysis,
+        convertions_dict: Optional[
+            Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]]
+        ] = None,
+    ) -> Tuple[Optional[List[TextEdit]], Optional[LazyKatsuyoTextError]]:
+        """
+        analysisをconvertions_dictで変換したTextEditの並びを返却する。
+        convertions_dictがNoneの場合はself.convertions_dictを用いる。
+        """
+        if convertions_dict is None:
+            convertions_dict = self.convertions_dict
+        # IKatsuyoTextAppendantDetector.try_get_helperと同じく、
+        # 検出したAppendantの型で変換対象のHelperを引く
+        helpers: Dict[type, IJodoushiHelper] = {
+            type(helper): helper for helper in convertions_dict
+        }
+
+        tokens, text, detected, _ = analysis
+        # 変換しないトークンは複製せず、変換したトークンの範囲のみを保持する
+        edits: List[TextEdit] = []
+        prev_kt = None
+        # prev_ktを検出したトークンの位置
+        src = 0
+        # prev_ktへaddするAppendantはまとめてaddし、語幹の複製を一度で済ませる
+        appendants: List[IKatsuyoTextAppendant] = []
+        # 2番目のトークンから、前トークン(prev)との組で判定する
+        for i in range(1, len(tokens)):
+            prev = i - 1
+            kt = detected[i]
+
+            if prev_kt is None:
+                helper = None if kt is None else helpers.get(type(kt))
+                if helper is None:
+                    continue
+                prev_kt = self._source_of(analysis, prev)
+                if prev_kt is None:
+                    return None, LazyKatsuyoTextError(
+                        lambda: f"Unsupported token: {self.describe(tokens, prev)}"
+                    )
+                src = prev
+                convert_kt = convertions_dict[helper]
+                if convert_kt is not None:
+                    appendants.append(convert_kt)
+                continue
+
+            if kt is None:
+                edit, error = self._try_flush(
+                    prev_kt, appendants, tokens, text, src, prev
+                )
+                if error is not None:
+                    return None, error
+                if edit is not None:
+                    edits.append(edit)
+                prev_kt = None
+                appendants = []
+                continue
+
+            appendants.append(kt)
+
+        if prev_kt is not None:
+            last = len(tokens) - 1
+            edit, error = self._try_flush(prev_kt, appendants, tokens, text, src, last)
+            if error is not None:
+                return None, error
+            if edit is not None:
+                edits.append(edit)
+
+        return edits, None
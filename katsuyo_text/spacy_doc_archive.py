@@ -0,0 +1,64 @@
+from typing import Iterable, Iterator, List, Sequence, Union
+from pathlib import Path
+import os
+import spacy
+from spacy.tokens import Doc, DocBin
+
+# SpacySentenceConverterが参照する属性
+# 空白(SPACY)はDocBinが常に保存する
+DOC_ATTRS = ("ORTH", "NORM", "TAG", "LEMMA", "MORPH", "POS", "SENT_START")
+SHARD_SUFFIX = ".spacy"
+
+
+def save_docs(
+    docs: Iterable[Doc],
+    directory: Union[str, os.PathLike],
+    shard_size: int = 1000,
+    attrs: Sequence[str] = DOC_ATTRS,
+) -> List[Path]:
+    """
+    解析済みのdocsを、shard_size件ごとのDocBinとしてdirectoryへ保存する。
+    保存したファイルのパスを、docsと同じ順に並べて返却する。
+
+    e.g. save_docs(nlp.pipe(texts), "corpus")
+         -> [Path("corpus/00000.spacy"), Path("corpus/00001.spacy"), ...]
+    """
+    assert shard_size > 0
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths: List[Path] = []
+    doc_bin = DocBin(attrs=attrs)
+    for doc in docs:
+        doc_bin.add(doc)
+        if len(doc_bin) == shard_size:
+            paths.append(_save_shard(doc_bin, directory, len(paths)))
+            doc_bin = DocBin(attrs=attrs)
+    if len(doc_bin) > 0:
+        paths.append(_save_shard(doc_bin, directory, len(paths)))
+    return paths
+
+
+def _save_shard(doc_bin: DocBin, directory: Path, i: int) -> Path:
+    # ファイル名の昇順がdocsの順となるよう、番号を0埋めする
+    path = directory / f"{i:05d}{SHARD_SUFFIX}"
+    doc_bin.to_disk(path)
+    return path
+
+
+def list_shards(directory: Union[str, os.PathLike]) -> List[Path]:
+    """save_docsで保存したファイルのパスを、保存した順に並べて返却する"""
+    return sorted(Path(directory).glob(f"*{SHARD_SUFFIX}"))
+
+
+def load_docs(
+    paths: Iterable[Union[str, os.PathLike]], vocab: spacy.vocab.Vocab
+) -> Iterator[Doc]:
+    """
+    pathsのDocBinからDocを順に復元する。
+    ファイルは1件ずつ読み込み、Docは参照されるまで復元しない。
+    vocabには解析に用いたnlp.vocabを指定すること。
+    """
+    for path in paths:
+        doc_bin = DocBin().from_disk(Path(path))
+        yield from doc_bin.get_docs(vocab)
@@ -1,269 +1,77 @@
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
+from collections import Counter
 from itertools import dropwhile
-from katsuyo_text.katsuyo import (
-    GODAN_BA_GYO,
-    GODAN_GA_GYO,
-    GODAN_IKU,
-    GODAN_KA_GYO,
-    GODAN_MA_GYO,
-    GODAN_NA_GYO,
-    GODAN_RA_GYO,
-    GODAN_SA_GYO,
-    GODAN_TA_GYO,
-    GODAN_WAA_GYO,
-    KAMI_ICHIDAN,
-    KEIYOUSHI,
-    SA_GYO_HENKAKU_SURU,
-    SA_GYO_HENKAKU_ZURU,
-    SHIMO_ICHIDAN,
-)
 from katsuyo_text.katsuyo_text import (
     KatsuyoTextErrorMessage,
     KatsuyoTextHasError,
     IKatsuyoTextAppendant,
     IKatsuyoTextSource,
-    KatsuyoText,
-    TaigenText,
-    FukushiText,
-    SettoText,
-    KandoushiText,
-    SetsuzokuText,
-    KigoText,
-    KakujoshiText,
-    KeijoshiText,
-    FukujoshiText,
-    SetsuzokujoshiText,
-    ShujoshiText,
-    JuntaijoshiText,
-    KURU,
-    KURU_KANJI,
     ALL_FUKUJOSHIS,
     ALL_SHUJOSHIS,
     ALL_SETSUZOKUJOSHIS,
-    JODOUSHI_RERU,
-    JODOUSHI_RARERU,
-    JODOUSHI_NAI,
-    JODOUSHI_TAI,
-    JODOUSHI_TA,
-    JODOUSHI_DA_DANTEI,
-    JODOUSHI_DA_KAKO_KANRYO,
-    JODOUSHI_RASHII,
-    JODOUSHI_BEKIDA,
-    JODOUSHI_DESU,
-    JODOUSHI_MASU,
 )
+import katsuyo_text.metrics as m
 from katsuyo_text.katsuyo_text_helper import (
-    Denbun,
-    HikyoReizi,
-    Hitei,
-    KakoKanryo,
-    Keizoku,
-    KibouSelf,
-    Shieki,
-    Suitei,
-    Touzen,
-    Ukemi,
-    KibouOthers,
-    Youtai,
-    Dantei,
-    DanteiTeinei,
-    Teinei,
-    TeDe,
-    TatteDatte,
     ALL_JODOUSHI_HELPERS,
     ALL_SETSUZOKUJOSHI_HELPERS,
 )
-from katsuyo_text.katsuyo_text_detector import (
-    IKatsuyoTextSourceDetector,
-    IKatsuyoTextAppendantDetector,
+from katsuyo_text.attribute_katsuyo_text_detector import (
+    AttributeKatsuyoTextSourceDetector,
+    AttributeKatsuyoTextAppendantDetector,
 )
-import re
+from spacy.attrs import LEMMA, MORPH, NORM, ORTH, POS, TAG  # type: ignore[import]
+import numpy
 import warnings
 import spacy
 
 
-class SpacyKatsuyoTextSourceDetector(IKatsuyoTextSourceDetector):
-    VERB_KATSUYOS_BY_CONJUGATION_TYPE = {
-        "五段-カ行": GODAN_KA_GYO,
-        "五段-ガ行": GODAN_GA_GYO,
-        "五段-サ行": GODAN_SA_GYO,
-        "五段-タ行": GODAN_TA_GYO,
-        "五段-ナ行": GODAN_NA_GYO,
-        "五段-バ行": GODAN_BA_GYO,
-        "五段-マ行": GODAN_MA_GYO,
-        "五段-ラ行": GODAN_RA_GYO,
-        "五段-ワア行": GODAN_WAA_GYO,
-        "上一段-ア行": KAMI_ICHIDAN,
-        "上一段-カ行": KAMI_ICHIDAN,
-        "上一段-ガ行": KAMI_ICHIDAN,
-        "上一段-ザ行": KAMI_ICHIDAN,
-        "上一段-タ行": KAMI_ICHIDAN,
-        "上一段-ナ行": KAMI_ICHIDAN,
-        "上一段-バ行": KAMI_ICHIDAN,
-        "上一段-マ行": KAMI_ICHIDAN,
-        "上一段-ラ行": KAMI_ICHIDAN,
-        "下一段-ア行": SHIMO_ICHIDAN,
-        "下一段-カ行": SHIMO_ICHIDAN,
-        "下一段-ガ行": SHIMO_ICHIDAN,
-        "下一段-サ行": SHIMO_ICHIDAN,
-        "下一段-ザ行": SHIMO_ICHIDAN,
-        "下一段-タ行": SHIMO_ICHIDAN,
-        "下一段-ダ行": SHIMO_ICHIDAN,
-        "下一段-ナ行": SHIMO_ICHIDAN,
-        "下一段-ハ行": SHIMO_ICHIDAN,
-        "下一段-バ行": SHIMO_ICHIDAN,
-        "下一段-マ行": SHIMO_ICHIDAN,
-        "下一段-ラ行": SHIMO_ICHIDAN,
-    }
-    JODOUSHI_BY_LEMMA = {
-        "れる": JODOUSHI_RERU.katsuyo_text,
-        "られる": JODOUSHI_RARERU.katsuyo_text,
-        # "せる" -> KatsuyoText
-        # "させる" -> KatsuyoText
-        "ない": JODOUSHI_NAI.katsuyo_text,
-        "ず": JODOUSHI_NAI.katsuyo_text,
-        "ぬ": JODOUSHI_NAI.katsuyo_text,
-        "たい": JODOUSHI_TAI.katsuyo_text,
-        # "たがる" -> KatsuyoText
-        "た": JODOUSHI_TA.katsuyo_text,
-        # "だ" -> 例外的に区別
-        # "そう" -> TaigenText|FukushiText
-        "らしい": JODOUSHI_RASHII.katsuyo_text,
-        "べし": JODOUSHI_BEKIDA.katsuyo_text,
-        # "よう" -> TaigenText
-        "です": JODOUSHI_DESU.katsuyo_text,
-        "ます": JODOUSHI_MASU.katsuyo_text,
-        # "てる" -> KatsuyoText
-    }
-    DOUSHI_PATTERN = re.compile(r"(動詞|.*動詞的)")
-    JODOUSHI_PATTERN = "助動詞"
-    KEIYOUSHI_PATTERN = re.compile(r"(形容詞|.*形容詞的)")
-    # 「形状詞」=「形容動詞の語幹」
-    # universaldependenciesのADJは形状詞を形容動詞として扱うが、KatsuyoTextとしては形状詞は名詞として扱う
-    # ref. https://universaldependencies.org/treebanks/ja_gsd/ja_gsd-pos-ADJ.html
-    # 「記号」e.g., 「ε」
-    MEISHI_PATTERN = re.compile(r"(名詞|代名詞|.*名詞的|形状詞|.*形状詞的)")
-    FUKUSHI_PATTERN = "副詞"
-    KANDOUSHI_PATTERN = "感動詞"
-    SETSUZOKU_PATTERN = "接続詞"
-    SETTOU_PATTERN = re.compile(r"(接頭辞|連体詞)")
-    KIGO_PATTERN = re.compile(r"(記号|補助記号)")
-    KAKUJOSHI_PATTERN = "助詞-格助詞"
-    KEIJOSHI_PATTERN = "助詞-係助詞"
-    FUKUJOSHI_PATTERN = "助詞-副助詞"
-    SETSUZOKUJOSHI_PATTERN = "助詞-接続助詞"
-    SHUJOSHI_PATTERN = "助詞-終助詞"
-    JUNTAIJOSHI_PATTERN = "助詞-準体助詞"
-
+class SpacyKatsuyoTextSourceDetector(AttributeKatsuyoTextSourceDetector):
     def try_detect(self, src: spacy.tokens.Token) -> Optional[IKatsuyoTextSource]:
         # spacy.tokens.Tokenから抽出される活用形の特徴を表す変数
-        tag = src.tag_
-        lemma = src.lemma_
-        norm = src.norm_
         conjugation_type, _ = get_conjugation(src)
-
-        # There is no VBD tokens in Japanese
-        # ref. https://universaldependencies.org/treebanks/ja_gsd/index.html#pos-tags
-        # if pos_tag == "VBD":
-
-        if self.DOUSHI_PATTERN.match(tag):
-            # ==================================================
-            # 動詞の判定
-            # ==================================================
-            # 「行く」は特殊な変形
-            if lemma in ["ゆく"]:
-                # 「ゆく」も「いく」に含める（過去・完了「た」を「ゆった」「ゆいた」とはできないため）
-                return KatsuyoText(gokan="い", katsuyo=GODAN_IKU)
-            if norm in ["行く", "逝く"]:
-                return KatsuyoText(gokan=lemma[:-1], katsuyo=GODAN_IKU)
-
-            # 活用タイプを取得して判定に利用
-            assert conjugation_type is not None, f"inflection is not empty: {src}"
-
-            # 活用形の判定
-            katsuyo = self.VERB_KATSUYOS_BY_CONJUGATION_TYPE.get(conjugation_type)
-            if katsuyo:
-                return KatsuyoText(gokan=lemma[:-1], katsuyo=katsuyo)
-
-            # 例外的な活用形の判定
-            if conjugation_type == "カ行変格":
-                # カ変「くる」「来る」を別途ハンドリング
-                if lemma == "来る":
-                    return KURU_KANJI
-                elif lemma == "くる":
-                    return KURU
-            elif conjugation_type == "サ行変格":
-                # サ変「する」「ずる」を別途ハンドリング
-                if lemma[-2:] == "する":
-                    return KatsuyoText(gokan=lemma[:-2], katsuyo=SA_GYO_HENKAKU_SURU)
-                elif lemma[-2:] == "ずる":
-                    return KatsuyoText(gokan=lemma[:-2], katsuyo=SA_GYO_HENKAKU_ZURU)
-
-            warnings.warn(
-                f"Unsupported conjugation_type of VERB: {conjugation_type}", UserWarning
-            )
-            return None
-        elif tag.startswith(self.JODOUSHI_PATTERN):
-            # 活用タイプを取得して判定に利用
-            assert conjugation_type is not None, f"inflection is not empty: {src}"
-
-            # 活用形の判定
-            katsuyo = self.VERB_KATSUYOS_BY_CONJUGATION_TYPE.get(conjugation_type)
-            if katsuyo:
-                return KatsuyoText(gokan=lemma[:-1], katsuyo=katsuyo)
-
-            # 例外的な活用形の判定
-            # 過去完了「だ」と断定「だ」の区別
-            if lemma == "だ":
-                if norm == "た":
-                    return JODOUSHI_DA_KAKO_KANRYO.katsuyo_text
-                else:
-                    assert norm == "だ"
-                    return JODOUSHI_DA_DANTEI.katsuyo_text
-
-            jodoushi = self.JODOUSHI_BY_LEMMA.get(lemma)
-            if jodoushi:
-                return jodoushi
-
-            warnings.warn(
-                f"Unsupported conjugation_type of AUX: {conjugation_type}", UserWarning
+        return self._try_detect_attributes(
+            src.tag_, src.lemma_, src.norm_, conjugation_type, src.text
+        )
+
+    def detect_doc(self, doc: spacy.tokens.Doc) -> List[Optional[IKatsuyoTextSource]]:
+        """
+        doc内の全トークンに対してtry_detectした結果を返却する。
+        トークンの属性をハッシュ値の配列として取り出し、
+        属性の組が同じトークンは一度だけ文字列に変換して検出する。
+        """
+        if len(doc) == 0:
+            return []
+        strings = doc.vocab.strings
+        rows, inverse = unique_rows(doc.to_array([TAG, LEMMA, NORM, MORPH, ORTH]))
+        results: List[Optional[IKatsuyoTextSource]] = []
+        # 警告を出すrowsの(添字, tag_, 活用タイプ)
+        warned: List[Tuple[int, str, Optional[str]]] = []
+        for tag, lemma, norm, morph, orth in rows.tolist():
+            tag_ = strings[tag]
+            conjugation_type, _ = get_conjugation_by_key(morph, strings)
+            result = self._detect_cached(
+                tag_,
+                strings[lemma],
+                strings[norm],
+                conjugation_type,
+                self._text_key(tag_, strings[orth]),
             )
-            return None
-        elif self.KEIYOUSHI_PATTERN.match(tag):
-            # ==================================================
-            # 形容詞の変形
-            # ==================================================
-            # e.g. 楽しい -> gokan=楽し + katsuyo=い
-            return KatsuyoText(gokan=lemma[:-1], katsuyo=KEIYOUSHI)
-        elif self.MEISHI_PATTERN.match(tag):
-            return TaigenText(gokan=src.text)
-        elif tag.startswith(self.FUKUSHI_PATTERN):
-            return FukushiText(gokan=src.text)
-        elif self.SETTOU_PATTERN.match(tag):
-            return SettoText(gokan=src.text)
-        elif tag.startswith(self.KANDOUSHI_PATTERN):
-            return KandoushiText(gokan=src.text)
-        elif tag.startswith(self.SETSUZOKU_PATTERN):
-            return SetsuzokuText(gokan=src.text)
-        elif self.KIGO_PATTERN.match(tag):
-            return KigoText(gokan=src.text)
-        elif tag.startswith(self.KAKUJOSHI_PATTERN):
-            return KakujoshiText(gokan=src.text)
-        elif tag.startswith(self.KEIJOSHI_PATTERN):
-            return KeijoshiText(gokan=src.text)
-        elif tag.startswith(self.FUKUJOSHI_PATTERN):
-            return FukujoshiText(gokan=src.text)
-        elif tag.startswith(self.SETSUZOKUJOSHI_PATTERN):
-            return SetsuzokujoshiText(gokan=src.text)
-        elif tag.startswith(self.SHUJOSHI_PATTERN):
-            return ShujoshiText(gokan=src.text)
-        elif tag.startswith(self.JUNTAIJOSHI_PATTERN):
-            return JuntaijoshiText(gokan=src.text)
-
-        return None
-
-
-class SpacyKatsuyoTextAppendantDetector(IKatsuyoTextAppendantDetector):
+            if result is None and self._warns(tag_):
+                warned.append((len(results), tag_, conjugation_type))
+            if result is not None and self.intern_pool is not None:
+                result = self.intern_pool.intern(result)
+            results.append(result)
+        indices = inverse.tolist()
+        if warned:
+            # try_detectと同じく、警告は属性の組ではなくトークンごとに出す
+            counts = Counter(indices)
+            for i, tag_, conjugation_type in warned:
+                for _ in range(counts[i]):
+                    self._warn(tag_, conjugation_type)
+        return [results[i] for i in indices]
+
+
+class SpacyKatsuyoTextAppendantDetector(AttributeKatsuyoTextAppendantDetector):
     def detect_from_sent(
         self, sent: spacy.tokens.Span, src: spacy.tokens.Token
     ) -> Tuple[List[IKatsuyoTextAppendant], KatsuyoTextHasError]:
@@ -279,6 +87,8 @@ class SpacyKatsuyoTextAppendantDetector(IKatsuyoTextAppendantDetector):
             appendant, warning_msg = self.try_detect(candidate)
             if warning_msg:
                 has_error = True
+                if m.ENABLED:
+                    m.METRICS.inc(m.DETECTOR_WARNING, type(self).__name__)
                 warnings.warn(f"{warning_msg} src: {src} sent: {sent}", UserWarning)
             if appendant is None:
                 continue
@@ -289,126 +99,62 @@ class SpacyKatsuyoTextAppendantDetector(IKatsuyoTextAppendantDetector):
     def try_detect(
         self, candidate: spacy.tokens.Token
     ) -> Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]:
-        pos_tag = candidate.pos_
-        tag = candidate.tag_
         norm = candidate.norm_
-        lemma = candidate.lemma_
-
-        if pos_tag == "AUX" or tag == "助動詞":
-            # ==================================================
-            # 助動詞の判定
-            # ==================================================
-            # NOTE: inflectionの情報のみでは、助動詞の活用形を判定できない
-            #       e.g. せる -> Inf=下一段-サ行,終止形-一般 となる
-
-            if norm in ["れる", "られる"]:
-                return self.try_get_helper(Ukemi)
-            elif norm in ["せる", "させる"]:
-                return self.try_get_helper(Shieki)
-            elif norm in ["ない", "ず"]:
-                # 「ず」も「ない」として扱う
-                return self.try_get_helper(Hitei)
-            elif norm in ["たい"]:
-                return self.try_get_helper(KibouSelf)
-            elif norm in ["たがる"]:
-                return self.try_get_helper(KibouOthers)
-            elif norm in ["た"]:
-                return self.try_get_helper(KakoKanryo)
-            elif norm in ["そう"]:
-                return self._detect_appendant_sou(candidate)
-            elif norm in ["らしい"]:
-                return self.try_get_helper(Suitei)
-            elif norm in ["べし"]:
-                return self.try_get_helper(Touzen)
-            elif norm in ["よう"]:
-                return self.try_get_helper(HikyoReizi)
-            elif norm in ["だ"]:
-                return self.try_get_helper(Dantei)
-            elif norm in ["です"]:
-                return self.try_get_helper(DanteiTeinei)
-            elif norm in ["ます"]:
-                return self.try_get_helper(Teinei)
-            elif norm in ["てる"]:
-                return self.try_get_helper(Keizoku)
-
-            if self.log_warning:
-                return None, KatsuyoTextErrorMessage(f"Unsupported AUX: {norm}")
-
-            return None, None
-        elif pos_tag == "ADJ":
-            # 形容詞「ない」はIJodoushiHelperの対象外とする
-            # NOTE: 必ずしも正確に否定表現を解析できるとは限らない
-            #       @see: https://github.com/sadahry/spacy-dialog-reflection/blob/17507db530da24c11816374d6caa4766e4614f69/tests/lang/ja/test_katsuyo_text_detector.py#L676-L693
-            # if norm in ["無い"]:
-            #     return self.try_get_helper(Hitei)
-
-            return None, None
-        elif pos_tag == "ADV":
-            # 「そう」のみ対応
-            if norm in ["そう"]:
-                return self._detect_appendant_sou(candidate)
-
-            return None, None
-        elif tag == "助詞-副助詞":
-            # ==================================================
-            # 副助詞の判定
-            # ==================================================
-            return self.try_get_fukujoshi(norm)
-        elif tag == "助詞-接続助詞":
-            # ==================================================
-            # 接続助詞の判定
-            # ==================================================
-            # sudachiの辞書のnorm「だって」が正しくないためlemmaで対応
-            if lemma in ["たって", "だって"]:
-                return self.try_get_helper(TatteDatte)
-            elif lemma in ["て", "で"]:
-                return self.try_get_helper(TeDe)
-            return self.try_get_setsuzokujoshi(lemma)
-        elif tag == "助詞-終助詞":
-            # ==================================================
-            # 終助詞の判定
-            # ==================================================
-            return self.try_get_shujoshi(norm)
-
-        return None, None
-
-    def _detect_appendant_sou(
-        self, candidate: spacy.tokens.Token
-    ) -> Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]:
-        # 「様態」「伝聞」の判別
-        left = candidate.doc[candidate.i - 1]
-        # 動詞判定
-        if left.tag_.startswith("動詞"):
-            # @ref: https://github.com/sadahry/spacy-dialog-reflection/blob/6a56bd3378daee41a30bc7bb50b8de6c063a8437/spacy_dialog_reflection/lang/ja/katsuyo_text_detector.py#L136-L144
-            inflection = left.morph.get("Inflection")[0].split(";")
-            katsuyo_type = inflection[1]
-            if "連用形" in katsuyo_type:
-                return self.try_get_helper(Youtai)
-            elif "終止形" in katsuyo_type or "連体形" in katsuyo_type:
-                return self.try_get_helper(Denbun)
-        # 形容詞判定
-        if "形容詞" in left.tag_:
-            # @ref: https://github.com/sadahry/spacy-dialog-reflection/blob/6a56bd3378daee41a30bc7bb50b8de6c063a8437/spacy_dialog_reflection/lang/ja/katsuyo_text_detector.py#L136-L144
-            inflection = left.morph.get("Inflection")[0].split(";")
-            katsuyo_type = inflection[1]
-            if "語幹" in katsuyo_type:
-                return self.try_get_helper(Youtai)
-            elif "終止形" in katsuyo_type or "連体形" in katsuyo_type:
-                return self.try_get_helper(Denbun)
-        # 形容動詞判定
-        if left.pos_ == "AUX" and left.text == "だ":
-            # 形容動詞の基本形(終止or連体)が取れていると判断する
-            return self.try_get_helper(Denbun)
-        elif "形状詞" in left.tag_:
-            # e.g.,
-            # 困難    ADJ     名詞-普通名詞-形状詞可能
-            # 的      PART    接尾辞-形状詞的
-            return self.try_get_helper(Youtai)
-        elif left.pos_ == "ADJ" and left.tag_.startswith("名詞"):
-            # 形状詞可能ではない形容動詞の語幹が取れていると判断する
-            return self.try_get_helper(Youtai)
-
-        return None, KatsuyoTextErrorMessage(f"Unexpected {candidate.norm_} no matched")
+        left = None
+        if norm == "そう":
+            left_token = candidate.doc[candidate.i - 1]
+            _, left_conjugation_form = get_conjugation(left_token)
+            left = (
+                left_token.pos_,
+                left_token.tag_,
+                left_token.text,
+                left_conjugation_form,
+            )
+        return self._detect_cached(
+            candidate.pos_, candidate.tag_, norm, candidate.lemma_, left
+        )
+
+    def detect_doc(
+        self, doc: spacy.tokens.Doc
+    ) -> List[
+        Tuple[Optional[IKatsuyoTextAppendant], Optional[KatsuyoTextErrorMessage]]
+    ]:
+        """
+        doc内の全トークンに対してtry_detectした結果を返却する。
+        トークンの属性をハッシュ値の配列として取り出し、
+        属性の組が同じトークンは一度だけ文字列に変換して検出する。
+        """
+        if len(doc) == 0:
+            return []
+        strings = doc.vocab.strings
+        columns = doc.to_array([POS, TAG, NORM, LEMMA, ORTH, MORPH])
+        # 「そう」のみ左隣のトークンの属性(pos_, tag_, text, 活用形)を加える
+        # try_detectと同じく、先頭のトークンの左隣はdoc[-1]とする
+        left = numpy.roll(columns[:, [0, 1, 4, 5]], 1, axis=0)
+        left[columns[:, 2] != strings["そう"]] = 0
+        rows, inverse = unique_rows(numpy.hstack([columns[:, :4], left]))
+        results = []
+        for pos, tag, norm, lemma, *left_row in rows.tolist():
+            left_features = None
+            if any(left_row):
+                left_pos, left_tag, left_orth, left_morph = left_row
+                _, left_conjugation_form = get_conjugation_by_key(left_morph, strings)
+                left_features = (
+                    strings[left_pos],
+                    strings[left_tag],
+                    strings[left_orth],
+                    left_conjugation_form,
+                )
+            results.append(
+                self._detect_cached(
+                    strings[pos],
+                    strings[tag],
+                    strings[norm],
+                    strings[lemma],
+                    left_features,
+                )
+            )
+        return [results[i] for i in inverse.tolist()]
 
 
 def get_conjugation(token):
@@ -420,13 +166,59 @@ def get_conjugation(token):
     # ref. https://github.com/WorksApplications/SudachiPy/blob/v0.5.4/README.md
     # > Returns the part of speech as a six-element tuple. Tuple elements are four POS levels, conjugation type and conjugation form.
     # ref. https://worksapplications.github.io/sudachi.rs/python/api/sudachipy.html#sudachipy.Morpheme.part_of_speech
-    inflection = token.morph.get("Inflection")
+    morph = token.morph
+    conjugation = _CONJUGATIONS.get(morph.key)
+    if conjugation is None:
+        conjugation = _cache_conjugation(morph.key, morph.get("Inflection"))
+    return conjugation
+
+
+def get_conjugation_by_key(key: int, strings: spacy.strings.StringStore):
+    # get_conjugationと同じ値を、MorphAnalysis.key(MORPH属性のハッシュ値)から取得する
+    conjugation = _CONJUGATIONS.get(key)
+    if conjugation is None:
+        conjugation = _cache_conjugation(key, _get_inflection(strings[key]))
+    return conjugation
+
+
+# MorphAnalysis.keyごとに、分割済みの(活用タイプ, 活用形)を保持する
+# get_conjugationを呼び出すすべての箇所で共有する
+CONJUGATION_CACHE_MAXSIZE = 2**16
+_CONJUGATIONS: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+
+
+def _cache_conjugation(
+    key: int, inflection: List[str]
+) -> Tuple[Optional[str], Optional[str]]:
     if not inflection:
-        return None, None
-    inflection = inflection[0].split(";")
-    conjugation_type = inflection[0]
-    conjugation_form = inflection[1]
-    return conjugation_type, conjugation_form
+        conjugation: Tuple[Optional[str], Optional[str]] = (None, None)
+    else:
+        conjugation_type, conjugation_form = inflection[0].split(";")[:2]
+        conjugation = (conjugation_type, conjugation_form)
+    if len(_CONJUGATIONS) >= CONJUGATION_CACHE_MAXSIZE:
+        _CONJUGATIONS.clear()
+    _CONJUGATIONS[key] = conjugation
+    return conjugation
+
+
+def _get_inflection(morph: str) -> List[str]:
+    # MorphAnalysis.get("Inflection")と同じ値を、MorphAnalysisの文字列表現から取得する
+    # e.g. "Inflection=五段-ラ行;連用形-一般|Reading=フリ" -> ["五段-ラ行;連用形-一般"]
+    for feature in morph.split("|"):
+        name, _, value = feature.partition("=")
+        if name == "Inflection":
+            return value.split(",")
+    return []
+
+
+def unique_rows(array: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    # numpy.unique(axis=0)は行ごとの比較となり遅いため、各行を一つのバイト列とみなして比較する
+    array = numpy.ascontiguousarray(array)
+    row = numpy.dtype((numpy.void, array.dtype.itemsize * array.shape[1]))
+    _, index, inverse = numpy.unique(
+        array.view(row).ravel(), return_index=True, return_inverse=True
+    )
+    return array[index], inverse
 
 
 ALL_APPENDANTS_DETECTOR = SpacyKatsuyoTextAppendantDetector(
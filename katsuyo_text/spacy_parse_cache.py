@@ -0,0 +1,190 @@
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from collections import deque
+import hashlib
+import os
+import sqlite3
+import spacy
+from spacy.tokens import Doc, DocBin
+from katsuyo_text.spacy_doc_archive import DOC_ATTRS
+
+
+class ParseCache:
+    """
+    nlpの解析結果を、textのハッシュをキーとしてSQLiteのファイルに保存する
+
+    nlpと同じく呼び出し、pipeで解析できるため、
+    SpacySentenceConverter.convert_texts, try_convert_textへnlpの代わりに指定できる。
+
+    e.g. with ParseCache("parse_cache.sqlite3", nlp) as cache:
+             converter.convert_texts(texts, cache)
+
+    保存件数がmax_entriesを超えた場合は、参照されていない期間が長いものから削除する。
+    model_versionが保存時と異なる場合は、保存済みの解析結果をすべて削除する。
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        nlp: spacy.language.Language,
+        max_entries: int = 100_000,
+        model_version: Optional[str] = None,
+        attrs: Sequence[str] = DOC_ATTRS,
+    ) -> None:
+        assert max_entries > 0
+        self.nlp = nlp
+        self.max_entries = max_entries
+        self.model_version = model_version or default_model_version(nlp)
+        self.attrs = attrs
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(os.fspath(path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS docs (
+                key BLOB PRIMARY KEY, doc BLOB NOT NULL, used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS docs_used ON docs (used);
+            """
+        )
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'model_version'"
+        ).fetchone()
+        if row is None or row[0] != self.model_version:
+            with self._conn:
+                self._conn.execute("DELETE FROM docs")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('model_version', ?)",
+                    (self.model_version,),
+                )
+        # 参照した順序を表す値。参照のたびに増やしてusedへ保存する
+        (self._clock,) = self._conn.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM docs"
+        ).fetchone()
+        # _flushで書き込む(key, doc, used)と(used, key)
+        self._writes: List[Tuple[bytes, bytes, int]] = []
+        self._touches: List[Tuple[int, bytes]] = []
+
+    def __call__(self, text: str) -> Doc:
+        # 保存を終えるまでpipeを進める
+        (doc,) = self.pipe([text])
+        return doc
+
+    def pipe(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1000,
+        n_process: int = 1,
+    ) -> Iterator[Doc]:
+        """
+        textsと同じ順にDocを返却する。
+        保存されていないtextのみnlp.pipeで解析し、batch_size件ごとに保存する。
+        """
+        # 保存済みのDoc、または解析するtextを表すNoneを入力の順に保持する
+        pending: Deque[Optional[Doc]] = deque()
+
+        def texts_to_parse() -> Iterator[str]:
+            for text in texts:
+                doc = self._get(text)
+                if doc is None:
+                    pending.append(None)
+                    yield text
+                else:
+                    pending.append(doc)
+
+        docs = self.nlp.pipe(
+            texts_to_parse(), batch_size=batch_size, n_process=n_process
+        )
+        try:
+            for doc in docs:
+                while (cached := pending.popleft()) is not None:
+                    yield cached
+                self._writes.append(
+                    (_key_of(doc.text), self._to_bytes(doc), self._tick())
+                )
+                if len(self._writes) >= batch_size:
+                    self._flush()
+                yield doc
+            while pending:
+                cached = pending.popleft()
+                assert cached is not None
+                yield cached
+        finally:
+            self._flush()
+
+    def _get(self, text: str) -> Optional[Doc]:
+        key = _key_of(text)
+        row = self._conn.execute(
+            "SELECT doc FROM docs WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touches.append((self._tick(), key))
+        return next(DocBin().from_bytes(row[0]).get_docs(self.nlp.vocab))
+
+    def _flush(self) -> None:
+        """保存と参照の記録を、まとめて1つのトランザクションで書き込む"""
+        if not (self._writes or self._touches):
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE docs SET used = ? WHERE key = ?", self._touches
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO docs VALUES (?, ?, ?)", self._writes
+            )
+            # max_entriesを超えた分を、usedが小さいものから削除する
+            self._conn.execute(
+                "DELETE FROM docs WHERE key IN ("
+                "SELECT key FROM docs ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        self._writes = []
+        self._touches = []
+
+    def _to_bytes(self, doc: Doc) -> bytes:
+        return DocBin(attrs=self.attrs, docs=[doc]).to_bytes()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()
+        return count
+
+    def clear(self) -> None:
+        self._writes = []
+        self._touches = []
+        with self._conn:
+            self._conn.execute("DELETE FROM docs")
+
+    def close(self) -> None:
+        self._flush()
+        self._conn.close()
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def default_model_version(nlp: spacy.language.Language) -> str:
+    """
+    nlpのモデル名とバージョン、spaCyのバージョンを連結した文字列を返却する。
+    モデルを更新した場合に、保存済みの解析結果を用いないために使用する。
+    """
+    meta = nlp.meta
+    return (
+        f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+        f" spacy-{spacy.__version__}"
+    )
+
+
+def _key_of(text: str) -> bytes:
+    # 入力の文字列を変更すると変換結果も変わるため、正規化せずにハッシュ化する
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
@@ -1,7 +1,18 @@
+import os
 import spacy
-from typing import Optional, Set, Dict
+from collections import deque, OrderedDict
+from typing import (
+    Optional,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
 from katsuyo_text.spacy_katsuyo_text_detector import (
-    SpacyKatsuyoTextAppendantDetector,
     SpacyKatsuyoTextSourceDetector,
     get_conjugation,
     ALL_APPENDANTS_DETECTOR,
@@ -10,195 +21,254 @@ from katsuyo_text.katsuyo_text_helper import (
     IJodoushiHelper,
 )
 from katsuyo_text.katsuyo_text import (
-    KatsuyoTextError,
-    KatsuyoText,
     IKatsuyoTextAppendant,
-    FixedKatsuyoText,
+    LazyKatsuyoTextError,
+)
+from katsuyo_text.spacy_doc_archive import (
+    load_docs,
+)
+from katsuyo_text.spacy_parse_cache import (
+    ParseCache,
 )
 from katsuyo_text.sentence_converter import (
-    ISentenceConverter,
+    SentenceAnalysis,
+    TextEdit,
+    TokenSentenceConverter,
 )
 
+ConvertResult = Tuple[Optional[str], Optional[LazyKatsuyoTextError]]
+
 
-class SpacySentenceConverter(ISentenceConverter):
-
-    # 以下からleft-id.def(right-id.def)を取得し、活用形を参照して作成
-    # ref. https://ja.osdn.net/projects/unidic/downloads/58338/unidic-mecab-2.1.2_src.zip/
-    # 必要に応じて以下の辞書も参照
-    # ref. http://sudachi.s3-website-ap-northeast-1.amazonaws.com/sudachidict-raw/20221021/small_lex.zip
-    MIZEN_FORMS: Set[str] = {
-        "未然形-一般",
-        # 活用変形の一であるため一般変形として扱える
-        "未然形-撥音便",
-        # 文語のみであり置き換えられることは稀。現状対応していない
-        # "未然形-補助",
-        # サ行変格のみであり置き換えられることは稀。現状対応していない
-        # "未然形-サ",
-        # サ行変格のみであり置き換えられることは稀。現状対応していない
-        # "未然形-セ",
-    }
-    RENYO_FORMS: Set[str] = {
-        "連用形-一般",
-        "連用形-撥音便",
-        "連用形-促音便",
-        # 活用変形の一種であるため一般変形として扱える
-        "連用形-イ音便",
-        # 助動詞-ダと文語助動詞-ズと文語助動詞-ナリ-断定に表れる
-        # 形容動詞のrenyoMixinは「に」としており対応可能
-        "連用形-ニ",
-        # 文語のみであり置き換えられることは稀。現状対応していない
-        # "連用形-補助",
-        # 特殊な活用形であるため現状対応していない
-        # "連用形-ウ音便",
-        # 特殊な活用形であるため現状対応していない
-        # "連用形-融合",
-        # 文語助動詞-タリ-断定のみ。現状対応していない
-        # "連用形-ト",
-    }
-    SHUSHI_FORMS: Set[str] = {
-        "終止形-一般",
-        # 助動詞「ぬ」の変形である可能性が否めず、識別困難であるため現状対応していない
-        # "終止形-撥音便",
-        # 口語による変形であるため一般変形として扱える
-        "連用形-促音便",
-        # 口語による変形であるため一般変形として扱える
-        "終止形-融合",
-        # 文語の特殊な活用形であるため現状対応していない
-        # "終止形-ウ音便",
-        # 文語の特殊な活用形であるため現状対応していない
-        # "終止形-補助",
-    }
-    RENTAI_FORMS: Set[str] = {
-        "連体形-一般",
-        # 助動詞「ぬ」の変形である可能性が否めず、識別困難であるため現状対応していない
-        # "連体形-撥音便",
-        # 口語による変形であるため一般変形として扱える
-        "連体形-省略",
-        # 文語の特殊な活用形であるため現状対応していない
-        # "連体形-ウ音便",
-        # 文語の特殊な活用形であるため現状対応していない
-        # "連体形-イ音便",
-        # 文語の特殊な活用形であるため現状対応していない
-        # "連体形-補助",
-    }
-    KATEI_FORMS: Set[str] = {
-        "仮定形-一般",
-        # 特殊な活用形であるため現状対応していない
-        # "仮定形-融合",
-    }
-    MEIREI_FORMS: Set[str] = {
-        "命令形",
-    }
+class SpacySentenceConverter(TokenSentenceConverter[spacy.tokens.Span]):
+    """
+    spacy.tokens.Spanを変換する
+    """
 
     def __init__(
         self,
         convertions_dict: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]],
+        result_cache_maxsize: int = 0,
     ):
-        self.src_detector = SpacyKatsuyoTextSourceDetector()
-        self.apd_detector = SpacyKatsuyoTextAppendantDetector(
-            helpers=set(convertions_dict.keys()),
-            log_warning=False,
+        super().__init__(
+            convertions_dict,
+            src_detector=SpacyKatsuyoTextSourceDetector(),
+            all_apd_detector=ALL_APPENDANTS_DETECTOR,
         )
-        self.all_apd_detector = ALL_APPENDANTS_DETECTOR
-        super().__init__(convertions_dict)
+        # textごとの変換結果を、参照の新しいものからresult_cache_maxsize件保持する
+        # 0の場合は保持しない
+        self.result_cache_maxsize = result_cache_maxsize
+        self._results: "OrderedDict[str, ConvertResult]" = OrderedDict()
+        self.result_hits = 0
+        self.result_misses = 0
 
-    def _bridge_by_form(
+    def _get_result(self, text: str) -> Optional[ConvertResult]:
+        if self.result_cache_maxsize <= 0:
+            return None
+        result = self._results.get(text)
+        if result is None:
+            self.result_misses += 1
+            return None
+        self.result_hits += 1
+        self._results.move_to_end(text)
+        return result
+
+    def _put_result(self, text: str, result: ConvertResult) -> None:
+        if self.result_cache_maxsize <= 0:
+            return
+        converted, error = result
+        if error is not None:
+            # LazyKatsuyoTextErrorはSpanやDocを参照するため、整形したメッセージを保持する
+            result = converted, LazyKatsuyoTextError(str, error.message)
+        self._results[text] = result
+        if len(self._results) > self.result_cache_maxsize:
+            self._results.popitem(last=False)
+
+    def convert_texts(
         self,
-        pre: KatsuyoText,
-        prev_token: spacy.tokens.Token,
-    ) -> FixedKatsuyoText:
+        texts: Iterable[str],
+        nlp: Union[spacy.language.Language, ParseCache],
+        batch_size: int = 1000,
+        n_process: int = 1,
+    ) -> Iterator[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]]:
         """
-        前トークンの活用形からKatsuyoTextを生成する
+        textsをnlp.pipeでまとめて解析し、textsと同じ順に変換結果を返却する。
+        Doc内のすべての文を変換して連結する。
+        変換できない文を含むtextは、KatsuyoTextErrorを送出せずに
+        最初の文のLazyKatsuyoTextErrorを返却し、後続のtextの変換を続ける。
+        needs_parseがFalseとなるtextは解析せずにそのまま返却する。
+        nlpにはParseCacheを指定でき、変換結果を保持したtextはnlpを用いずに返却する。
         """
+        # (text, 解析せずに返却する結果)を入力の順に保持する
+        # 解析する、または解析中のtextと同じtextの結果はNoneとする
+        pending: Deque[Tuple[str, Optional[ConvertResult]]] = deque()
+        # 変換結果を保持する場合は、解析中のtextと同じtextを重ねて解析しない
+        # 解析中のtextごとに、pendingに含まれる結果がNoneの件数を保持する
+        waiting: Dict[str, int] = {}
+        converted: Dict[str, ConvertResult] = {}
 
-        _, conjugation_form = get_conjugation(prev_token)
-        if conjugation_form is None:
-            # 活用形がなく、preがKatsuyoTextである場合には、活用形を推測できないためエラーに
-            raise KatsuyoTextError(
-                f"Unsupported katsuyo_text in merge of: {pre} "
-                f"type: {type(pre)} katsuyo: {type(pre.katsuyo)} "
-                f"prev: {prev_token} doc: {prev_token.doc} "
-            )
+        def texts_to_parse() -> Iterator[str]:
+            for text in texts:
+                result = self._get_result(text)
+                if result is not None:
+                    pending.append((text, result))
+                elif text in waiting:
+                    waiting[text] += 1
+                    pending.append((text, None))
+                elif self.needs_parse(text):
+                    if self.result_cache_maxsize > 0:
+                        waiting[text] = 1
+                    pending.append((text, None))
+                    yield text
+                else:
+                    pending.append((text, (text, None)))
 
-        fkt = None
-        if conjugation_form in self.MIZEN_FORMS:
-            fkt = pre.as_fkt_mizen
-        elif conjugation_form in self.RENYO_FORMS:
-            fkt = pre.as_fkt_renyo
-        elif conjugation_form in self.SHUSHI_FORMS:
-            fkt = pre.as_fkt_shushi
-        # 特殊対応 否定「ぬ」
-        elif conjugation_form == "終止形-撥音便" and prev_token.lemma_ == "ぬ":
-            fkt = pre.as_fkt_shushi
-        elif conjugation_form in self.RENTAI_FORMS:
-            fkt = pre.as_fkt_rentai
-        elif conjugation_form in self.KATEI_FORMS:
-            fkt = pre.as_fkt_katei
-        elif conjugation_form in self.MEIREI_FORMS:
-            fkt = pre.as_fkt_meirei
-        # 例外パターンは概ねHelperで対応
-        # fkt = pre.as_fkt_mizen_u
-        # fkt = pre.as_fkt_mizen_reru
-        # fkt = pre.as_fkt_mizen_rareru
-        # fkt = pre.as_fkt_renyo_ta
-        # fkt = pre.as_fkt_renyo_nai
-
-        if fkt is None:
-            raise KatsuyoTextError(
-                f"Unsupported katsuyo_form: {conjugation_form} "
-                f"pre: {pre} type: {type(pre)} katsuyo: {type(pre.katsuyo)}"
-            )
+        def pop_converted(text: str) -> ConvertResult:
+            result = converted[text]
+            waiting[text] -= 1
+            if waiting[text] == 0:
+                del waiting[text]
+                del converted[text]
+            return result
 
-        return fkt
+        docs = nlp.pipe(texts_to_parse(), batch_size=batch_size, n_process=n_process)
+        for doc in docs:
+            # docのtextはnlp.pipeへ渡し済みのため、pendingにはdocを表す組が含まれる
+            while True:
+                text, ready = pending.popleft()
+                if ready is not None:
+                    yield ready
+                elif text in converted:
+                    yield pop_converted(text)
+                else:
+                    break
+            result = self.try_convert_doc(doc)
+            self._put_result(text, result)
+            if text in waiting:
+                converted[text] = result
+                result = pop_converted(text)
+            yield result
+        while pending:
+            text, ready = pending.popleft()
+            yield pop_converted(text) if ready is None else ready
 
-    def convert(self, sent: spacy.tokens.Span) -> str:
-        result = ""
-        prev_token = None
-        prev_kt = None
-        for token in sent:
-            # 初回のみ
-            if prev_token is None:
-                prev_token = token
+    def convert_docbins(
+        self,
+        paths: Iterable[Union[str, os.PathLike]],
+        vocab: spacy.vocab.Vocab,
+    ) -> Iterator[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]]:
+        """
+        save_docsで保存したDocBinからDocを順に復元し、convert_textsと同じく変換結果を返却する。
+        解析済みのDocを用いるため、convertions_dictを変えて変換し直す際にもnlpを必要としない。
+        vocabには解析に用いたnlp.vocabを指定すること。
+        """
+        for doc in load_docs(paths, vocab):
+            # 変換対象を含まないDocは検出を省略する
+            # 解析は行わないため、needs_parseの解析数には含めない
+            if self.trigger_pattern is not None and not self.trigger_pattern.search(
+                doc.text
+            ):
+                yield doc.text, None
                 continue
+            yield self.try_convert_doc(doc)
 
-            if prev_kt is None:
-                kt, _ = self.apd_detector.try_detect(token)
-                if kt is None:
-                    result += prev_token.text
-                    prev_token = token
-                    continue
-                prev_kt = self.src_detector.try_detect(prev_token)
-                if prev_kt is None:
-                    raise KatsuyoTextError(
-                        f"Unsupported token: {prev_token} tag: {prev_token.tag_} doc: {prev_token.doc}"
-                    )
-                convert_kt = self.convertions_dict[kt]
-                if convert_kt is not None:
-                    prev_kt += convert_kt
-                prev_token = token
-                continue
+    def try_convert_text(
+        self, text: str, nlp: Union[spacy.language.Language, ParseCache]
+    ) -> Tuple[Optional[str], Optional[LazyKatsuyoTextError]]:
+        """textを解析して変換する。needs_parseがFalseの場合はそのまま返却する"""
+        result = self._get_result(text)
+        if result is not None:
+            return result
+        if not self.needs_parse(text):
+            return text, None
+        result = self.try_convert_doc(nlp(text))
+        self._put_result(text, result)
+        return result
 
-            assert prev_kt is not None
-            kt, _ = self.all_apd_detector.try_detect(token)
-            if kt is None:
-                if isinstance(prev_kt, KatsuyoText):
-                    prev_kt = self._bridge_by_form(prev_kt, prev_token)
-                result += str(prev_kt)
-                prev_kt = None
-                prev_token = token
+    def try_convert_doc(
+        self, doc: spacy.tokens.Doc
+    ) -> Tuple[Optional[str], Optional[LazyKatsuyoTextError]]:
+        edits, error = self.try_convert_doc_edits(doc)
+        if error is not None:
+            return None, error
+        assert edits is not None
+        return self._assemble(doc.text, edits), None
+
+    def try_convert_doc_edits(
+        self, doc: spacy.tokens.Doc
+    ) -> Tuple[Optional[List[TextEdit]], Optional[LazyKatsuyoTextError]]:
+        """
+        doc内のすべての文を変換し、doc.textに対するTextEditの並びを返却する
+        """
+        return self._try_emit_doc_edits(
+            [self.analyze(sent) for sent in doc.sents], self.convertions_dict
+        )
+
+    def try_convert_doc_many(
+        self,
+        doc: spacy.tokens.Doc,
+        convertions_dicts: Sequence[
+            Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]]
+        ],
+    ) -> List[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]]:
+        """
+        doc内のすべての文を一度だけ解析し、convertions_dictsのそれぞれで変換した結果を返却する
+        """
+        analyses = [self.analyze(sent) for sent in doc.sents]
+        results: List[Tuple[Optional[str], Optional[LazyKatsuyoTextError]]] = []
+        for convertions_dict in convertions_dicts:
+            edits, error = self._try_emit_doc_edits(analyses, convertions_dict)
+            if error is not None:
+                results.append((None, error))
                 continue
+            assert edits is not None
+            results.append((self._assemble(doc.text, edits), None))
+        return results
 
-            assert kt is not None
-            prev_kt += kt
-            prev_token = token
-            continue
+    def _try_emit_doc_edits(
+        self,
+        analyses: List[SentenceAnalysis],
+        convertions_dict: Dict[IJodoushiHelper, Optional[IKatsuyoTextAppendant]],
+    ) -> Tuple[Optional[List[TextEdit]], Optional[LazyKatsuyoTextError]]:
+        result: List[TextEdit] = []
+        for analysis in analyses:
+            edits, error = self.try_emit_edits(analysis, convertions_dict)
+            if error is not None:
+                return None, error
+            assert edits is not None
+            # 文ごとのTextEditの位置をdoc.textでの位置に変換する
+            offset = analysis.tokens.start_char
+            result.extend(
+                TextEdit(start + offset, end + offset, replacement)
+                for start, end, replacement in edits
+            )
+        return result, None
 
-        if prev_kt is not None:
-            if isinstance(prev_kt, KatsuyoText):
-                prev_kt = self._bridge_by_form(prev_kt, prev_token)
-            result += str(prev_kt)
-        else:
-            assert prev_token is not None
-            result += prev_token.text
+    def tokens(self, sent: spacy.tokens.Span) -> spacy.tokens.Span:
+        return sent
 
-        return result
+    def text_of(self, tokens: spacy.tokens.Span) -> str:
+        return tokens.text_with_ws
+
+    def span_of(self, tokens: spacy.tokens.Span, i: int) -> Tuple[int, int]:
+        token = tokens[i]
+        start = token.idx - tokens.start_char
+        return start, start + len(token)
+
+    def source_candidate(self, tokens: spacy.tokens.Span, i: int) -> spacy.tokens.Token:
+        return tokens[i]
+
+    def appendant_candidate(
+        self, tokens: spacy.tokens.Span, i: int
+    ) -> spacy.tokens.Token:
+        return tokens[i]
+
+    def conjugation_of(
+        self, tokens: spacy.tokens.Span, i: int
+    ) -> Tuple[Optional[str], str]:
+        token = tokens[i]
+        _, conjugation_form = get_conjugation(token)
+        return conjugation_form, token.lemma_
+
+    def describe(self, tokens: spacy.tokens.Span, i: int) -> str:
+        token = tokens[i]
+        return f"{token} tag: {token.tag_} doc: {token.doc}"
@@ -0,0 +1,54 @@
+from typing import Callable, DefaultDict, Dict, NamedTuple, TypeVar
+from collections import defaultdict
+from time import perf_counter_ns
+
+F = TypeVar("F", bound=Callable)
+
+
+class StageStats(NamedTuple):
+    # 処理時間の合計(ナノ秒)
+    ns: int
+    # 呼び出し回数
+    calls: int
+
+
+class StageTimer:
+    """
+    処理の段階(stage)ごとに、処理時間の合計と呼び出し回数を計測する
+
+    e.g. with converter.timed() as timer:
+             converter.convert(sent)
+         timer.snapshot()
+         -> {"detect_appendant": StageStats(ns=41200, calls=4), ...}
+    """
+
+    def __init__(self) -> None:
+        self._ns: DefaultDict[str, int] = defaultdict(int)
+        self._calls: DefaultDict[str, int] = defaultdict(int)
+
+    def wrap(self, stage: str, func: F) -> F:
+        """funcを呼び出すたびに、stageの処理時間と呼び出し回数に加算する関数を返却する"""
+        ns = self._ns
+        calls = self._calls
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                ns[stage] += perf_counter_ns() - start
+                calls[stage] += 1
+
+        return timed  # type: ignore
+
+    def snapshot(self) -> Dict[str, StageStats]:
+        """現時点の計測結果を、stageの名前の順に返却する"""
+        return {
+            stage: StageStats(self._ns[stage], self._calls[stage])
+            for stage in sorted(self._calls)
+        }
+
+    def reset(self) -> None:
+        # wrapした関数が参照するため、dictは作り直さない
+        self._ns.clear()
+        self._calls.clear()
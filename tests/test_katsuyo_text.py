@@ -1,4 +1,7 @@
+from typing import Any, List
 import pytest
+import katsuyo_text.katsuyo as k
+import katsuyo_text.katsuyo_text as kt
 from katsuyo_text.katsuyo_text import (
     HOJO_NAI,
     FUKUJOSHI_BAKARI,
@@ -133,6 +136,148 @@ def test_error():
         KURU_KANJI + 1
 
 
+ALL_KATSUYOS = [v for v in vars(k).values() if isinstance(v, k.IKatsuyo)]
+ALL_APPENDANTS = [
+    v for v in vars(kt).values() if isinstance(v, kt.IKatsuyoTextAppendant)
+]
+
+
+# パラメータとして他のリストと連結するためAnyとする
+ALL_NON_KATSUYO_TEXTS: List[Any] = [
+    TaigenText("語幹"),
+    FukushiText("語幹"),
+    SettoText("語幹"),
+    KandoushiText("語幹"),
+    SetsuzokuText("語幹"),
+    KigoText("語幹"),
+    kt.KakujoshiText("語幹"),
+    kt.KeijoshiText("語幹"),
+    kt.FukujoshiText("語幹"),
+    kt.SetsuzokujoshiText("語幹"),
+    kt.ShujoshiText("語幹"),
+    kt.JuntaijoshiText("語幹"),
+    kt.FixedKatsuyoText(gokan="語幹", katsuyo=k.FixedKatsuyo("き")),
+]
+
+
+@pytest.mark.parametrize(
+    "katsuyo_text",
+    [KatsuyoText(gokan="語幹", katsuyo=katsuyo) for katsuyo in ALL_KATSUYOS]
+    + ALL_NON_KATSUYO_TEXTS,
+)
+@pytest.mark.parametrize("appendant", ALL_APPENDANTS)
+def test_suffix_table(katsuyo_text, appendant):
+    try:
+        expected = appendant.merge(katsuyo_text)
+    except KatsuyoTextError:
+        with pytest.raises(KatsuyoTextError):
+            katsuyo_text + appendant
+        return
+
+    result = katsuyo_text + appendant
+    assert type(result) is type(expected)
+    assert result == expected
+    assert str(result) == str(expected)
+
+
+@pytest.mark.parametrize(
+    "katsuyo_text",
+    [KatsuyoText(gokan="語幹", katsuyo=katsuyo) for katsuyo in ALL_KATSUYOS]
+    + ALL_NON_KATSUYO_TEXTS,
+)
+@pytest.mark.parametrize("appendant", ALL_APPENDANTS)
+def test_try_add(katsuyo_text, appendant):
+    try:
+        expected = appendant.merge(katsuyo_text)
+    except KatsuyoTextError as e:
+        result, error = katsuyo_text.try_add(appendant)
+        assert result is None
+        assert error is not None
+        assert error.message == str(e)
+        return
+
+    result, error = katsuyo_text.try_add(appendant)
+    assert error is None
+    assert result == expected
+    assert str(result) == str(expected)
+
+
+@pytest.mark.parametrize(
+    "msg, katsuyo_text, appendants, expected",
+    [
+        (
+            "長い語幹",
+            TaigenText("名" * 1000),
+            [KAKUJOSHI_NO] * 10 + [KEIJOSHI_MO, JODOUSHI_DESU],
+            "名" * 1000 + "の" * 10 + "もです",
+        ),
+        (
+            "助動詞",
+            KatsuyoText(gokan="行", katsuyo=GODAN_IKU),
+            [JODOUSHI_MASU, JODOUSHI_TA],
+            "行きました",
+        ),
+        (
+            "補助形容詞",
+            KatsuyoText(gokan="行", katsuyo=GODAN_IKU),
+            [HOJO_NAI, JODOUSHI_TA],
+            "行ってなかった",
+        ),
+        (
+            "Appendantなし",
+            KatsuyoText(gokan="行", katsuyo=GODAN_IKU),
+            [],
+            "行く",
+        ),
+    ],
+)
+def test_suffix_table_add_all(msg, katsuyo_text, appendants, expected):
+    result = kt.SUFFIX_TABLE.add_all(katsuyo_text, appendants)
+    sequential = katsuyo_text
+    for appendant in appendants:
+        sequential += appendant
+    assert result == sequential, msg
+    assert str(result) == expected, msg
+
+
+def test_suffix_table_add_all_error():
+    with pytest.raises(KatsuyoTextError):
+        kt.SUFFIX_TABLE.add_all(TaigenText("名"), [KAKUJOSHI_NO, JODOUSHI_TA])
+
+
+def test_suffix_table_gokan_dependent():
+    # gokanに依存するAppendantはテーブルに載せずにmergeを呼び出す
+    class Reverse(kt.IKatsuyoTextAppendant):
+        def merge(self, pre):
+            return TaigenText(str(pre)[::-1])
+
+    table = kt.SuffixTable()
+    assert table.lookup(KatsuyoText, k.GODAN_KA_GYO, Reverse()) is None
+    assert str(KatsuyoText(gokan="書", katsuyo=k.GODAN_KA_GYO) + Reverse()) == "く書"
+    result = table.add_all(
+        KatsuyoText(gokan="書", katsuyo=k.GODAN_KA_GYO),
+        [JODOUSHI_MASU, Reverse(), KAKUJOSHI_NO],
+    )
+    assert str(result) == "すまき書の"
+
+
+def test_suffix_table_maxsize(monkeypatch):
+    # 上限に達した後は試行のmergeを行わずに、通常どおりmergeを呼び出す
+    table = kt.SuffixTable(maxsize=1)
+    pre = KatsuyoText(gokan="書", katsuyo=k.GODAN_KA_GYO)
+    assert str(table.add(pre, JODOUSHI_MASU)) == "書きます"
+    assert len(table) == 1
+
+    def compile_suffix_entry(*args):
+        raise AssertionError("compile_suffix_entry should not be called")
+
+    monkeypatch.setattr(kt, "compile_suffix_entry", compile_suffix_entry)
+    assert table.lookup(KatsuyoText, k.GODAN_KA_GYO, JODOUSHI_TA) is None
+    assert str(table.add(pre, JODOUSHI_TA)) == "書いた"
+    assert str(table.add_all(pre, [JODOUSHI_MASU, JODOUSHI_TA])) == "書きました"
+    assert len(table) == 1
+
+
 # TODO KeiyoushiKatsuyo, KeiyoudoushiKatsuyo, TaKatsuyo, MasuKatsuyo, DesuKatsuyoのテスト
 # TODO KeijoshiTextTextのテストを追加
 # TODO SetsuzokujoshiTextのテストを追加
@@ -3269,3 +3414,58 @@ def test_JONTAIJOSHI(msg, katsuyo_text, expected):
     shujoshi = JUNTAIJOSHI_NO
     result = katsuyo_text + shujoshi
     assert str(result) == expected, msg
+
+
+@pytest.mark.parametrize(
+    "obj",
+    ALL_KATSUYOS + ALL_APPENDANTS + ALL_NON_KATSUYO_TEXTS,
+)
+def test_slots(obj):
+    # 大量に保持する場合に備えて__dict__を持たないこと
+    assert not hasattr(obj, "__dict__")
+
+
+def test_intern_pool():
+    pool = kt.InternPool(maxsize=2)
+    iku = pool.intern(KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU))
+    assert pool.intern(KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU)) is iku
+    # クラスが異なるものは区別する
+    neko = pool.intern(TaigenText("猫"))
+    assert pool.intern(FukushiText("猫")) is not neko
+    assert (pool.hits, pool.misses) == (1, 3)
+    assert pool.hit_rate == 0.25
+
+    # 上限を超えた場合は最も参照されていないものから破棄する
+    assert len(pool) == 2
+    assert pool.intern(KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU)) is not iku
+
+
+@pytest.mark.parametrize("katsuyo", ALL_KATSUYOS)
+def test_as_form(katsuyo):
+    kt_ = KatsuyoText(gokan="語幹", katsuyo=katsuyo)
+    for form in k.KatsuyoForm:
+        fkt = kt_.as_form(form)
+        ending = getattr(katsuyo, form.attr_name, None)
+        if ending is None:
+            assert fkt is None
+        else:
+            assert fkt == kt.FixedKatsuyoText(gokan="語幹", katsuyo=ending)
+
+
+def test_suffix_table_unsupported():
+    # エラーとなる組み合わせもテーブルに載せ、例外を生成せずに返却する
+    table = kt.SuffixTable()
+    pre = TaigenText("猫")
+    assert table.lookup(TaigenText, None, kt.JODOUSHI_NAI) is None
+    assert len(table) == 1
+
+    result, error = table.try_add(pre, kt.JODOUSHI_NAI)
+    assert result is None
+    assert error is not None
+    with pytest.raises(KatsuyoTextError) as e:
+        kt.JODOUSHI_NAI.merge(pre)
+    assert error.message == str(e.value)
+
+    result, error = table.try_add_all(pre, [KAKUJOSHI_NO, kt.JODOUSHI_NAI])
+    assert result is None
+    assert isinstance(error.to_error(), KatsuyoTextError)
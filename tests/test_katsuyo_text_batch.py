@@ -0,0 +1,62 @@
+import pytest
+import numpy
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    JODOUSHI_NAI,
+    TaigenText,
+    JODOUSHI_RERU,
+    KAKUJOSHI_NO,
+)
+from katsuyo_text.katsuyo_text_batch import KatsuyoTextBatch
+from katsuyo_text.katsuyo_text_helper import Hitei, KakoKanryo, Ukemi, TeDe
+
+SOURCES = [
+    KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU),
+    KatsuyoText(gokan="書", katsuyo=k.GODAN_KA_GYO),
+    KatsuyoText(gokan="聞", katsuyo=k.GODAN_KA_GYO),
+    KatsuyoText(gokan="見", katsuyo=k.KAMI_ICHIDAN),
+    KatsuyoText(gokan="美し", katsuyo=k.KEIYOUSHI),
+    KatsuyoText(gokan="綺麗", katsuyo=k.KEIYOUDOUSHI),
+    TaigenText("猫"),
+]
+
+
+@pytest.mark.parametrize(
+    "msg, appendants",
+    [
+        ("Helper", [Hitei(), KakoKanryo()]),
+        ("KatsuyoText", [JODOUSHI_NAI.katsuyo_text, KAKUJOSHI_NO]),
+        ("接続助詞", [TeDe(), KAKUJOSHI_NO]),
+    ],
+)
+def test_katsuyo_text_batch(msg, appendants):
+    batch = KatsuyoTextBatch.from_sources(SOURCES)
+    for appendant in appendants:
+        batch = batch + appendant
+
+    expected = []
+    for src in SOURCES:
+        for appendant in appendants:
+            src = src + appendant
+        expected.append(src)
+    assert batch.to_sources() == expected, msg
+    assert batch.to_list() == [str(src) for src in expected], msg
+    assert batch.mask == [False] * len(SOURCES)
+    # 活用ごとにまとめて保持する
+    assert len(batch.kinds) < len(SOURCES)
+
+
+def test_katsuyo_text_batch_error():
+    batch = KatsuyoTextBatch.from_sources(SOURCES) + JODOUSHI_RERU + Ukemi()
+    # 形容詞,形容動詞,体言には受身を付与できない
+    assert batch.mask == [False] * 4 + [True] * 3
+    assert batch.errors[:4] == [None] * 4
+    assert all(error is not None for error in batch.errors[4:])
+    assert batch.to_list()[:2] == ["行かれられる", "書かれられる"]
+    assert batch.to_list()[4:] == [None] * 3
+
+    array = batch.to_numpy()
+    assert isinstance(array, numpy.ndarray)
+    assert array.dtype == object
+    assert list(array) == batch.to_list()
@@ -61,6 +61,7 @@ from katsuyo_text.katsuyo_text_helper import (
     Youtai,
     TeDe,
     TatteDatte,
+    HelperChain,
 )
 
 
@@ -3101,3 +3102,55 @@ def test_jodoushi_TatteDatte(msg, katsuyo_text, expected):
     setsuzokujoshi = TatteDatte()
     result = katsuyo_text + setsuzokujoshi
     assert str(result) == expected, msg
+
+
+@pytest.mark.parametrize(
+    "msg, katsuyo_texts, appendants, expected",
+    [
+        (
+            "動詞",
+            [
+                KatsuyoText(gokan="行", katsuyo=GODAN_IKU),
+                KatsuyoText(gokan="書", katsuyo=GODAN_KA_GYO),
+                KatsuyoText(gokan="見", katsuyo=KAMI_ICHIDAN),
+                KatsuyoText(gokan="泳", katsuyo=GODAN_GA_GYO),
+            ],
+            [Hitei(), KakoKanryo(), DanteiTeinei()],
+            ["行かなかったです", "書かなかったです", "見なかったです", "泳がなかったです"],
+        ),
+        (
+            "bridge",
+            [
+                TaigenText("大丈夫"),
+                TaigenText("健康"),
+                KatsuyoText(gokan="美し", katsuyo=KEIYOUSHI),
+            ],
+            [Hitei(), KakoKanryo()],
+            ["大丈夫ではなかった", "健康ではなかった", "美しくなかった"],
+        ),
+        (
+            "IKatsuyoTextAppendant",
+            [
+                KatsuyoText(gokan="遊", katsuyo=GODAN_BA_GYO),
+                KatsuyoText(gokan="走", katsuyo=GODAN_RA_GYO),
+            ],
+            [TeDe(), KEIJOSHI_MO],
+            ["遊んでも", "走っても"],
+        ),
+    ],
+)
+def test_helper_chain(msg, katsuyo_texts, appendants, expected):
+    chain = HelperChain(appendants)
+    results = list(chain.apply_many(katsuyo_texts))
+    assert [str(result) for result in results] == expected, msg
+    for katsuyo_text, result in zip(katsuyo_texts, results):
+        sequential = katsuyo_text
+        for appendant in appendants:
+            sequential += appendant
+        assert result == sequential, msg
+
+
+def test_helper_chain_error():
+    chain = HelperChain([Teinei(), Ukemi()])
+    with pytest.raises(KatsuyoTextError):
+        chain.apply(KatsuyoText(gokan="行", katsuyo=GODAN_IKU))
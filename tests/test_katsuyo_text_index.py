@@ -0,0 +1,80 @@
+import pytest
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import KatsuyoText
+from katsuyo_text.katsuyo_text_helper import (
+    Hitei,
+    KakoKanryo,
+    DanteiTeinei,
+    Ukemi,
+)
+from katsuyo_text.katsuyo_text_index import SurfaceIndex
+
+IKU = KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU)
+MIRU = KatsuyoText(gokan="見", katsuyo=k.KAMI_ICHIDAN)
+SOURCES = [IKU, MIRU]
+APPENDANTS = [Hitei(), KakoKanryo(), DanteiTeinei(), Ukemi()]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SurfaceIndex.build(SOURCES, APPENDANTS, 3)
+
+
+@pytest.mark.parametrize(
+    "surface, expected",
+    [
+        ("行く", [(IKU, ())]),
+        ("行かなかったです", [(IKU, (Hitei(), KakoKanryo(), DanteiTeinei()))]),
+        ("見られない", [(MIRU, (Ukemi(), Hitei()))]),
+        ("書く", []),
+    ],
+)
+def test_surface_index_lookup(index, surface, expected):
+    assert index.lookup(surface) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("彼は行かなかったです", "行かなかったです"),
+        ("行かなかった", "行かなかった"),
+        ("見られる", "見られる"),
+        ("書かなかった", None),
+        ("", None),
+    ],
+)
+def test_surface_index_longest_suffix(index, text, expected):
+    result = index.longest_suffix(text)
+    if expected is None:
+        assert result is None
+    else:
+        assert result is not None
+        surface, entries = result
+        assert surface == expected
+        assert entries == index.lookup(expected)
+
+
+def test_surface_index_save_load(index, tmp_path):
+    path = tmp_path / "index.bin"
+    index.save(path)
+    loaded = SurfaceIndex.load(path, SOURCES, APPENDANTS)
+    assert len(loaded) == len(index)
+    assert loaded.lookup("行かなかったです") == index.lookup("行かなかったです")
+    assert loaded.longest_suffix("彼は見られない") == index.longest_suffix("彼は見られない")
+
+
+@pytest.mark.parametrize(
+    "sources, appendants",
+    [
+        (SOURCES, APPENDANTS[::-1]),
+        (SOURCES[::-1], APPENDANTS),
+        (SOURCES, APPENDANTS[:-1]),
+        (SOURCES, [Hitei(), KakoKanryo(), DanteiTeinei(), Ukemi(bridge=None)]),
+    ],
+)
+def test_surface_index_load_mismatch(index, tmp_path, sources, appendants):
+    path = tmp_path / "index.bin"
+    index.save(path)
+    # 作成時と異なるsources, appendantsでは読み込めない
+    with pytest.raises(ValueError):
+        SurfaceIndex.load(path, sources, appendants)
@@ -0,0 +1,83 @@
+import itertools
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    ALL_FUKUJOSHIS,
+    ALL_SHUJOSHIS,
+)
+from katsuyo_text.katsuyo_text_helper import (
+    Hitei,
+    KakoKanryo,
+    Ukemi,
+    ALL_JODOUSHI_HELPERS,
+    ALL_SETSUZOKUJOSHI_HELPERS,
+)
+from katsuyo_text.katsuyo_text_paradigm import generate_paradigm
+
+IKU = KatsuyoText(gokan="行", katsuyo=k.GODAN_IKU)
+
+
+def test_generate_paradigm():
+    hitei = Hitei()
+    kako = KakoKanryo()
+    result = list(generate_paradigm(IKU, [hitei, kako], 2))
+    assert result == [
+        ((hitei,), "行かない"),
+        ((hitei, hitei), "行かなくない"),
+        ((hitei, kako), "行かなかった"),
+        ((kako,), "行った"),
+    ]
+
+
+def test_generate_paradigm_prune():
+    # KatsuyoTextErrorとなる並びは返却しない
+    ukemi = Ukemi(bridge=None)
+    result = list(generate_paradigm(IKU, [Hitei(), ukemi], 2))
+    assert all(chain[-2:] != (Hitei(), ukemi) for chain, _ in result)
+    assert ((ukemi,), "行かれる") in result
+
+
+def test_generate_paradigm_dedup():
+    # 同じ結果に至る並びは最初の並びのみを返却する
+    hitei = Hitei()
+    result = list(generate_paradigm(IKU, [hitei, Hitei()], 3))
+    assert result == list(generate_paradigm(IKU, [hitei], 3))
+
+
+def test_generate_paradigm_max_states():
+    hitei = Hitei()
+    appendants = [hitei, Hitei(), KakoKanryo()]
+    expected = list(generate_paradigm(IKU, appendants, 3))
+    assert expected == list(generate_paradigm(IKU, appendants, 3, max_states=None))
+
+    # 重複を除かない場合はすべての並びを返却する
+    result = list(generate_paradigm(IKU, appendants, 2, max_states=0))
+    assert len(result) == 9
+    assert result.count(((hitei,), "行かない")) == 2
+
+    # 上限を超えて忘れた結果は改めて返却するが、得られる結果は変わらない
+    result = list(generate_paradigm(IKU, appendants, 3, max_states=1))
+    assert len(result) >= len(expected)
+    assert {surface for _, surface in result} == {surface for _, surface in expected}
+
+
+def test_generate_paradigm_all():
+    appendants = (
+        list(ALL_JODOUSHI_HELPERS)
+        + list(ALL_SETSUZOKUJOSHI_HELPERS)
+        + list(ALL_FUKUJOSHIS)
+        + list(ALL_SHUJOSHIS)
+    )
+    result = list(generate_paradigm(IKU, appendants, 2))
+    for chain, surface in result:
+        src = IKU
+        for appendant in chain:
+            src = src + appendant
+        assert str(src) == surface
+
+
+def test_generate_paradigm_lazy():
+    appendants = list(ALL_JODOUSHI_HELPERS)
+    # 探索空間が大きくても必要な分だけ生成する
+    result = list(itertools.islice(generate_paradigm(IKU, appendants, 100), 10))
+    assert len(result) == 10
@@ -0,0 +1,138 @@
+import threading
+import pytest
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    KatsuyoTextError,
+    TaigenText,
+    JODOUSHI_TA,
+    SUFFIX_TABLE,
+)
+from katsuyo_text.katsuyo_text_helper import Teinei, Ukemi
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    MorphemeRecord,
+    MorphemeKatsuyoTextSourceDetector,
+)
+import katsuyo_text.metrics as metrics
+from katsuyo_text.metrics import (
+    METRICS,
+    ERROR,
+    HELPER_BRIDGE,
+    HELPER_BRIDGE_FAILURE,
+    HELPER_TRY_MERGE,
+    DETECTOR_WARNING,
+    SUFFIX_TABLE_HIT,
+    SUFFIX_TABLE_MISS,
+    MetricsRegistry,
+)
+
+
+def test_metrics_registry_threads():
+    registry = MetricsRegistry()
+
+    def inc():
+        for _ in range(1000):
+            registry.inc(ERROR, "Foo")
+
+    threads = [threading.Thread(target=inc) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.inc(ERROR, "Bar", 2)
+    # 終了したスレッドのカウンタも合算する
+    assert registry.as_dict() == {ERROR: {"Bar": 2, "Foo": 4000}}
+
+    registry.reset()
+    assert registry.as_dict() == {}
+
+
+def test_metrics_registry_prometheus():
+    registry = MetricsRegistry()
+    registry.inc(HELPER_BRIDGE, "Ukemi")
+    registry.inc(HELPER_BRIDGE, 'a"b')
+    text = registry.to_prometheus()
+    assert f"# TYPE {HELPER_BRIDGE} counter\n" in text
+    assert f'{HELPER_BRIDGE}{{helper="Ukemi"}} 1\n' in text
+    assert f'{HELPER_BRIDGE}{{helper="a\\"b"}} 1\n' in text
+
+
+@pytest.fixture
+def metrics_enabled():
+    METRICS.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+
+
+def test_metrics_disabled():
+    METRICS.reset()
+    KatsuyoText(gokan="走", katsuyo=k.GODAN_RA_GYO) + Ukemi()
+    with pytest.raises(KatsuyoTextError):
+        JODOUSHI_TA + Ukemi()
+    # 有効にしない限り数えない
+    assert METRICS.as_dict() == {}
+
+
+def test_metrics_helper(metrics_enabled):
+    SUFFIX_TABLE.clear()
+    ukemi = Ukemi()
+    # テーブルを参照する2回目以降の呼び出しも、mergeを呼び出した場合と同じく数える
+    for _ in range(2):
+        KatsuyoText(gokan="走", katsuyo=k.GODAN_RA_GYO) + ukemi
+        TaigenText("学生") + ukemi
+        with pytest.raises(KatsuyoTextError):
+            JODOUSHI_TA + ukemi
+        _, error = JODOUSHI_TA.try_add(ukemi)
+        assert error is not None
+        # メッセージを得るためのmergeは数えない
+        assert error.message
+    metrics = METRICS.as_dict()
+    # try_mergeとbridgeの中で行うaddも数える
+    assert metrics[SUFFIX_TABLE_HIT] == {"KakujoshiText": 2, "Reru": 4, "Ukemi": 4}
+    assert metrics[SUFFIX_TABLE_MISS] == {"Ukemi": 4}
+    assert metrics[HELPER_TRY_MERGE] == {"Ukemi": 2}
+    assert metrics[HELPER_BRIDGE] == {"Ukemi": 6}
+    assert metrics[HELPER_BRIDGE_FAILURE] == {"Ukemi": 4}
+    # 送出した関数ごとに数える
+    assert metrics[ERROR] == {"bridge_Ukemi_default": 4}
+
+
+def test_metrics_helper_without_table(metrics_enabled):
+    # SUFFIX_TABLEを参照せずにmergeを呼び出す場合も数える
+    fkt = KatsuyoText(gokan="走", katsuyo=k.GODAN_RA_GYO).as_form(k.KatsuyoForm.RENYO)
+    assert fkt is not None
+    with pytest.raises(KatsuyoTextError):
+        fkt + Teinei()
+    with pytest.raises(KatsuyoTextError):
+        Ukemi(bridge=None).merge(JODOUSHI_TA)
+    metrics = METRICS.as_dict()
+    assert metrics[HELPER_BRIDGE] == {"Teinei": 1}
+    assert metrics[HELPER_BRIDGE_FAILURE] == {"Teinei": 1}
+    assert metrics[ERROR] == {"bridge_DanteiTeinei_default": 1, "Ukemi": 1}
+
+
+def test_metrics_suspended():
+    registry = MetricsRegistry()
+    registry.inc(ERROR, "Foo")
+    with registry.suspended():
+        registry.inc(ERROR, "Foo")
+    registry.inc(ERROR, "Foo")
+    assert registry.as_dict() == {ERROR: {"Foo": 2}}
+
+
+def test_metrics_detector_warning(metrics_enabled):
+    detector = MorphemeKatsuyoTextSourceDetector()
+    record = MorphemeRecord(
+        "有ら", ("動詞", "非自立可能", "*", "*", "文語ラ行変格", "未然形-一般"), "有り", "有る"
+    )
+    # 検出結果を保持した2回目以降の呼び出しも警告を出して数える
+    with pytest.warns(
+        UserWarning, match="Unsupported conjugation_type of VERB"
+    ) as record_warnings:
+        for _ in range(2):
+            assert detector.try_detect(record) is None
+    assert len(record_warnings) == 2
+    assert METRICS.as_dict()[DETECTOR_WARNING] == {
+        "MorphemeKatsuyoTextSourceDetector": 2
+    }
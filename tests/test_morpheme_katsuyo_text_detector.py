@@ -0,0 +1,135 @@
+import pytest
+import katsuyo_text.katsuyo as k
+from katsuyo_text.katsuyo_text import (
+    KatsuyoText,
+    TaigenText,
+    KakujoshiText,
+    KigoText,
+    JODOUSHI_DA_DANTEI,
+    ALL_FUKUJOSHIS,
+    ALL_SHUJOSHIS,
+    ALL_SETSUZOKUJOSHIS,
+)
+from katsuyo_text.katsuyo_text_helper import (
+    Dantei,
+    Denbun,
+    Hitei,
+    KakoKanryo,
+    Youtai,
+    ALL_JODOUSHI_HELPERS,
+    ALL_SETSUZOKUJOSHI_HELPERS,
+)
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    MorphemeRecord,
+    MorphemeKatsuyoTextSourceDetector,
+    MorphemeKatsuyoTextAppendantDetector,
+    parse_part_of_speech,
+    resolve_pos,
+    with_pos,
+)
+
+# 「雨が降りそうだ。」
+FURISOUDA = [
+    MorphemeRecord("雨", ("名詞", "普通名詞", "一般", "*", "*", "*"), "雨", "雨"),
+    MorphemeRecord("が", ("助詞", "格助詞", "*", "*", "*", "*"), "が", "が"),
+    MorphemeRecord("降り", ("動詞", "一般", "*", "*", "五段-ラ行", "連用形-一般"), "降る", "降る"),
+    MorphemeRecord("そう", ("形状詞", "助動詞語幹", "*", "*", "*", "*"), "そう", "そう"),
+    MorphemeRecord("だ", ("助動詞", "*", "*", "*", "助動詞-ダ", "終止形-一般"), "だ", "だ"),
+    MorphemeRecord("。", ("補助記号", "句点", "*", "*", "*", "*"), "。", "。"),
+]
+
+
+@pytest.fixture(scope="session")
+def source_detector():
+    return MorphemeKatsuyoTextSourceDetector()
+
+
+@pytest.fixture(scope="session")
+def appendant_detector():
+    return MorphemeKatsuyoTextAppendantDetector(
+        helpers=ALL_JODOUSHI_HELPERS | ALL_SETSUZOKUJOSHI_HELPERS,
+        fukujoshis=ALL_FUKUJOSHIS,
+        setsuzokujoshis=ALL_SETSUZOKUJOSHIS,
+        shujoshis=ALL_SHUJOSHIS,
+    )
+
+
+def test_parse_part_of_speech():
+    assert parse_part_of_speech(FURISOUDA[0].part_of_speech) == (
+        "名詞-普通名詞-一般",
+        None,
+        None,
+    )
+    assert parse_part_of_speech(FURISOUDA[2].part_of_speech) == (
+        "動詞-一般",
+        "五段-ラ行",
+        "連用形-一般",
+    )
+
+
+def test_resolve_pos():
+    assert resolve_pos(FURISOUDA) == ["NOUN", "ADP", "VERB", "AUX", "AUX", "PUNCT"]
+
+
+@pytest.mark.parametrize(
+    "i, expected",
+    [
+        (0, TaigenText("雨")),
+        (1, KakujoshiText("が")),
+        (2, KatsuyoText(gokan="降", katsuyo=k.GODAN_RA_GYO)),
+        (3, TaigenText("そう")),
+        (4, JODOUSHI_DA_DANTEI.katsuyo_text),
+        (5, KigoText("。")),
+    ],
+)
+def test_morpheme_source_detector(source_detector, i, expected):
+    assert source_detector.try_detect(FURISOUDA[i]) == expected
+
+
+def test_morpheme_source_detector_plain_tuple(source_detector):
+    # MorphemeRecordでなくとも同じ並びのtupleであれば検出できる
+    assert source_detector.try_detect(tuple(FURISOUDA[2])) == KatsuyoText(
+        gokan="降", katsuyo=k.GODAN_RA_GYO
+    )
+
+
+def test_morpheme_appendant_detector(appendant_detector):
+    appendants, has_error = appendant_detector.detect_from_sent(FURISOUDA, 2)
+    assert not has_error
+    assert [type(appendant) for appendant in appendants] == [Youtai, Dantei]
+
+
+def test_morpheme_appendant_detector_sou(appendant_detector):
+    # 終止形に続く「そう」は伝聞
+    records = list(FURISOUDA)
+    records[2] = MorphemeRecord(
+        "降る", ("動詞", "一般", "*", "*", "五段-ラ行", "終止形-一般"), "降る", "降る"
+    )
+    records[3] = MorphemeRecord("そう", ("名詞", "助動詞語幹", "*", "*", "*", "*"), "そう", "そう")
+    appendant, error = appendant_detector.try_detect((with_pos(records), 3))
+    assert error is None
+    assert isinstance(appendant, Denbun)
+
+
+def test_morpheme_appendant_detector_unresolved(appendant_detector):
+    # posの解決は文ごとに行うため、解決していないrecordsは受け付けない
+    with pytest.raises(ValueError):
+        appendant_detector.try_detect((FURISOUDA, 3))
+    assert not hasattr(appendant_detector, "detect_doc")
+
+
+def test_morpheme_appendant_detector_chain(appendant_detector):
+    # 「歩かなかった」
+    records = [
+        MorphemeRecord("歩か", ("動詞", "一般", "*", "*", "五段-カ行", "未然形-一般"), "歩く", "歩く"),
+        MorphemeRecord(
+            "なかっ",
+            ("助動詞", "*", "*", "*", "助動詞-ナイ", "連用形-促音便"),
+            "ない",
+            "ない",
+        ),
+        MorphemeRecord("た", ("助動詞", "*", "*", "*", "助動詞-タ", "終止形-一般"), "た", "た"),
+    ]
+    appendants, has_error = appendant_detector.detect_from_sent(records, 0)
+    assert not has_error
+    assert [type(appendant) for appendant in appendants] == [Hitei, KakoKanryo]
@@ -0,0 +1,98 @@
+import pytest
+from katsuyo_text.katsuyo_text_helper import (
+    Ukemi,
+    Teinei,
+    Dantei,
+    DanteiTeinei,
+)
+from katsuyo_text.morpheme_katsuyo_text_detector import (
+    MorphemeRecord,
+    records_from_sudachi,
+)
+from katsuyo_text.sentence_converter import (
+    TextEdit,
+)
+from katsuyo_text.morpheme_sentence_converter import (
+    MorphemeTokens,
+    MorphemeSentenceConverter,
+)
+from katsuyo_text.spacy_sentence_converter import (
+    SpacySentenceConverter,
+)
+
+# 「公園へ行きました」
+IKIMASHITA = [
+    MorphemeRecord("公園", ("名詞", "普通名詞", "一般", "*", "*", "*"), "公園", "公園"),
+    MorphemeRecord("へ", ("助詞", "格助詞", "*", "*", "*", "*"), "へ", "へ"),
+    MorphemeRecord(
+        "行き",
+        ("動詞", "非自立可能", "*", "*", "五段-カ行", "連用形-一般"),
+        "行く",
+        "行く",
+    ),
+    MorphemeRecord("まし", ("助動詞", "*", "*", "*", "助動詞-マス", "連用形-一般"), "ます", "ます"),
+    MorphemeRecord("た", ("助動詞", "*", "*", "*", "助動詞-タ", "終止形-一般"), "た", "た"),
+]
+
+
+@pytest.mark.parametrize(
+    "convertions_dict, expected",
+    [
+        ({Teinei(): None}, "公園へ行った"),
+        ({Teinei(): Dantei()}, "公園へ行くのだった"),
+    ],
+)
+def test_convert_records(convertions_dict, expected):
+    converter = MorphemeSentenceConverter(convertions_dict)
+    assert converter.convert(IKIMASHITA) == expected
+    # posを含まない4要素のtupleも受け付ける
+    assert converter.convert([tuple(record[:4]) for record in IKIMASHITA]) == expected
+
+
+def test_convert_records_edits():
+    converter = MorphemeSentenceConverter({Teinei(): None})
+    # 変換した「行きました」の範囲のみを置換する
+    assert converter.try_convert_edits(IKIMASHITA) == ([TextEdit(3, 8, "行った")], None)
+    # 変換前と同じ文字列となる場合は置換しない
+    converter = MorphemeSentenceConverter({Ukemi(): None})
+    assert converter.try_convert_edits(IKIMASHITA[:2]) == ([], None)
+
+
+def test_convert_records_many():
+    convertions_dicts = [{Teinei(): None}, {Teinei(): Dantei()}, {Ukemi(): None}]
+    converter = MorphemeSentenceConverter(convertions_dicts[0])
+    assert converter.try_convert_many(IKIMASHITA, convertions_dicts) == [
+        ("公園へ行った", None),
+        ("公園へ行くのだった", None),
+        ("公園へ行きました", None),
+    ]
+
+
+def test_morpheme_tokens():
+    tokens = MorphemeTokens(IKIMASHITA)
+    assert tokens.text == "公園へ行きました"
+    assert tokens.offsets == [0, 2, 3, 5, 7, 8]
+
+
+def test_convert_records_empty():
+    assert MorphemeSentenceConverter({Teinei(): None}).convert([]) == ""
+
+
+@pytest.mark.parametrize(
+    "sentence, convertions_dict",
+    [
+        ("公園へ行かれますか", {Teinei(): None}),
+        ("公園で遊びまして", {Teinei(): None}),
+        ("すみません", {Teinei(): None}),
+        ("あなたに嫌われたくないです", {DanteiTeinei(): None}),
+        ("私は嫌われていた", {Ukemi(): None}),
+    ],
+)
+def test_convert_records_same_as_spacy(nlp_ja, sentence, convertions_dict):
+    sudachipy = pytest.importorskip("sudachipy")
+    tokenizer = sudachipy.Dictionary(dict="core").create()
+    records = records_from_sudachi(tokenizer.tokenize(sentence, sudachipy.SplitMode.C))
+    expected = SpacySentenceConverter(convertions_dict).convert(
+        next(nlp_ja(sentence).sents)
+    )
+    assert MorphemeSentenceConverter(convertions_dict).convert(records) == expected
@@ -0,0 +1,30 @@
+from katsuyo_text.spacy_doc_archive import (
+    list_shards,
+    load_docs,
+    save_docs,
+)
+
+TEXTS = ["公園へ 行きました。綺麗です。", "猫が歩く", "家に帰りました"]
+
+
+def test_save_and_load_docs(nlp_ja, tmp_path):
+    docs = list(nlp_ja.pipe(TEXTS))
+    paths = save_docs(docs, tmp_path, shard_size=2)
+    assert [path.name for path in paths] == ["00000.spacy", "00001.spacy"]
+    assert list_shards(tmp_path) == paths
+
+    loaded = list(load_docs(paths, nlp_ja.vocab))
+    assert [doc.text for doc in loaded] == TEXTS
+    # 変換に用いる属性と文の区切りを復元できる
+    for doc, restored in zip(docs, loaded):
+        assert [str(sent) for sent in restored.sents] == [
+            str(sent) for sent in doc.sents
+        ]
+        assert [(t.tag_, t.pos_, t.lemma_, t.norm_, t.morph.key) for t in restored] == [
+            (t.tag_, t.pos_, t.lemma_, t.norm_, t.morph.key) for t in doc
+        ]
+
+
+def test_save_docs_empty(tmp_path):
+    assert save_docs([], tmp_path) == []
+    assert list_shards(tmp_path) == []
@@ -765,3 +765,27 @@ def test_spacy_katsuyo_text_appendants_detector_ignore_warning(nlp_ja, text, nor
     )
     assert not has_error, "has error in detection"
     assert appendants == [], f"{norm} will be ignored"
+
+
+def test_spacy_katsuyo_text_appendants_detector_cache(nlp_ja):
+    detector = SpacyKatsuyoTextAppendantDetector(
+        helpers={Youtai(), Denbun()}, log_warning=False
+    )
+    # 「そう」は左隣のトークンにより判別する
+    doc = nlp_ja("雨が降りそうだ。雨が降るそうだ。雨が降りそうだ。")
+    sou = [token for token in doc if token.norm_ == "そう"]
+    results = [detector.try_detect(token) for token in sou]
+
+    assert isinstance(results[0][0], Youtai)
+    assert isinstance(results[1][0], Denbun)
+    assert results[2] is results[0]
+    info = detector.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+def test_spacy_katsuyo_text_appendants_detector_detect_doc(nlp_ja):
+    # 「そう」を含め、トークンごとの検出と一致する
+    doc = nlp_ja("雨が降りそうだ。雨が降るそうだ。彼は静かそうだった。歩かなかったです。")
+    expected = [ALL_APPENDANTS_DETECTOR.try_detect(token) for token in doc]
+    assert ALL_APPENDANTS_DETECTOR.detect_doc(doc) == expected
@@ -1,5 +1,6 @@
 import pytest
 from katsuyo_text.katsuyo_text import (
+    InternPool,
     KatsuyoText,
     TaigenText,
     FukushiText,
@@ -44,8 +45,13 @@ from katsuyo_text.katsuyo import (
     SA_GYO_HENKAKU_ZURU,
     SHIMO_ICHIDAN,
 )
+from katsuyo_text.attribute_katsuyo_text_detector import (
+    TagCategory,
+)
 from katsuyo_text.spacy_katsuyo_text_detector import (
     SpacyKatsuyoTextSourceDetector,
+    get_conjugation,
+    get_conjugation_by_key,
 )
 
 
@@ -1200,3 +1206,90 @@ def test_spacy_katsuyo_text_source_detector_jodoushi(
     assert last_token.pos_ == pos, "last token is not correct"
     result = spacy_source_detector.try_detect(last_token)
     assert result == expected
+
+
+def test_spacy_katsuyo_text_source_detector_intern_pool(nlp_ja):
+    pool = InternPool()
+    detector = SpacyKatsuyoTextSourceDetector(intern_pool=pool)
+    doc = nlp_ja("猫が歩く。猫が歩く。犬が走る。")
+    results = [detector.try_detect(token) for token in doc]
+
+    # 同じ語は同じインスタンスを共有する
+    assert results[0] == TaigenText("猫")
+    assert results[0] is results[4]
+    assert results[2] is results[6]
+    assert pool.hits == 6
+    assert pool.misses == 6
+    assert pool.hit_rate == pytest.approx(0.5)
+
+
+def test_spacy_katsuyo_text_source_detector_cache(nlp_ja):
+    detector = SpacyKatsuyoTextSourceDetector()
+    doc = nlp_ja("猫が歩く。猫が歩く。犬が走る。")
+    results = [detector.try_detect(token) for token in doc]
+
+    # 同じ属性のトークンは検出結果を共有する
+    assert results[0] is results[4]
+    assert results[2] is results[6]
+    info = detector.cache_info()
+    assert info.hits == 6
+    assert info.misses == 6
+
+    detector.cache_clear()
+    assert detector.cache_info().currsize == 0
+    assert detector.try_detect(doc[2]) == results[2]
+
+
+def test_spacy_katsuyo_text_source_detector_cache_text(nlp_ja):
+    detector = SpacyKatsuyoTextSourceDetector()
+    doc = nlp_ja("歩く。歩いた。")
+    # 動詞は表層形(「歩く」「歩い」)を参照しないため、検出結果を共有する
+    assert detector.try_detect(doc[0]) is detector.try_detect(doc[2])
+    assert detector.cache_info().hits == 1
+    # 記号は表層形を参照する
+    assert detector.try_detect(doc[1]) == KigoText("。")
+
+
+@pytest.mark.parametrize(
+    "tag, category",
+    [
+        ("動詞-一般", TagCategory.DOUSHI),
+        ("動詞-非自立可能", TagCategory.DOUSHI),
+        ("接尾辞-動詞的", TagCategory.DOUSHI),
+        ("助動詞", TagCategory.JODOUSHI),
+        ("形容詞-一般", TagCategory.KEIYOUSHI),
+        ("接尾辞-形容詞的", TagCategory.KEIYOUSHI),
+        ("名詞-普通名詞-形状詞可能", TagCategory.MEISHI),
+        ("形状詞-助動詞語幹", TagCategory.MEISHI),
+        ("代名詞", TagCategory.MEISHI),
+        ("副詞", TagCategory.FUKUSHI),
+        ("連体詞", TagCategory.SETTOU),
+        ("補助記号-句点", TagCategory.KIGO),
+        ("助詞-格助詞", TagCategory.KAKUJOSHI),
+        ("助詞-準体助詞", TagCategory.JUNTAIJOSHI),
+        ("空白", TagCategory.OTHER),
+    ],
+)
+def test_spacy_katsuyo_text_source_detector_classify_tag(tag, category):
+    assert SpacyKatsuyoTextSourceDetector.classify_tag(tag) is category
+    assert SpacyKatsuyoTextSourceDetector.dump_tag_categories()[tag] == category.name
+
+
+def test_spacy_katsuyo_text_source_detector_detect_doc(nlp_ja):
+    detector = SpacyKatsuyoTextSourceDetector()
+    doc = nlp_ja("猫が歩く。猫が歩かなかったです。田中さんばかり走らせられたかしら。")
+    expected = [SpacyKatsuyoTextSourceDetector().try_detect(token) for token in doc]
+    assert detector.detect_doc(doc) == expected
+    assert detector.detect_doc(nlp_ja("")) == []
+
+
+def test_get_conjugation(nlp_ja):
+    doc = nlp_ja("雨が降りそうだ。雨が降りそうだ。")
+    assert get_conjugation(doc[0]) == (None, None)
+    assert get_conjugation(doc[2]) == ("五段-ラ行", "連用形-一般")
+    # 同じMorphAnalysisは分割済みの結果を共有する
+    assert get_conjugation(doc[2]) is get_conjugation(doc[8])
+    for token in doc:
+        assert get_conjugation_by_key(
+            token.morph.key, doc.vocab.strings
+        ) == get_conjugation(token)
@@ -0,0 +1,52 @@
+from katsuyo_text.spacy_parse_cache import ParseCache
+
+TEXTS = ["公園へ 行きました。綺麗です。", "猫が歩く", "家に帰りました"]
+
+
+def test_parse_cache_pipe(nlp_ja, tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    with ParseCache(path, nlp_ja) as cache:
+        docs = list(cache.pipe(TEXTS))
+        assert [doc.text for doc in docs] == TEXTS
+        assert (cache.hits, cache.misses) == (0, 3)
+        # 保存済みのtextと保存されていないtextが混在しても、入力の順に返却する
+        texts = ["猫が歩く", "犬が走る", "公園へ 行きました。綺麗です。"]
+        docs = list(cache.pipe(texts))
+        assert [doc.text for doc in docs] == texts
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert len(cache) == 4
+
+    # ファイルに保存した解析結果を参照する
+    with ParseCache(path, nlp_ja) as cache:
+        doc = cache(TEXTS[0])
+        assert (cache.hits, cache.misses) == (1, 0)
+        expected = nlp_ja(TEXTS[0])
+        assert [str(sent) for sent in doc.sents] == [
+            str(sent) for sent in expected.sents
+        ]
+        assert [(t.tag_, t.pos_, t.lemma_, t.norm_, t.morph.key) for t in doc] == [
+            (t.tag_, t.pos_, t.lemma_, t.norm_, t.morph.key) for t in expected
+        ]
+
+
+def test_parse_cache_eviction(nlp_ja, tmp_path):
+    with ParseCache(tmp_path / "cache.sqlite3", nlp_ja, max_entries=2) as cache:
+        list(cache.pipe(TEXTS[:2], batch_size=1))
+        # 参照したtextは削除されにくい
+        cache(TEXTS[0])
+        cache(TEXTS[2])
+        assert len(cache) == 2
+        cache.hits = cache.misses = 0
+        list(cache.pipe([TEXTS[0], TEXTS[2]]))
+        assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_parse_cache_model_version(nlp_ja, tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    with ParseCache(path, nlp_ja, model_version="v1") as cache:
+        list(cache.pipe(TEXTS))
+    with ParseCache(path, nlp_ja, model_version="v1") as cache:
+        assert len(cache) == 3
+    # model_versionが異なる場合は保存済みの解析結果を用いない
+    with ParseCache(path, nlp_ja, model_version="v2") as cache:
+        assert len(cache) == 0
@@ -1,10 +1,25 @@
 import pytest
+import spacy
 from katsuyo_text.katsuyo_text_helper import (
     Ukemi,
     Teinei,
     Dantei,
     DanteiTeinei,
 )
+from katsuyo_text.katsuyo_text import (
+    KatsuyoTextError,
+)
+from katsuyo_text.sentence_converter import (
+    ISentenceConverter,
+    TextEdit,
+    apply_edits,
+)
+from katsuyo_text.spacy_doc_archive import (
+    save_docs,
+)
+from katsuyo_text.spacy_parse_cache import (
+    ParseCache,
+)
 from katsuyo_text.spacy_sentence_converter import (
     SpacySentenceConverter,
 )
@@ -157,3 +172,179 @@ def test_convert_contextual(nlp_ja, msg, sentence, convertions_dict, expected):
     converter = SpacySentenceConverter(convertions_dict)
     result = converter.convert(sent)
     assert str(result) == expected, msg
+
+
+def test_convert_texts(nlp_ja):
+    converter = SpacySentenceConverter({Teinei(): None})
+    texts = ["公園へ行きました。家に帰りました。", "　ます", "すみません"]
+    results = list(converter.convert_texts(texts, nlp_ja, batch_size=2))
+    assert [text for text, _ in results] == ["公園へ行った。家に帰った。", None, "すまない"]
+    # 変換できないtextはエラーを返却し、後続のtextの変換を続ける
+    _, error = results[1]
+    assert error is not None
+    assert error.message.startswith("Unsupported token: ")
+
+
+def test_convert_texts_prefilter(nlp_ja):
+    converter = SpacySentenceConverter({Teinei(): None, DanteiTeinei(): Dantei()})
+    texts = ["猫が歩く", "公園へ 行きました", "a b c", "綺麗です", "犬が走る。"]
+    results = list(converter.convert_texts(texts, nlp_ja))
+    assert results == [
+        ("猫が歩く", None),
+        ("公園へ 行った", None),
+        ("a b c", None),
+        ("綺麗だ", None),
+        ("犬が走る。", None),
+    ]
+    # 「ま」「で」「す」「しょ」を含まないtextは解析しない
+    assert converter.parsed == 2
+    assert converter.skipped == 3
+    # 解析した場合と同じ結果となる
+    for text in ["猫が歩く", "a b c"]:
+        assert converter.try_convert_doc(nlp_ja(text)) == (text, None)
+
+
+def test_convert_doc_edits(nlp_ja):
+    converter = SpacySentenceConverter({Teinei(): None})
+    text = "公園へ 行きました。猫が歩く。家に帰りました。"
+    edits, error = converter.try_convert_doc_edits(nlp_ja(text))
+    assert error is None
+    assert edits == [
+        TextEdit(4, 9, "行った"),
+        TextEdit(17, 22, "帰った"),
+    ]
+    assert apply_edits(text, edits) == "公園へ 行った。猫が歩く。家に帰った。"
+    assert converter.try_convert_doc(nlp_ja(text)) == (apply_edits(text, edits), None)
+
+
+def test_convert_doc_many(nlp_ja):
+    convertions_dicts = [
+        {Teinei(): None},
+        {Teinei(): Dantei()},
+        {Ukemi(): None, DanteiTeinei(): Dantei()},
+    ]
+    converter = SpacySentenceConverter(convertions_dicts[0])
+    doc = nlp_ja("公園へ行かれました。綺麗です。")
+    results = converter.try_convert_doc_many(doc, convertions_dicts)
+    # convertions_dictごとにSpacySentenceConverterを作成した場合と同じ結果となる
+    assert results == [
+        SpacySentenceConverter(convertions_dict).try_convert_doc(doc)
+        for convertions_dict in convertions_dicts
+    ]
+    assert [text for text, _ in results] == [
+        "公園へ行かれた。綺麗です。",
+        "公園へ行かれるのだった。綺麗です。",
+        "公園へ行きました。綺麗だ。",
+    ]
+
+
+def test_convert_docbins(nlp_ja, tmp_path):
+    texts = ["公園へ 行きました。綺麗です。", "猫が歩く", "　ます"]
+    paths = save_docs(nlp_ja.pipe(texts), tmp_path, shard_size=2)
+    converter = SpacySentenceConverter({Teinei(): None, DanteiTeinei(): Dantei()})
+    results = list(converter.convert_docbins(paths, nlp_ja.vocab))
+    # DocBinのDocは解析しないため、解析数に含めない
+    assert (converter.parsed, converter.skipped) == (0, 0)
+    # 解析し直した場合と同じ結果となる
+    assert [text for text, _ in results] == [
+        text for text, _ in converter.convert_texts(texts, nlp_ja)
+    ]
+    assert [text for text, _ in results] == ["公園へ 行った。綺麗だ。", "猫が歩く", None]
+
+
+def test_convert_texts_cache(nlp_ja, tmp_path):
+    texts = ["公園へ行きました", "猫が歩く", "公園へ行きました", "綺麗です"]
+    expected = ["公園へ行った", "猫が歩く", "公園へ行った", "綺麗だ"]
+    convertions_dict = {Teinei(): None, DanteiTeinei(): Dantei()}
+    with ParseCache(tmp_path / "cache.sqlite3", nlp_ja) as cache:
+        converter = SpacySentenceConverter(convertions_dict, result_cache_maxsize=1)
+        results = list(converter.convert_texts(texts, cache, batch_size=1))
+        assert [text for text, _ in results] == expected
+        # 2件目の「公園へ行きました」は変換結果を参照し、解析しない
+        assert (converter.result_hits, converter.result_misses) == (1, 3)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        # 変換結果を保持していなくとも、保存した解析結果を参照する
+        converter = SpacySentenceConverter(convertions_dict)
+        results = list(converter.convert_texts(texts, cache))
+        assert [text for text, _ in results] == expected
+        assert (cache.hits, cache.misses) == (3, 2)
+        assert converter.try_convert_text(texts[0], cache) == (expected[0], None)
+
+
+def test_convert_texts_cache_duplicates(nlp_ja, tmp_path):
+    texts = ["公園へ行きました", "綺麗です", "公園へ行きました", "　ます", "　ます"]
+    convertions_dict = {Teinei(): None, DanteiTeinei(): Dantei()}
+    expected = SpacySentenceConverter(convertions_dict).convert_texts(texts, nlp_ja)
+    with ParseCache(tmp_path / "cache.sqlite3", nlp_ja) as cache:
+        converter = SpacySentenceConverter(convertions_dict, result_cache_maxsize=10)
+        results = list(converter.convert_texts(texts, cache))
+        assert [text for text, _ in results] == [text for text, _ in expected]
+        assert [text for text, _ in results] == [
+            "公園へ行った",
+            "綺麗だ",
+            "公園へ行った",
+            None,
+            None,
+        ]
+        # 解析中のtextと同じtextは重ねて解析しない
+        assert cache.misses == 3
+
+
+def test_convert_texts_cache_error(nlp_ja):
+    convertions_dict = {Teinei(): None, DanteiTeinei(): Dantei()}
+    converter = SpacySentenceConverter(convertions_dict, result_cache_maxsize=10)
+    _, expected = SpacySentenceConverter(convertions_dict).try_convert_text(
+        "　ます", nlp_ja
+    )
+    assert expected is not None
+    for _ in range(2):
+        result, error = converter.try_convert_text("　ます", nlp_ja)
+        assert result is None
+        assert error is not None
+        assert error.message == expected.message
+    assert (converter.result_hits, converter.result_misses) == (1, 1)
+    # 保持した変換結果は、SpanやDocを参照しない
+    _, cached = converter._results["　ます"]
+    assert cached is not None
+    assert not any(
+        isinstance(arg, (spacy.tokens.Span, spacy.tokens.Doc)) for arg in cached._args
+    )
+
+
+def test_convert_timed(nlp_ja):
+    converter = SpacySentenceConverter({Teinei(): None})
+    doc = nlp_ja("公園へ行きました。")
+    with converter.timed() as timer:
+        assert converter.try_convert_doc(doc) == ("公園へ行った。", None)
+    snapshot = timer.snapshot()
+    # 「公園」「へ」「行き」「まし」「た」「。」のうち、先頭を除いて検出する
+    assert snapshot["detect_appendant"].calls == 5
+    assert snapshot["detect_source"].calls == 1
+    assert snapshot["merge"].calls == 1
+    assert snapshot["bridge"].calls == 1
+    assert snapshot["emit"].calls == 1
+    assert snapshot["assemble"].calls == 1
+    assert all(stats.ns > 0 for stats in snapshot.values())
+
+    # withを抜けると計測しない
+    converter.try_convert_doc(doc)
+    assert timer.snapshot() == snapshot
+    assert "_detect_appendant" in converter.__dict__
+    assert "try_emit_edits" not in converter.__dict__
+
+
+def test_sentence_converter_convert_only():
+    # convertのみを実装したサブクラスでもtry_convertを呼び出せる
+    class UpperConverter(ISentenceConverter):
+        def convert(self, sent):
+            if not sent:
+                raise KatsuyoTextError("Empty sentence")
+            return sent.upper()
+
+    converter = UpperConverter({})
+    assert converter.try_convert("abc") == ("ABC", None)
+    result, error = converter.try_convert("")
+    assert result is None
+    assert error.message == "Empty sentence"
+    assert isinstance(error.to_error(), KatsuyoTextError)
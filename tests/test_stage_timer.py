@@ -0,0 +1,31 @@
+from katsuyo_text.stage_timer import StageStats, StageTimer
+
+
+def test_stage_timer():
+    timer = StageTimer()
+    add = timer.wrap("add", lambda x, y: x + y)
+    assert add(1, 2) == 3
+    assert add(3, y=4) == 7
+    snapshot = timer.snapshot()
+    assert list(snapshot) == ["add"]
+    assert snapshot["add"].calls == 2
+    assert snapshot["add"].ns >= 0
+
+    timer.reset()
+    assert timer.snapshot() == {}
+    # reset後もwrapした関数で計測を続ける
+    add(5, 6)
+    assert timer.snapshot()["add"].calls == 1
+
+
+def test_stage_timer_error():
+    timer = StageTimer()
+
+    def fail():
+        raise ValueError()
+
+    try:
+        timer.wrap("fail", fail)()
+    except ValueError:
+        pass
+    assert timer.snapshot() == {"fail": StageStats(timer.snapshot()["fail"].ns, 1)}